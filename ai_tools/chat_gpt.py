@@ -1,9 +1,9 @@
 import os
 from openai import OpenAI
+from utils import json_codec
 from utils.logger import logger
 from utils.read_write import read_text_file, write_json_file
 import re
-import json
 from config import Config
 
 class AIInterpreter:
@@ -30,8 +30,8 @@ class AIInterpreter:
 
         # Validate it
         try:
-            parsed = json.loads(json_str)
-        except json.JSONDecodeError as e:
+            parsed = json_codec.loads(json_str)
+        except json_codec.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
 
         return parsed
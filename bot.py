@@ -6,6 +6,17 @@ from news_pdf.pdf_report_generator import PdfReportGenerator
 from discord_utils.send_pdf import send_pdf
 from config import Config
 from scheduler_v2 import DiscordScheduler, TaskDefinitions
+from utils.http_session import close_all_http_sessions
+from utils.resilience import get_health_registry
+from news_pdf.browser_pool import get_browser_pool
+
+
+class StockNewsBot(commands.Bot):
+    """Bot that releases shared resources (scheduler, HTTP pools) when it closes"""
+
+    async def close(self):
+        await cleanup()
+        await super().close()
 
 
 # Set up bot with intents
@@ -13,7 +24,7 @@ intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 intents.messages = True
-bot = commands.Bot(command_prefix="!", intents=intents)
+bot = StockNewsBot(command_prefix="!", intents=intents)
 
 # Initialize new scheduler components
 discord_scheduler = None
@@ -48,6 +59,14 @@ async def on_ready():
         discord_scheduler = DiscordScheduler(bot, Config.CHANNEL_IDS.PYTHON_BOT, Config.CHANNEL_IDS.DEV)
         task_definitions = TaskDefinitions(discord_scheduler)
         
+        # Report upstream circuit breaker transitions to the dev channel (on_ready runs again on reconnects)
+        get_health_registry().subscribe(send_breaker_alert)
+
+        # Start the PDF browser now so the first report doesn't pay the cold start (not again on reconnects)
+        browser_pool = get_browser_pool()
+        if not browser_pool.is_running:
+            await browser_pool.warmup()
+        
         logger.info("✅ Scheduler components initialized successfully!")
         
         # Setup all tasks
@@ -77,6 +96,12 @@ async def on_ready():
             )
 
 
+async def send_breaker_alert(breaker, old_state, new_state):
+    """Health registry subscriber - forward breaker transitions to the current scheduler"""
+    if discord_scheduler:
+        await discord_scheduler.send_breaker_alert(breaker, old_state, new_state)
+
+
 async def load_cogs():
     """Load all command cogs"""
     cogs = [
@@ -86,7 +111,8 @@ async def load_cogs():
         "cogs.slash.test",
         "cogs.text.greet",
         "cogs.admin.export",
-        "cogs.admin.clean_messages"
+        "cogs.admin.clean_messages",
+        "cogs.admin.status"
     ]
     
     loaded_cogs = []
@@ -102,7 +128,7 @@ async def load_cogs():
     return loaded_cogs
 
 async def cleanup():
-    """Cleanup function to stop scheduler gracefully"""
+    """Cleanup function to stop scheduler and close shared HTTP sessions and the browser pool gracefully"""
     try:
         if discord_scheduler:
             discord_scheduler.stop()
@@ -110,6 +136,16 @@ async def cleanup():
     except Exception as e:
         logger.error(f"❌ Error stopping scheduler: {e}")
 
+    try:
+        await close_all_http_sessions()
+    except Exception as e:
+        logger.error(f"❌ Error closing HTTP sessions: {e}")
+
+    try:
+        await get_browser_pool().close()
+    except Exception as e:
+        logger.error(f"❌ Error closing browser pool: {e}")
+
 def main():
     """Main entry point"""
     if not Config.TOKENS.DISCORD:
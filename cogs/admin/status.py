@@ -0,0 +1,14 @@
+import discord
+from discord.ext import commands
+from utils.health_report import format_health_report
+
+class StatusCommands(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+    
+    @commands.command(name="status", description="Show upstream circuit breakers and HTTP pool stats")
+    async def status(self, ctx):
+        await ctx.send(f"```\n{format_health_report()[:1900]}\n```")
+
+def setup(bot):
+    bot.add_cog(StatusCommands(bot))
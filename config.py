@@ -27,6 +27,8 @@ class Proxy(StrEnum):
     CUSTOMER_ID = os.getenv("PROXY_CUSTOMER_ID", "hl_9884942f")
     ZONE = os.getenv("PROXY_ZONE", "isp_proxy1")
     PASSWORD = os.getenv("PROXY_PASSWORD", "ky8psv0nqmev")
+    ENABLED = os.getenv("PROXY_ENABLED", "false")
+    SESSIONS = os.getenv("PROXY_SESSIONS", "4")
 
 class Timezones(StrEnum):
     EASTERN_US = "America/New_York"
@@ -58,7 +58,8 @@ class MessageHandler:
         filename += f"_{timestamp}.txt"
         return filename
     
-    async def read_channel_messages(self, channel_id: int, hours_back: int = 24, user_ids: list = None):
+    async def read_channel_messages(self, channel_id: int, hours_back: int = 24, user_ids: list = None,
+                                    after: datetime = None, before: datetime = None):
         """
         Read messages from a channel
         
@@ -66,6 +67,8 @@ class MessageHandler:
             channel_id (int): Discord channel ID
             hours_back (int): Number of hours to look back (default: 24)
             user_ids (list): List of user IDs to filter by (default: None - all users)
+            after (datetime): Read messages after this time instead of the last hours_back hours
+            before (datetime): Read messages before this time (default: up to now)
         
         Returns:
             tuple: (messages_list, channel_name) or ([], None) if failed
@@ -77,12 +80,12 @@ class MessageHandler:
                 return [], None
             
             # Calculate the time threshold
-            threshold_time = datetime.now(timezone.utc) - timedelta(hours=hours_back)
+            threshold_time = after or datetime.now(timezone.utc) - timedelta(hours=hours_back)
             
             # Read messages
             messages_list = []
             
-            async for message in channel.history(limit=None, after=threshold_time):
+            async for message in channel.history(limit=None, after=threshold_time, before=before):
                 # Filter by user if user_ids is provided
                 if user_ids and message.author.id not in user_ids:
                     continue
@@ -1,3 +1,4 @@
+import asyncio
 from utils.logger import logger
 from discord_utils.message_handler import get_message_handler
 from ai_tools.chat_gpt import AIInterpreter
@@ -8,10 +9,18 @@ from datetime import datetime
 
 
 
-async def process_news_to_list(discord_bot: discord.Client, hours_back: int = 24, news_channel_id: int = Config.CHANNEL_IDS.TWEETER_NEWS, list_of_users: list = [Config.USER_IDS.IFITT_BOT]):
+NEWS_SUMMARY_PROMPT = "ai_tools/prompts/news_summary_hebrew.txt"
+# for the few messages posted since a draft report, appended to its news
+NEWS_UPDATE_PROMPT = "ai_tools/prompts/news_update_hebrew.txt"
+
+
+async def process_news_to_list(discord_bot: discord.Client, hours_back: int = 24, news_channel_id: int = Config.CHANNEL_IDS.TWEETER_NEWS, list_of_users: list = [Config.USER_IDS.IFITT_BOT],
+                               after: datetime = None, before: datetime = None, prompt_file: str = NEWS_SUMMARY_PROMPT):
     """
     Complete pipeline to process news messages and send PDF report to Discord.
     Handles: message export → AI processing → PDF generation → Discord sending
+    
+    `after`/`before` read a time window instead of the last `hours_back` hours.
     """
     def _analyze_news_to_list(messages: str) -> list[dict]:
         """
@@ -26,7 +35,7 @@ async def process_news_to_list(discord_bot: discord.Client, hours_back: int = 24
         """
         try:
             ai_interpreter = AIInterpreter()
-            news_summary_prompt = read_text_file("ai_tools/prompts/news_summary_hebrew.txt") + "\n".join(messages)
+            news_summary_prompt = read_text_file(prompt_file) + "\n".join(messages)
             response = ai_interpreter.get_json_response(news_summary_prompt)
             return response
         except Exception as e:
@@ -35,7 +44,7 @@ async def process_news_to_list(discord_bot: discord.Client, hours_back: int = 24
         
     try:
         message_handler = get_message_handler(discord_bot)
-        messages_list, _ = await message_handler.read_channel_messages(news_channel_id, hours_back, list_of_users)
+        messages_list, _ = await message_handler.read_channel_messages(news_channel_id, hours_back, list_of_users, after, before)
         
         if not messages_list:
             logger.warning("No messages found to process")
@@ -46,7 +55,8 @@ async def process_news_to_list(discord_bot: discord.Client, hours_back: int = 24
         for msg in messages_list:
             messages_text.append(f"[{msg['timestamp']}] {msg['author']}: {msg['content']}")
         
-        news_list = _analyze_news_to_list(messages_text)
+        # the OpenAI client is blocking, keep the event loop (and the other report stages) running
+        news_list = await asyncio.to_thread(_analyze_news_to_list, messages_text)
         return news_list
     except Exception as e:
         logger.error(f"❌ Error processing messages with AI: {e}")
@@ -0,0 +1,146 @@
+"""
+News report as Discord embeds.
+
+The fast path of the news reports publishes the report data as embeds as soon
+as it is gathered, the PDF is attached to the same message once rendered.
+"""
+
+import io
+import discord
+from utils.logger import logger
+
+
+# Discord limits
+EMBED_FIELDS_LIMIT = 25
+MESSAGE_EMBEDS_LIMIT = 10
+MESSAGE_EMBED_CHARS_LIMIT = 6000
+
+THEME_COLORS = {"morning": 0xf5a623, "evening": 0x2c3e70}
+THEME_ICONS = {"morning": "☀️", "evening": "🌙"}
+# news characters per page: two pages fit the 6000 characters of a message
+PAGE_CHARS = 2900
+
+
+def _news_line(item: dict) -> str:
+    message = " ".join(str(item.get("message") or "").split())
+    news_time = item.get("time")
+    link = item.get("link")
+    line = f"**{news_time}** {message}" if news_time else message
+    if link and link != "#":
+        line += f" [מקור]({link})"
+    return line[:PAGE_CHARS]
+
+
+def build_price_embed(prices_data: list, theme: str, title: str) -> discord.Embed:
+    """Price summary embed, one inline field per symbol"""
+    embed = discord.Embed(title=f"{THEME_ICONS.get(theme, '📰')} {title}", color=THEME_COLORS.get(theme, 0x00ff00))
+    for symbol in (prices_data or [])[:EMBED_FIELDS_LIMIT]:
+        is_positive = symbol.get("isPositive", True)
+        change = f"{symbol.get('changeAmount') or '0.00'} ({str(symbol.get('changePercent') or '0.00%').strip('()')})"
+        embed.add_field(
+            name=f"{'🟢' if is_positive else '🔴'} {symbol.get('ticker') or 'N/A'}",
+            value=f"{symbol.get('price') or 'N/A'}\n{change}",
+            inline=True
+        )
+    if not prices_data:
+        embed.description = "No market data available"
+    return embed
+
+
+def build_news_embeds(news_data: list, theme: str) -> list[discord.Embed]:
+    """News items split into pages that fit an embed description"""
+    pages = [[]]
+    page_length = 0
+    for item in news_data or []:
+        if not isinstance(item, dict):
+            continue
+        line = _news_line(item)
+        if pages[-1] and page_length + len(line) + 2 > PAGE_CHARS:
+            pages.append([])
+            page_length = 0
+        pages[-1].append(line)
+        page_length += len(line) + 2
+
+    pages = [page for page in pages if page]
+    embeds = []
+    for number, page in enumerate(pages, 1):
+        embed = discord.Embed(description="\n\n".join(page), color=THEME_COLORS.get(theme, 0x00ff00))
+        embed.set_footer(text=f"📰 {number}/{len(pages)}")
+        embeds.append(embed)
+    return embeds
+
+
+def build_report_embeds(news_data: list, prices_data: list, theme: str, title: str) -> list[discord.Embed]:
+    """
+    Build the embeds of a news report
+
+    Args:
+        news_data (list): News items
+        prices_data (list): Price symbol data
+        theme (str): 'morning' or 'evening'
+        title (str): Report title
+
+    Returns:
+        list[discord.Embed]: Price summary embed followed by the news pages
+    """
+    return [build_price_embed(prices_data, theme, title)] + build_news_embeds(news_data, theme)
+
+
+def group_embeds(embeds: list[discord.Embed]) -> list[list[discord.Embed]]:
+    """Split embeds into messages within the per-message embed count and size limits"""
+    messages = [[]]
+    message_chars = 0
+    for embed in embeds:
+        chars = len(embed)
+        if messages[-1] and (len(messages[-1]) >= MESSAGE_EMBEDS_LIMIT
+                             or message_chars + chars > MESSAGE_EMBED_CHARS_LIMIT):
+            messages.append([])
+            message_chars = 0
+        messages[-1].append(embed)
+        message_chars += chars
+    return messages
+
+
+async def send_report_embeds(channel, content: str, embeds: list[discord.Embed]) -> list[discord.Message]:
+    """
+    Send the report embeds, as many messages as the Discord limits require
+
+    Args:
+        channel: Channel to send to
+        content (str): Text of the first message
+        embeds (list[discord.Embed]): Report embeds
+
+    Returns:
+        list[discord.Message]: Sent messages (the first one gets the PDF), empty if failed
+    """
+    messages = []
+    try:
+        for index, group in enumerate(group_embeds(embeds)):
+            messages.append(await channel.send(content=content if index == 0 else None, embeds=group))
+        logger.info(f"✅ Report published as {len(embeds)} embeds in {len(messages)} messages")
+    except Exception as e:
+        logger.error(f"❌ Failed to send report embeds: {e}")
+    return messages
+
+
+async def attach_pdf(message: discord.Message, pdf_bytes: bytes, filename: str, content: str = None) -> discord.Message:
+    """
+    Attach a PDF to an already sent message
+
+    Args:
+        message (discord.Message): Message to attach the PDF to
+        pdf_bytes (bytes): The PDF
+        filename (str): File name shown on Discord
+        content (str): New text of the message (unchanged if None)
+
+    Returns:
+        discord.Message: The edited message, or None if failed
+    """
+    try:
+        file = discord.File(io.BytesIO(pdf_bytes), filename=filename)
+        edited = await (message.edit(content=content, file=file) if content is not None else message.edit(file=file))
+        logger.info("✅ PDF report attached to the published report")
+        return edited
+    except Exception as e:
+        logger.error(f"❌ Failed to attach PDF to the report message: {e}")
+        return None
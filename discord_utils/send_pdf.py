@@ -4,17 +4,19 @@ from utils.logger import logger
 
 
 async def send_pdf(bot: discord.Client, channel_id: int, input_file_path: str, message: str, filename_on_discord: str):
+    """Send a PDF file to a channel, returns the sent message (None if it failed)"""
     channel = bot.get_channel(channel_id)
     
     if channel:
         try:
             # Send the PDF file
             with open(input_file_path, "rb") as pdf_file:
-                await channel.send(
+                sent_message = await channel.send(
                     content=message,
                     file=discord.File(pdf_file, filename=filename_on_discord)
                 )
             logger.info("✅ PDF report sent to Discord channel successfully")
+            return sent_message
         except Exception as e:
             logger.error(f"❌ Failed to send PDF to Discord channel: {e}")
             # Send a fallback message if PDF sending fails
@@ -1,145 +1,131 @@
 import requests
-import aiohttp
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from utils.logger import logger
-import os
-import pandas as pd
 import pytz
 from config import Config
-from utils.read_write import read_json_file
 from utils.safe_update_dict import safe_update_dict
-import json
+from utils import json_codec
 from investing_scraper.investing_variables import InvestingVariables
-from utils.read_write import write_json_file
+from utils.http_session import PooledHttpSession, get_http_session
+from utils.proxy_pool import get_proxy_pool
+from utils.single_flight import SingleFlight, freeze_key
+from investing_scraper.scrape_plans import ScrapePlanRegistry, get_scrape_plan_registry
+from investing_scraper.table_parsers import get_table_parser
+from investing_scraper.calendar_store import CalendarStore, get_calendar_store
+from utils.resilience import RETRY_STATUSES, CircuitOpenError, HealthRegistry, UpstreamStatusError, get_health_registry
 import asyncio
+from urllib.parse import urlparse
 
 
 class InvestingDataScraper:
-    def __init__(self):
-        self.headers = read_json_file(f'investing_scraper/headers.json')
+    def __init__(self, http_session: PooledHttpSession = None, scrape_plans: ScrapePlanRegistry = None, parser_engine: str = None, cache_ttl: float = 10, calendar_store: CalendarStore = None, health_registry: HealthRegistry = None):
+        # json configs are loaded and compiled once, and reloaded only when they change
+        self.scrape_plans = scrape_plans or get_scrape_plan_registry()
+        # lxml when installed, bs4 is the reference engine
+        self.table_parser = get_table_parser(parser_engine)
+        # shared keep-alive pool, investing.com blocks bursts so keep few connections per host
+        self.http_session = http_session or get_http_session("investing", limit_per_host=4, proxy_pool=get_proxy_pool())
+        self.single_flight = SingleFlight("investing", ttl=cache_ttl)
+        self.calendar_store = calendar_store or get_calendar_store()
+        # retries with jittered backoff behind a per-host circuit breaker
+        self.health = health_registry or get_health_registry()
         logger.debug(f"Initialized investing scraper")
-    
-    @staticmethod
-    def get_element_attirbutes(soup_element, attributes):
-        for attribute in attributes:
-            if attribute == "text":
-                value = soup_element.text.strip()
-            else:
-                value = soup_element.get(attribute)
-            if value:
-                return value
-        return None
 
+    @property
+    def headers(self) -> dict:
+        return self.scrape_plans.get_headers()
 
-    async def _fetch_table(self, page_name, payload: dict ):
-        """Fetch and parse the webpage asynchronously"""
+
+    async def _fetch_json(self, page_name, payload: dict ):
+        """Fetch a calendar page asynchronously, returns the whole json response"""
         logger.debug(f"Fetching table data for {page_name}")
-        request_json = read_json_file(f'investing_scraper/requests_json/{page_name}.json')
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.post(request_json['url'], headers=self.headers, data=payload) as response:
+        plan = self.scrape_plans.get_plan(page_name)
+        host = urlparse(plan.url).hostname
+
+        async def attempt():
+            async with self.http_session.request(plan.method, plan.url, headers=self.headers, data=payload) as response:
                 # logger.debug(f"Request body: {payload}")
+                if response.status in RETRY_STATUSES:
+                    raise UpstreamStatusError(response.status, host)
                 if response.status != 200:
                     logger.error(f"Failed to fetch page. Status code: {response.status}")
                     return None
                 try:
-                    json_response = await response.read()
-                    table_html = json.loads(json_response).get("data", '') 
-                    return table_html
+                    # parsed straight from the body bytes, no intermediate str
+                    return json_codec.loads(await response.read())
                 except Exception as e:
                     logger.error(f"Error parsing JSON: {str(e)}")
-                    return None 
+                    return None
 
+        try:
+            return await self.health.call(host, attempt)
+        except CircuitOpenError as e:
+            logger.warning(f"⚠️ Skipping {page_name}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to fetch page {page_name}: {e}")
+            return None
 
-    def _process_table_data(self, page_name, table_html):
-        """Process all rows in the table"""
-        table_structure = read_json_file(f'investing_scraper/tables_stucture.json')[page_name]
-        table_selectors = table_structure["table_selectors"]
-
-        def proccess_tr(tr, table_selectors):
-            """Extract data from a single row"""
-            row_data = {}
-            for item_name, selector in table_selectors.items():
-                if item_name == "date":
-                    continue
-                try:
-                    data_element = tr.select_one(selector["selector"])
-                    if data_element:
-                        row_data[item_name] = self.get_element_attirbutes(data_element, selector["attribute"])
-                except Exception as e:
-                    logger.error(f"Error processing {item_name}: {str(e)}")
-            return row_data
-        
-        table_soup = BeautifulSoup(table_html, 'html.parser')   
-        all_rows = table_soup.find_all('tr')
+    async def _fetch_table(self, page_name, payload: dict ):
+        """Fetch a calendar page asynchronously, returns the table html"""
+        json_response = await self._fetch_json(page_name, payload)
+        if json_response is None:
+            return None
+        return json_response.get("data", '')
 
-        events_by_date = {}
-        current_events = []
-        current_date = "unknown"
-        
-        for row in all_rows:
-            date_element = row.select_one(table_selectors['date']['selector'])
-            new_date = self.get_element_attirbutes(date_element, table_selectors['date']['attribute']) if date_element else None
-
-
-            # add the previous events to the matching date
-            if new_date:
-                if current_events:
-                    events_by_date[current_date] = current_events
-                    current_events = []
-                current_date = new_date
-                
-            # extract the events if if not a date tr, or if the date is inline
-            if not new_date or table_structure["is_date_inline"]:
-                proccessed_row = proccess_tr(row, table_selectors)
-                if proccessed_row:
-                    current_events.append(proccessed_row)
-        
-        if current_events:
-            events_by_date[current_date] = current_events
-        
-        return events_by_date
-    
 
+    def _process_table_data(self, page_name, table_html):
+        """Process all rows in the table"""
+        plan = self.scrape_plans.get_plan(page_name)
+        return self.table_parser.parse(plan, table_html)
 
 
     def flatten_data(self, data):
+        # copy the events, the parsed data may be shared with other callers
         flat_data = []
         for date, events in data.items():
             for event in events:
-                event['date'] = date
-                flat_data.append(event)
+                flat_data.append({**event, 'date': date})
         return flat_data
 
-    def _save_data(self, file_name, data):
-        output_dir = os.path.join("data", "investing_scraper")
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        df = pd.DataFrame(data)
-        df.to_csv(os.path.join(output_dir, f"{file_name}.csv"), index=False)
+    async def _save_data(self, page_name, data):
+        """Upsert the events into the calendar store (in a worker thread, off the event loop)"""
+        try:
+            saved = await self.calendar_store.aupsert(page_name, data)
+            logger.debug(f"Saved {saved} {page_name} events to the calendar store")
+        except Exception as e:
+            logger.error(f"❌ Error saving {page_name} events: {e}")
 
 
 
 
 
     
-    async def run(self, page_name, payload: dict, save_data: bool = False):
+    async def _fetch_events(self, page_name, payload: dict, save_data: bool = False):
+        """Fetch and parse a calendar page, returns events grouped by date"""
         table_html = await self._fetch_table(page_name, payload)
         if not table_html:
             logger.error(f"Failed to fetch table data for {page_name}")
             return None
         events_by_dates = self._process_table_data(page_name, table_html)
-        write_json_file(f"data/investing_scraper/temp.json", events_by_dates)
+        # saved by the call that fetched, memoized and shared results are not saved again
+        if save_data and events_by_dates:
+            await self._save_data(page_name, self.flatten_data(events_by_dates))
+        return events_by_dates
+
+    async def run(self, page_name, payload: dict, save_data: bool = False):
+        # identical concurrent calls share one request, and results are memoized for cache_ttl
+        events_by_dates = await self.single_flight.do(
+            (page_name, freeze_key(payload), save_data),
+            lambda: self._fetch_events(page_name, payload, save_data)
+        )
+        if events_by_dates is None:
+            return None
         if events_by_dates == {}:
             logger.error(f"No events found for {page_name}")
             return 
         
-        flat_data = self.flatten_data(events_by_dates)
-        if save_data:
-            self._save_data(f"{page_name}_{datetime.now().strftime('%Y-%m-%d')}", flat_data)
-
-        return flat_data
+        return self.flatten_data(events_by_dates)
     
 
         
@@ -154,6 +140,18 @@ class InvestingDataScraper:
             date_to: str = None, 
             save_data: bool = False):
         
+        payload = self.build_payload(current_tab, importance, countries, time_zone, date_from, date_to)
+        return await self.run(calendar_name, payload, save_data)
+
+    @staticmethod
+    def build_payload(
+            current_tab: str=InvestingVariables.TIME_RANGES.TODAY, 
+            importance: list[str]=[InvestingVariables.IMPORTANCE.LOW, InvestingVariables.IMPORTANCE.MEDIUM, InvestingVariables.IMPORTANCE.HIGH], 
+            countries: list[str]=[InvestingVariables.COUNTRIES.UNITED_STATES], 
+            time_zone: str=pytz.timezone(Config.TIMEZONES.APP_TIMEZONE), 
+            date_from: str = None, 
+            date_to: str = None) -> dict:
+        """Build the calendar request payload"""
         payload = {
             "currentTab": current_tab,
             "importance[]": importance,
@@ -164,7 +162,44 @@ class InvestingDataScraper:
             payload["dateFrom"] = date_from
         if date_to:
             payload["dateTo"] = date_to
-        return await self.run(calendar_name, payload, save_data)
+        return payload
+
+    def is_available(self) -> bool:
+        """Check whether investing.com requests currently pass the circuit breaker"""
+        return self.health.is_available(self.host)
+
+    def retry_after(self) -> float:
+        """Seconds until the investing.com circuit breaker lets requests through again"""
+        return self.health.retry_after(self.host)
+
+    @property
+    def host(self) -> str:
+        return urlparse(self.scrape_plans.get_plan(InvestingVariables.CALENDARS.ECONOMIC_CALENDAR).url).hostname
+
+    def get_pool_stats(self) -> dict:
+        """Get connection pool statistics of the shared HTTP session"""
+        return self.http_session.get_stats()
+
+    async def close(self):
+        """Close the HTTP session and its pooled connections"""
+        await self.http_session.close()
+
+
+# Global investing scraper instance
+_investing_scraper = None
+
+
+def get_investing_scraper():
+    """
+    Get or create the global investing scraper instance
+    
+    Returns:
+        InvestingDataScraper: Global investing scraper instance
+    """
+    global _investing_scraper
+    if _investing_scraper is None:
+        _investing_scraper = InvestingDataScraper()
+    return _investing_scraper
     
 
 if __name__ == "__main__":
@@ -178,4 +213,9 @@ if __name__ == "__main__":
             date_from="2025-07-01",
             date_to="2025-08-23",
             save_data=True))
-        print(f"count: {result}")
\ No newline at end of file
+        print(f"count: {result}")
+
+    stored = investing_scraper.calendar_store.query(
+        InvestingVariables.CALENDARS.HOLIDAY_CALENDAR, date_from="2025-07-01", date_to="2025-08-23"
+    )
+    print(f"stored: {len(stored)}")
\ No newline at end of file
@@ -0,0 +1,218 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+import pytz
+from config import Config
+from utils.logger import logger
+from investing_scraper.InvestingDataScraper import InvestingDataScraper, get_investing_scraper
+from investing_scraper.investing_variables import InvestingVariables
+from investing_scraper.calendar_tracker import index_events
+from investing_scraper.scrape_plans import get_scrape_plan_registry
+from investing_scraper.table_parsers import get_table_parser
+
+
+# Parser of the current (worker) process, created on first use
+_worker_table_parser = None
+
+
+def parse_table_html(page_name: str, table_html: str) -> dict:
+    """Parse one table page - module level so it can run in a process pool worker"""
+    global _worker_table_parser
+    if _worker_table_parser is None:
+        _worker_table_parser = get_table_parser()
+    plan = get_scrape_plan_registry().get_plan(page_name)
+    return _worker_table_parser.parse(plan, table_html)
+
+
+def split_date_range(date_from: str, date_to: str, window_days: int) -> list[tuple[str, str]]:
+    """
+    Split an inclusive date range into windows
+
+    Args:
+        date_from (str): First day, YYYY-MM-DD
+        date_to (str): Last day, YYYY-MM-DD
+        window_days (int): Days per window
+
+    Returns:
+        list[tuple[str, str]]: [(window_from, window_to), ...] as YYYY-MM-DD
+    """
+    start = date.fromisoformat(date_from)
+    end = date.fromisoformat(date_to)
+    if end < start:
+        raise ValueError(f"date_to {date_to} is before date_from {date_from}")
+
+    windows = []
+    while start <= end:
+        window_end = min(start + timedelta(days=window_days - 1), end)
+        windows.append((start.isoformat(), window_end.isoformat()))
+        start = window_end + timedelta(days=1)
+    return windows
+
+
+class CalendarBackfill:
+    """
+    Backfills calendars over long custom date ranges.
+
+    The range is split into windows that are fetched concurrently (bounded by a
+    semaphore), each window follows the limit_from pagination, pages are parsed in
+    a process pool and everything is merged into one dataset keyed like the tracker.
+    """
+
+    def __init__(self, scraper: InvestingDataScraper = None, window_days: int = 7, concurrency: int = 3,
+                 max_pages: int = 20, processes: int = None):
+        """
+        Initialize the backfill.
+
+        Args:
+            scraper (InvestingDataScraper): Scraper used to fetch pages (default: global scraper)
+            window_days (int): Days per request window
+            concurrency (int): Maximum number of windows fetched at the same time
+            max_pages (int): Maximum number of pages followed per window
+            processes (int): Parser process pool size (default: number of CPUs)
+        """
+        self.scraper = scraper or get_investing_scraper()
+        self.window_days = window_days
+        self.concurrency = concurrency
+        self.max_pages = max_pages
+        self.processes = processes
+        self._pool = None
+        # shared by every calendar of this backfill, investing.com blocks request bursts
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.processes)
+        return self._pool
+
+    async def _parse(self, page_name: str, table_html: str) -> dict:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), parse_table_html, page_name, table_html)
+
+    async def _fetch_window(self, calendar_name: str, payload: dict) -> list[str]:
+        """Fetch every page of one window, returns the table html of each page"""
+        pages = []
+        last_time_scope = None
+        async with self._semaphore:
+            for page_index in range(self.max_pages):
+                page_payload = dict(payload, limit_from=str(page_index))
+                if page_index and last_time_scope:
+                    page_payload["last_time_scope"] = last_time_scope
+
+                json_response = await self.scraper._fetch_json(calendar_name, page_payload)
+                if not json_response or not json_response.get("data"):
+                    break
+                pages.append(json_response["data"])
+
+                # investing.com keeps the infinite scroll handler bound while there are more rows
+                last_time_scope = json_response.get("last_time_scope")
+                if not json_response.get("bind_scroll_handler") or not json_response.get("rows_num"):
+                    break
+            else:
+                logger.warning(f"⚠️ {calendar_name} {payload.get('dateFrom')}: stopped after {self.max_pages} pages")
+        return pages
+
+    def _merge(self, calendar_name: str, parsed_windows: list[list[dict]]) -> dict:
+        """
+        Flatten the parsed pages in order and index them like the calendar tracker
+
+        Windows don't overlap and the date is part of the identity, so rows that
+        share an identity are distinct events (e.g. two same-name releases at the
+        same time) and are numbered by index_events instead of dropped.
+        """
+        rows = []
+        for parsed_pages in parsed_windows:
+            current_date = None
+            for events_by_date in parsed_pages:
+                for event_date, events in events_by_date.items():
+                    # a continuation page starts with rows of the previous page's last date
+                    if event_date == "unknown" and current_date:
+                        event_date = current_date
+                    current_date = event_date
+                    rows.extend({**event, "date": event_date} for event in events)
+        return index_events(calendar_name, rows)
+
+    async def backfill(
+            self,
+            calendar_name: str,
+            date_from: str,
+            date_to: str,
+            importance: list[str]=[InvestingVariables.IMPORTANCE.LOW, InvestingVariables.IMPORTANCE.MEDIUM, InvestingVariables.IMPORTANCE.HIGH],
+            countries: list[str]=[InvestingVariables.COUNTRIES.UNITED_STATES],
+            time_zone: str=pytz.timezone(Config.TIMEZONES.APP_TIMEZONE),
+            save_data: bool = True) -> list[dict]:
+        """
+        Backfill one calendar over a date range
+
+        Args:
+            calendar_name (str): Calendar name (see InvestingVariables.CALENDARS)
+            date_from (str): First day, YYYY-MM-DD
+            date_to (str): Last day, YYYY-MM-DD
+            importance (list[str]): Importance levels
+            countries (list[str]): Country ids
+            time_zone (str): Time zone of the event times
+            save_data (bool): Upsert the events into the calendar store
+
+        Returns:
+            list[dict]: Flat events
+        """
+        started = datetime.now()
+        windows = split_date_range(date_from, date_to, self.window_days)
+        logger.info(f"📥 Backfilling {calendar_name} {date_from} → {date_to} in {len(windows)} windows")
+
+        async def fetch_and_parse(window_from, window_to):
+            payload = self.scraper.build_payload(
+                InvestingVariables.TIME_RANGES.CUSTOM, importance, countries, time_zone, window_from, window_to
+            )
+            pages = await self._fetch_window(calendar_name, payload)
+            return await asyncio.gather(*[self._parse(calendar_name, page) for page in pages])
+
+        results = await asyncio.gather(
+            *[fetch_and_parse(window_from, window_to) for window_from, window_to in windows],
+            return_exceptions=True
+        )
+
+        parsed_windows = []
+        for (window_from, window_to), result in zip(windows, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Backfill window {window_from} → {window_to} of {calendar_name} failed: {result}")
+                continue
+            parsed_windows.append(result)
+
+        indexed_events = self._merge(calendar_name, parsed_windows)
+        events = list(indexed_events.values())
+        if save_data and events:
+            await self.scraper._save_data(calendar_name, indexed_events)
+        elapsed = (datetime.now() - started).total_seconds()
+        logger.info(f"✅ Backfilled {len(events)} {calendar_name} events in {elapsed:.1f}s")
+        return events
+
+    async def backfill_all(self, date_from: str, date_to: str, calendars: list[str] = None, **kwargs) -> dict:
+        """
+        Backfill several calendars concurrently
+
+        Returns:
+            dict: {calendar_name: [events]}
+        """
+        calendars = calendars or list(InvestingVariables.CALENDARS)
+        results = await asyncio.gather(*[self.backfill(name, date_from, date_to, **kwargs) for name in calendars])
+        return dict(zip(calendars, results))
+
+    def close(self):
+        """Shut down the parser process pool"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+if __name__ == "__main__":
+    async def main():
+        backfill = CalendarBackfill()
+        try:
+            results = await backfill.backfill_all("2025-07-01", "2025-08-23")
+            for calendar_name, events in results.items():
+                print(f"{calendar_name}: {len(events)} events")
+        finally:
+            backfill.close()
+            await backfill.scraper.close()
+
+    asyncio.run(main())
@@ -0,0 +1,221 @@
+import asyncio
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from utils import json_codec
+from utils.logger import logger
+from utils.parse_hebrew_date import parse_hebrew_date
+from investing_scraper.calendar_tracker import index_events
+from investing_scraper.investing_variables import InvestingVariables
+
+
+DEFAULT_DB_PATH = os.path.join("data", "investing_scraper", "calendar.sqlite3")
+
+# Date formats of the calendar pages (il.investing.com economic/earnings dates are Hebrew)
+DATE_FORMATS = ["%d.%m.%Y", "%A, %B %d, %Y", "%B %d, %Y", "%Y-%m-%d"]
+HEBREW_DATE_PATTERN = re.compile(r'יום \w+, \d+ ב\w+, \d{4}')
+
+# Volatility text -> importance level
+IMPORTANCE_KEYWORDS = {
+    InvestingVariables.IMPORTANCE.HIGH: ("גבוהה", "high"),
+    InvestingVariables.IMPORTANCE.MEDIUM: ("בינונית", "moderate", "medium"),
+    InvestingVariables.IMPORTANCE.LOW: ("נמוכה", "low"),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    calendar TEXT NOT NULL,
+    event_key TEXT NOT NULL,
+    event_date TEXT,
+    raw_date TEXT,
+    time TEXT,
+    country TEXT,
+    importance TEXT,
+    data TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (calendar, event_key)
+);
+CREATE INDEX IF NOT EXISTS idx_events_date ON events (calendar, event_date);
+CREATE INDEX IF NOT EXISTS idx_events_country ON events (calendar, country, event_date);
+CREATE INDEX IF NOT EXISTS idx_events_importance ON events (calendar, importance, event_date);
+"""
+
+
+def normalize_event_date(raw_date: str):
+    """Convert a calendar date string to YYYY-MM-DD, or None if it can't be parsed"""
+    if not raw_date:
+        return None
+    raw_date = raw_date.strip()
+    if HEBREW_DATE_PATTERN.match(raw_date):
+        parsed = parse_hebrew_date(raw_date)
+        return parsed.strftime("%Y-%m-%d") if parsed else None
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(raw_date, date_format).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+def event_importance(event: dict):
+    """Get the importance level (see InvestingVariables.IMPORTANCE) of an economic event"""
+    volatility = (event.get("volatility") or "").lower()
+    for importance, keywords in IMPORTANCE_KEYWORDS.items():
+        if any(keyword in volatility for keyword in keywords):
+            return importance.value
+    return None
+
+
+def event_key(key: tuple) -> str:
+    """
+    Store key of an indexed event (see calendar_tracker.index_events)
+
+    The first occurrence is stored under its plain identity so it matches the
+    rows already stored, duplicates get their occurrence number appended.
+    """
+    identity, occurrence = key[:-1], key[-1]
+    # stdlib json on purpose, the key must match the rows already stored
+    return json.dumps(identity + (occurrence,) if occurrence else identity, ensure_ascii=False)
+
+
+class CalendarStore:
+    """
+    Local SQLite store of calendar events, keyed by (calendar, event identity).
+
+    Upserts keep one row per event, and date/country/importance are indexed so
+    reports and alerts can query history without rescanning files. Use the
+    async methods from the event loop, they run in a worker thread.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._connection.row_factory = sqlite3.Row
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+            logger.debug(f"Opened calendar store: {self.db_path}")
+        return self._connection
+
+    def upsert(self, calendar_name: str, events) -> int:
+        """
+        Insert or update events
+
+        Args:
+            calendar_name (str): Calendar name (see InvestingVariables.CALENDARS)
+            events (list | dict): Flat event rows (with their 'date'), or rows already
+                indexed by index_events ({key: event}, e.g. tracker changes)
+
+        Returns:
+            int: Number of upserted events
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        indexed = events if isinstance(events, dict) else index_events(calendar_name, events)
+        rows = []
+        for key, event in indexed.items():
+            rows.append((
+                calendar_name,
+                event_key(key),
+                normalize_event_date(event.get("date")),
+                event.get("date"),
+                event.get("time"),
+                event.get("country"),
+                event_importance(event),
+                json_codec.dumps(event),
+                now,
+                now,
+            ))
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    """
+                    INSERT INTO events (calendar, event_key, event_date, raw_date, time, country, importance, data, first_seen, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (calendar, event_key) DO UPDATE SET
+                        event_date = excluded.event_date,
+                        time = excluded.time,
+                        importance = excluded.importance,
+                        data = excluded.data,
+                        updated_at = excluded.updated_at
+                    WHERE events.data != excluded.data
+                    """,
+                    rows
+                )
+        return len(rows)
+
+    def query(self, calendar_name: str, date_from: str = None, date_to: str = None,
+              country: str = None, importance: list[str] = None) -> list:
+        """
+        Query stored events
+
+        Args:
+            calendar_name (str): Calendar name
+            date_from (str): First day, YYYY-MM-DD (inclusive)
+            date_to (str): Last day, YYYY-MM-DD (inclusive)
+            country (str): Country name as shown on the calendar
+            importance (list[str]): Importance levels (see InvestingVariables.IMPORTANCE)
+
+        Returns:
+            list: Flat event rows ordered by date and time
+        """
+        conditions = ["calendar = ?"]
+        params = [calendar_name]
+        if date_from:
+            conditions.append("event_date >= ?")
+            params.append(date_from)
+        if date_to:
+            conditions.append("event_date <= ?")
+            params.append(date_to)
+        if country:
+            conditions.append("country = ?")
+            params.append(country)
+        if importance:
+            conditions.append(f"importance IN ({', '.join('?' for _ in importance)})")
+            params.extend(str(level) for level in importance)
+
+        sql = f"SELECT data FROM events WHERE {' AND '.join(conditions)} ORDER BY event_date, time"
+        with self._lock:
+            cursor = self._connect().execute(sql, params)
+            return [json_codec.loads(row["data"]) for row in cursor.fetchall()]
+
+    async def aupsert(self, calendar_name: str, events) -> int:
+        """Async upsert, runs in a worker thread"""
+        return await asyncio.to_thread(self.upsert, calendar_name, events)
+
+    async def aquery(self, calendar_name: str, **kwargs) -> list:
+        """Async query, runs in a worker thread"""
+        return await asyncio.to_thread(self.query, calendar_name, **kwargs)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# Global calendar store instance
+_calendar_store = None
+
+
+def get_calendar_store():
+    """
+    Get or create the global calendar store instance
+
+    Returns:
+        CalendarStore: Global calendar store instance
+    """
+    global _calendar_store
+    if _calendar_store is None:
+        _calendar_store = CalendarStore()
+    return _calendar_store
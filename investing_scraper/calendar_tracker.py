@@ -0,0 +1,184 @@
+import asyncio
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Awaitable, Callable, Optional
+from utils.logger import logger
+from investing_scraper.investing_variables import InvestingVariables
+
+
+# Fields that identify the same event across fetches, per calendar
+IDENTITY_FIELDS = {
+    InvestingVariables.CALENDARS.ECONOMIC_CALENDAR: ("date", "time", "country", "description"),
+    InvestingVariables.CALENDARS.EARNINGS_CALENDAR: ("date", "country", "company_ticker", "company_name"),
+    InvestingVariables.CALENDARS.HOLIDAY_CALENDAR: ("date", "country", "exchange_name", "holiday"),
+}
+
+
+class ChangeType(StrEnum):
+    EVENT_ADDED = "event_added"
+    EVENT_REMOVED = "event_removed"
+    ACTUAL_PUBLISHED = "actual_published"
+    ACTUAL_REVISED = "actual_revised"
+    FORECAST_REVISED = "forecast_revised"
+    PREVIOUS_REVISED = "previous_revised"
+    FIELD_CHANGED = "field_changed"
+
+
+# Value changes of these fields get their own change type
+FIELD_CHANGE_TYPES = {
+    "forecast": ChangeType.FORECAST_REVISED,
+    "previous": ChangeType.PREVIOUS_REVISED,
+}
+
+
+@dataclass
+class CalendarChange:
+    """A single change between two calendar snapshots"""
+    change_type: ChangeType
+    key: tuple
+    event: dict
+    field: Optional[str] = None
+    old_value: Optional[str] = None
+    new_value: Optional[str] = None
+
+
+def event_identity(calendar_name: str, event: dict) -> tuple:
+    """
+    Get the stable identity of a calendar event
+
+    Args:
+        calendar_name (str): Calendar name (see InvestingVariables.CALENDARS)
+        event (dict): Flat event row
+
+    Returns:
+        tuple: Identity key
+    """
+    fields = IDENTITY_FIELDS.get(calendar_name) or tuple(sorted(event))
+    return tuple(event.get(field) for field in fields)
+
+
+def index_events(calendar_name: str, events: list) -> dict:
+    """Index events by identity, numbering duplicates so no row is lost"""
+    indexed = {}
+    for event in events:
+        key = event_identity(calendar_name, event)
+        occurrence = 0
+        while key + (occurrence,) in indexed:
+            occurrence += 1
+        indexed[key + (occurrence,)] = event
+    return indexed
+
+
+def diff_events(old: dict, new: dict) -> list[CalendarChange]:
+    """
+    Diff two indexed snapshots
+
+    Args:
+        old (dict): Previous snapshot {key: event}
+        new (dict): New snapshot {key: event}
+
+    Returns:
+        list[CalendarChange]: Changes, in the order of the new snapshot
+    """
+    changes = []
+    for key, event in new.items():
+        previous = old.get(key)
+        if previous is None:
+            changes.append(CalendarChange(ChangeType.EVENT_ADDED, key, event))
+            continue
+        if previous == event:
+            continue
+
+        for field in list(event) + [field for field in previous if field not in event]:
+            old_value, new_value = previous.get(field), event.get(field)
+            if old_value == new_value:
+                continue
+            if field == "actual":
+                change_type = ChangeType.ACTUAL_PUBLISHED if not old_value else ChangeType.ACTUAL_REVISED
+            else:
+                change_type = FIELD_CHANGE_TYPES.get(field, ChangeType.FIELD_CHANGED)
+            changes.append(CalendarChange(change_type, key, event, field, old_value, new_value))
+
+    for key, event in old.items():
+        if key not in new:
+            changes.append(CalendarChange(ChangeType.EVENT_REMOVED, key, event))
+    return changes
+
+
+class CalendarStateTracker:
+    """
+    Keeps the last snapshot of a calendar and turns every new fetch into a diff.
+
+    Concurrent refresh() calls share one in-flight fetch, and every subscriber is
+    notified once per refresh with only the rows that changed.
+    """
+
+    def __init__(self, calendar_name: str, fetch_events: Callable[[], Awaitable[list]]):
+        """
+        Initialize the tracker.
+
+        Args:
+            calendar_name (str): Calendar name (see InvestingVariables.CALENDARS)
+            fetch_events (callable): Coroutine function returning the flat event rows
+        """
+        self.calendar_name = calendar_name
+        self.fetch_events = fetch_events
+        self.snapshot = {}
+        self.last_refresh = None
+        self._refresh_task = None
+        self._subscribers = []
+
+    def subscribe(self, callback: Callable[[list[CalendarChange]], Awaitable[None]]):
+        """Register a coroutine function called with the changes of every refresh"""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Remove a subscriber"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def apply(self, events: list) -> list[CalendarChange]:
+        """
+        Apply a new fetch to the snapshot
+
+        Args:
+            events (list): Flat event rows
+
+        Returns:
+            list[CalendarChange]: Changes against the previous snapshot
+        """
+        new_snapshot = index_events(self.calendar_name, events)
+        changes = diff_events(self.snapshot, new_snapshot)
+        self.snapshot = new_snapshot
+        return changes
+
+    async def _refresh(self) -> list[CalendarChange]:
+        events = await self.fetch_events()
+        if events is None:
+            # keep the last snapshot, a failed fetch is not "everything was removed"
+            logger.warning(f"⚠️ No data for {self.calendar_name}, keeping last snapshot")
+            return []
+
+        changes = self.apply(events)
+        self.last_refresh = asyncio.get_running_loop().time()
+        logger.info(f"📊 {self.calendar_name} refreshed: {len(self.snapshot)} events, {len(changes)} changes")
+
+        for callback in list(self._subscribers):
+            try:
+                await callback(changes)
+            except Exception as e:
+                logger.error(f"❌ Error in {self.calendar_name} subscriber: {e}")
+        return changes
+
+    async def refresh(self) -> list[CalendarChange]:
+        """Fetch the calendar and apply it, sharing the fetch with concurrent callers"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._refresh())
+        return await asyncio.shield(self._refresh_task)
+
+    def get_events(self, time_str: str = None) -> list:
+        """Get the events of the current snapshot, optionally only those at time_str"""
+        events = list(self.snapshot.values())
+        if time_str is not None:
+            events = [event for event in events if event.get("time") == time_str]
+        return events
@@ -0,0 +1,167 @@
+import os
+import time
+import soupsieve
+from utils.logger import logger
+from utils.read_write import read_json_file
+
+
+class SelectorPlan:
+    """A single table column: precompiled CSS selector and attribute extraction order"""
+
+    def __init__(self, name: str, selector: str, attributes: list[str]):
+        if not selector or not attributes:
+            raise ValueError(f"Column '{name}' must define a selector and at least one attribute")
+        self.name = name
+        self.selector = selector
+        self.attributes = tuple(attributes)
+        self.compiled = soupsieve.compile(selector)
+
+    def __repr__(self):
+        return f"SelectorPlan({self.name!r}, {self.selector!r}, {self.attributes!r})"
+
+
+class ScrapePlan:
+    """Everything needed to fetch and parse one investing.com calendar page"""
+
+    def __init__(self, page_name: str, request_config: dict, table_structure: dict):
+        if not request_config or "url" not in request_config:
+            raise ValueError(f"Request config for '{page_name}' has no url")
+        if not table_structure or "table_selectors" not in table_structure:
+            raise ValueError(f"Table structure for '{page_name}' has no table_selectors")
+
+        table_selectors = table_structure["table_selectors"]
+        if "date" not in table_selectors:
+            raise ValueError(f"Table structure for '{page_name}' has no date selector")
+
+        self.page_name = page_name
+        self.url = request_config["url"]
+        self.method = request_config.get("method", "post").upper()
+        self.default_payload = request_config.get("payload", {})
+        self.is_date_inline = bool(table_structure.get("is_date_inline", False))
+        self.date_format = table_structure.get("date_format")
+        self.date_selector = SelectorPlan("date", table_selectors["date"]["selector"], table_selectors["date"]["attribute"])
+        # keep the json order, it is the column order of the output rows
+        self.column_selectors = [
+            SelectorPlan(name, selector["selector"], selector["attribute"])
+            for name, selector in table_selectors.items()
+            if name != "date"
+        ]
+
+    def __repr__(self):
+        return f"ScrapePlan({self.page_name!r}, columns={[c.name for c in self.column_selectors]})"
+
+
+class ScrapePlanRegistry:
+    """
+    Loads the scraper json configs once and keeps compiled ScrapePlan objects.
+
+    Files are reloaded only when their mtime changes, and mtimes are checked at most
+    once every `check_interval` seconds, so the polling hot path does no file I/O.
+    """
+
+    def __init__(self, base_dir: str = "investing_scraper", check_interval: float = 5.0):
+        self.base_dir = base_dir
+        self.check_interval = check_interval
+        self.headers_file = os.path.join(base_dir, "headers.json")
+        self.tables_structure_file = os.path.join(base_dir, "tables_stucture.json")
+        self.requests_dir = os.path.join(base_dir, "requests_json")
+
+        self._headers = None
+        self._tables_structure = None
+        self._request_configs = {}
+        self._plans = {}
+        self._mtimes = {}
+        self._last_check = 0.0
+
+    def _mtime(self, file_path: str):
+        try:
+            return os.stat(file_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _request_file(self, page_name: str) -> str:
+        return os.path.join(self.requests_dir, f"{page_name}.json")
+
+    def _is_stale(self, file_path: str) -> bool:
+        return self._mtimes.get(file_path) != self._mtime(file_path)
+
+    def _load_json(self, file_path: str):
+        data = read_json_file(file_path)
+        if data is None:
+            raise ValueError(f"Could not load scraper config: {file_path}")
+        self._mtimes[file_path] = self._mtime(file_path)
+        return data
+
+    def _check_for_changes(self):
+        """Drop cached configs whose files changed since they were loaded"""
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return
+        self._last_check = now
+
+        if self._headers is not None and self._is_stale(self.headers_file):
+            logger.info(f"Reloading changed scraper config: {self.headers_file}")
+            self._headers = None
+
+        if self._tables_structure is not None and self._is_stale(self.tables_structure_file):
+            logger.info(f"Reloading changed scraper config: {self.tables_structure_file}")
+            self._tables_structure = None
+            self._plans.clear()
+
+        for page_name in list(self._request_configs):
+            if self._is_stale(self._request_file(page_name)):
+                logger.info(f"Reloading changed scraper config: {self._request_file(page_name)}")
+                del self._request_configs[page_name]
+                self._plans.pop(page_name, None)
+
+    def get_headers(self) -> dict:
+        """Get the request headers for investing.com"""
+        self._check_for_changes()
+        if self._headers is None:
+            self._headers = self._load_json(self.headers_file)
+        return self._headers
+
+    def get_plan(self, page_name: str) -> ScrapePlan:
+        """
+        Get the compiled scrape plan of a calendar page
+
+        Args:
+            page_name (str): Calendar page name (e.g. economic_calendar)
+
+        Returns:
+            ScrapePlan: Compiled plan
+
+        Raises:
+            ValueError: If the configs of the page are missing or invalid
+        """
+        self._check_for_changes()
+        plan = self._plans.get(page_name)
+        if plan is not None:
+            return plan
+
+        if self._tables_structure is None:
+            self._tables_structure = self._load_json(self.tables_structure_file)
+        if page_name not in self._request_configs:
+            self._request_configs[page_name] = self._load_json(self._request_file(page_name))
+
+        plan = ScrapePlan(page_name, self._request_configs[page_name], self._tables_structure.get(page_name))
+        self._plans[page_name] = plan
+        logger.debug(f"Compiled scrape plan: {plan}")
+        return plan
+
+
+# Global scrape plan registry instance
+_scrape_plan_registry = None
+
+
+def get_scrape_plan_registry():
+    """
+    Get or create the global scrape plan registry instance
+
+    Returns:
+        ScrapePlanRegistry: Global scrape plan registry instance
+    """
+    global _scrape_plan_registry
+    if _scrape_plan_registry is None:
+        _scrape_plan_registry = ScrapePlanRegistry()
+    return _scrape_plan_registry
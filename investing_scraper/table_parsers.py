@@ -0,0 +1,193 @@
+from bs4 import BeautifulSoup
+from utils.logger import logger
+from investing_scraper.scrape_plans import ScrapePlan
+
+try:
+    import lxml.html
+    from lxml.cssselect import CSSSelector
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+class TableParser:
+    """
+    Base class for investing.com calendar table parsers.
+
+    Subclasses yield (date, row_data) for every <tr>, and this class groups the rows
+    by date the same way for every engine.
+    """
+
+    name = None
+
+    def _iter_rows(self, plan: ScrapePlan, table_html: str):
+        """Yield (date or None, row_data) for every row of the table"""
+        raise NotImplementedError
+
+    def parse(self, plan: ScrapePlan, table_html: str) -> dict:
+        """
+        Parse the table html into events grouped by date
+
+        Args:
+            plan (ScrapePlan): Compiled scrape plan of the page
+            table_html (str): The <tr> rows returned by investing.com
+
+        Returns:
+            dict: {date: [row_data, ...]}
+        """
+        events_by_date = {}
+        current_events = []
+        current_date = "unknown"
+
+        for new_date, row_data in self._iter_rows(plan, table_html):
+            # add the previous events to the matching date
+            if new_date:
+                if current_events:
+                    events_by_date[current_date] = current_events
+                    current_events = []
+                current_date = new_date
+
+            # extract the events if not a date tr, or if the date is inline
+            if (not new_date or plan.is_date_inline) and row_data:
+                current_events.append(row_data)
+
+        if current_events:
+            events_by_date[current_date] = current_events
+
+        return events_by_date
+
+
+class BeautifulSoupTableParser(TableParser):
+    """Reference engine: BeautifulSoup tree with one select_one per column per row"""
+
+    name = "bs4"
+
+    @staticmethod
+    def _element_value(element, attributes):
+        for attribute in attributes:
+            if attribute == "text":
+                value = element.text.strip()
+            else:
+                value = element.get(attribute)
+            if value:
+                return value
+        return None
+
+    def _iter_rows(self, plan: ScrapePlan, table_html: str):
+        table_soup = BeautifulSoup(table_html, 'html.parser')
+        date_selector = plan.date_selector
+
+        for row in table_soup.find_all('tr'):
+            date_element = date_selector.compiled.select_one(row)
+            new_date = self._element_value(date_element, date_selector.attributes) if date_element else None
+
+            row_data = {}
+            if not new_date or plan.is_date_inline:
+                for selector in plan.column_selectors:
+                    try:
+                        data_element = selector.compiled.select_one(row)
+                        if data_element:
+                            row_data[selector.name] = self._element_value(data_element, selector.attributes)
+                    except Exception as e:
+                        logger.error(f"Error processing {selector.name}: {str(e)}")
+            yield new_date, row_data
+
+
+class LxmlTableParser(TableParser):
+    """
+    Fast engine: libxml2 tree with selectors compiled to XPath.
+
+    Each column selector runs once over the whole table (in C) instead of once per
+    row, and the matches are bucketed by their row, so a row's columns are all
+    extracted in a single pass over the table.
+    """
+
+    name = "lxml"
+
+    def __init__(self):
+        if not LXML_AVAILABLE:
+            raise ImportError("lxml and cssselect are required for the lxml table parser")
+        self._compiled = {}
+
+    def _compile(self, selector: str):
+        compiled = self._compiled.get(selector)
+        if compiled is None:
+            compiled = CSSSelector(selector, translator="html")
+            self._compiled[selector] = compiled
+        return compiled
+
+    @staticmethod
+    def _element_value(element, attributes):
+        for attribute in attributes:
+            if attribute == "text":
+                value = element.text_content().strip()
+            else:
+                value = element.get(attribute)
+            if value:
+                return value
+        return None
+
+    def _first_match_by_row(self, root, selector: str, row_index: dict) -> dict:
+        """Map row position -> first element matching the selector inside that row"""
+        matches = {}
+        for element in self._compile(selector)(root):
+            row = next(element.iterancestors("tr"), None)
+            position = row_index.get(row)
+            # document order, so the first match of a row is what select_one would return
+            if position is not None and position not in matches:
+                matches[position] = element
+        return matches
+
+    def _iter_rows(self, plan: ScrapePlan, table_html: str):
+        if not table_html or not table_html.strip():
+            return
+        root = lxml.html.fromstring(f"<table>{table_html}</table>")
+        rows = list(root.iter("tr"))
+        row_index = {row: position for position, row in enumerate(rows)}
+
+        date_selector = plan.date_selector
+        dates = self._first_match_by_row(root, date_selector.selector, row_index)
+        columns = []
+        for selector in plan.column_selectors:
+            try:
+                columns.append((selector, self._first_match_by_row(root, selector.selector, row_index)))
+            except Exception as e:
+                logger.error(f"Error processing {selector.name}: {str(e)}")
+
+        for position in range(len(rows)):
+            date_element = dates.get(position)
+            new_date = self._element_value(date_element, date_selector.attributes) if date_element is not None else None
+
+            row_data = {}
+            if not new_date or plan.is_date_inline:
+                for selector, matches in columns:
+                    data_element = matches.get(position)
+                    if data_element is not None:
+                        row_data[selector.name] = self._element_value(data_element, selector.attributes)
+            yield new_date, row_data
+
+
+TABLE_PARSERS = {
+    BeautifulSoupTableParser.name: BeautifulSoupTableParser,
+    LxmlTableParser.name: LxmlTableParser,
+}
+
+
+def get_table_parser(engine: str = None) -> TableParser:
+    """
+    Create a table parser engine
+
+    Args:
+        engine (str): 'lxml', 'bs4' or None for the fastest available engine
+
+    Returns:
+        TableParser: Parser instance
+    """
+    if engine is None:
+        engine = LxmlTableParser.name if LXML_AVAILABLE else BeautifulSoupTableParser.name
+    if engine not in TABLE_PARSERS:
+        raise ValueError(f"Unknown table parser engine: {engine}")
+    if engine == LxmlTableParser.name and not LXML_AVAILABLE:
+        logger.warning("lxml is not installed, falling back to the bs4 table parser")
+        engine = BeautifulSoupTableParser.name
+    return TABLE_PARSERS[engine]()
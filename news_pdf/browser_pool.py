@@ -0,0 +1,271 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright
+from utils.logger import logger
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+# process names of the Chromium processes started by Playwright
+BROWSER_PROCESS_NAMES = ("chrome", "chromium", "headless_shell")
+
+
+class BrowserPool:
+    """
+    Long-lived headless Chromium shared by the PDF renders.
+
+    Every render gets its own browser context (isolated cookies, storage and cache)
+    and page, which are closed after the render. The browser itself stays up and is
+    recycled after `max_renders` renders or once its processes use more than
+    `max_memory_mb` (measured when psutil is installed), or after a failed health
+    check. A recycle waits for the pages in use to be released.
+    """
+
+    def __init__(self, max_renders: int = 100, max_memory_mb: int = 800, max_pages: int = 2,
+                 health_check_interval: float = 300, launch_args: list[str] = None, executable_path: str = None):
+        """
+        Initialize the pool (the browser is launched on first use or by warmup()).
+
+        Args:
+            max_renders (int): Renders before the browser is recycled
+            max_memory_mb (int): Browser memory (RSS of its processes) before it is recycled
+            max_pages (int): Pages rendered at the same time
+            health_check_interval (float): Seconds between background health checks (0 disables them)
+            launch_args (list[str]): Extra Chromium arguments
+            executable_path (str): Chromium/Chrome binary to use instead of the Playwright download
+        """
+        self.max_renders = max_renders
+        self.max_memory_mb = max_memory_mb
+        self.health_check_interval = health_check_interval
+        self.launch_args = launch_args or ["--disable-dev-shm-usage", "--disable-gpu"]
+        self.executable_path = executable_path
+        self._playwright = None
+        self._browser = None
+        self._lock = asyncio.Lock()
+        self._pages = asyncio.Semaphore(max_pages)
+        self._active = 0
+        self._renders = 0
+        self._launched_at = None
+        # set when the browser must be replaced once its pages are released
+        self._retire_reason = None
+        self._health_task = None
+        self.stats = {"launches": 0, "recycles": 0, "renders": 0, "failed_renders": 0, "health_failures": 0}
+
+    @property
+    def is_running(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    def browser_memory_mb(self):
+        """
+        Memory used by the browser processes
+
+        Returns:
+            float: RSS in MB, or None when psutil is not installed
+        """
+        if psutil is None:
+            return None
+        rss = 0
+        try:
+            for process in psutil.Process().children(recursive=True):
+                try:
+                    if any(name in process.name().lower() for name in BROWSER_PROCESS_NAMES):
+                        rss += process.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+        except psutil.Error as e:
+            logger.debug(f"Could not measure browser memory: {e}")
+            return None
+        return rss / 1024 / 1024
+
+    def _recycle_reason(self):
+        if self._retire_reason:
+            return self._retire_reason
+        if self._renders >= self.max_renders:
+            return f"{self._renders} renders"
+        memory = self.browser_memory_mb()
+        if memory is not None and memory > self.max_memory_mb:
+            return f"{memory:.0f}MB memory"
+        return None
+
+    async def _launch(self):
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        started = time.perf_counter()
+        self._browser = await self._playwright.chromium.launch(
+            args=self.launch_args, executable_path=self.executable_path
+        )
+        self._renders = 0
+        self._retire_reason = None
+        self._launched_at = time.monotonic()
+        self.stats["launches"] += 1
+        logger.info(f"🌐 Launched pooled Chromium in {time.perf_counter() - started:.2f}s")
+
+    async def _close_browser(self):
+        browser, self._browser = self._browser, None
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing browser: {e}")
+
+    async def _ensure_browser(self):
+        """Launch the browser if needed, recycle it when it is due and no page is in use"""
+        async with self._lock:
+            if not self.is_running:
+                if self._browser is not None:
+                    logger.warning("⚠️ Pooled browser disconnected, relaunching")
+                    await self._close_browser()
+                await self._launch()
+                return
+            if self._active == 0:
+                reason = self._recycle_reason()
+                if reason:
+                    logger.info(f"♻️ Recycling pooled browser after {reason}")
+                    self.stats["recycles"] += 1
+                    await self._close_browser()
+                    await self._launch()
+
+    @asynccontextmanager
+    async def page(self, **context_options):
+        """
+        Get an isolated page, closed with its context on exit
+
+        Args:
+            **context_options: Browser context options (viewport, locale, ...)
+
+        Usage:
+            async with pool.page() as page:
+                await page.set_content(html)
+                pdf = await page.pdf()
+        """
+        async with self._pages:
+            await self._ensure_browser()
+            self._active += 1
+            context = None
+            try:
+                context = await self._browser.new_context(**context_options)
+                page = await context.new_page()
+                yield page
+                self.stats["renders"] += 1
+            except Exception:
+                self.stats["failed_renders"] += 1
+                raise
+            finally:
+                self._active -= 1
+                self._renders += 1
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        logger.debug(f"Error closing browser context: {e}")
+                if self._retire_reason and self._active == 0:
+                    await self._retire()
+
+    async def _retire(self):
+        """Close a browser marked for retirement once no page uses it (relaunched on next use)"""
+        async with self._lock:
+            if self._retire_reason and self._active == 0 and self._browser is not None:
+                logger.info(f"♻️ Retiring pooled browser after {self._retire_reason}")
+                self.stats["recycles"] += 1
+                await self._close_browser()
+
+    async def health_check(self) -> bool:
+        """
+        Render a tiny page, relaunch the browser if that fails
+
+        Returns:
+            bool: True if the browser is healthy (or was relaunched successfully)
+        """
+        try:
+            async with self.page() as page:
+                await page.set_content("<html><body>ok</body></html>")
+                if await page.evaluate("document.body.textContent") != "ok":
+                    raise RuntimeError("unexpected page content")
+            return True
+        except Exception as e:
+            self.stats["health_failures"] += 1
+            # pages being rendered keep the browser until they are released
+            self._retire_reason = "failed health check"
+            if self._active:
+                logger.error(f"❌ Browser health check failed, retiring it after the {self._active} pages in use: {e}")
+                return False
+            logger.error(f"❌ Browser health check failed, relaunching: {e}")
+            try:
+                await self._ensure_browser()
+                return True
+            except Exception as launch_error:
+                logger.error(f"❌ Could not relaunch browser: {launch_error}")
+                return False
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            await self.health_check()
+
+    async def warmup(self) -> bool:
+        """
+        Launch the browser and render one PDF so the first report starts warm,
+        then start the background health checks
+
+        Returns:
+            bool: True if the browser is ready
+        """
+        started = time.perf_counter()
+        try:
+            async with self.page() as page:
+                await page.set_content("<html><body>warmup</body></html>")
+                await page.pdf(format="A4")
+        except Exception as e:
+            logger.error(f"❌ Browser warmup failed: {e}")
+            return False
+        if self.health_check_interval and (self._health_task is None or self._health_task.done()):
+            self._health_task = asyncio.create_task(self._health_loop())
+        logger.info(f"🔥 Browser pool warmed up in {time.perf_counter() - started:.2f}s")
+        return True
+
+    async def close(self):
+        """Close the browser and stop Playwright"""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        async with self._lock:
+            await self._close_browser()
+            if self._playwright is not None:
+                try:
+                    await self._playwright.stop()
+                except Exception as e:
+                    logger.debug(f"Error stopping Playwright: {e}")
+                self._playwright = None
+        logger.info("✅ Browser pool closed")
+
+    def get_stats(self) -> dict:
+        memory = self.browser_memory_mb()
+        return dict(
+            self.stats,
+            running=self.is_running,
+            active_pages=self._active,
+            renders_since_launch=self._renders,
+            browser_age=round(time.monotonic() - self._launched_at, 1) if self._launched_at else None,
+            memory_mb=round(memory, 1) if memory is not None else None,
+        )
+
+
+# Global browser pool instance
+_browser_pool = None
+
+
+def get_browser_pool():
+    """
+    Get or create the global browser pool
+
+    Returns:
+        BrowserPool: Global browser pool instance
+    """
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool()
+    return _browser_pool
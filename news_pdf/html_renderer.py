@@ -0,0 +1,151 @@
+"""
+Server-side rendering of the news report.
+
+The template is compiled once into static chunks and slots: its inline script is
+dropped, and the price cards, news items, theme and generation time are rendered
+in Python. The page Chromium prints is plain static HTML, no JavaScript runs.
+"""
+
+import html
+from functools import lru_cache
+import lxml.html
+from utils.logger import logger
+
+
+THEME_ICONS = {"morning": "☀️", "evening": "🌙"}
+THEME_STYLE_IDS = {"morning": "morning-theme", "evening": "evening-theme"}
+SLOT_MARK = "@@SLOT:{}@@"
+
+
+def _escape(value) -> str:
+    return html.escape("" if value is None else str(value))
+
+
+def render_price_card(symbol: dict, index: int) -> str:
+    """Price ticker card of one symbol (same markup the template script used to build)"""
+    change_amount = str(symbol.get("changeAmount") or "0.00")
+    change_percent = str(symbol.get("changePercent") or "0.00%")
+    is_positive = symbol.get("isPositive")
+    if is_positive is None:
+        try:
+            is_positive = float(change_amount) >= 0
+        except ValueError:
+            is_positive = True
+    if "(" not in change_percent and ")" not in change_percent:
+        change_percent = f"({change_percent})"
+    sign = "positive" if is_positive else "negative"
+    direction, arrow = ("up", "↗") if is_positive else ("down", "↘")
+    return (
+        f'<div class="symbol-item" id="symbol-{index}"><div class="symbol-main">'
+        f'<div class="symbol-price-section">'
+        f'<div class="symbol-price">{_escape(symbol.get("price") or "$0.00")}</div>'
+        f'<div class="symbol-change">'
+        f'<span class="change-amount {sign}">{_escape(change_amount)}</span>'
+        f'<span class="change-percent {sign}">{_escape(change_percent)}</span>'
+        f'<span class="change-arrow {direction}">{arrow}</span>'
+        f'</div></div>'
+        f'<div class="symbol-info">'
+        f'<div class="symbol-ticker">{_escape(symbol.get("ticker") or "N/A")}</div>'
+        f'<div class="symbol-company">{_escape(symbol.get("company") or "N/A")}</div>'
+        f'</div></div></div>'
+    )
+
+
+def render_news_item(item: dict) -> str:
+    """One news item (same markup the template script used to build)"""
+    return (
+        f'<div class="news-item"><div class="news-header">'
+        f'<div class="news-time">{_escape(item.get("time"))}</div>'
+        f'<a href="{_escape(item.get("link") or "#")}" class="news-link" target="_blank">צפה במקור</a>'
+        f'</div>'
+        f'<div class="news-message">{_escape(item.get("message"))}</div></div>'
+    )
+
+
+class CompiledReportTemplate:
+    """The report template split into static html chunks and named slots"""
+
+    def __init__(self, template: str):
+        """
+        Compile a template (with its stylesheets already inlined).
+
+        Args:
+            template (str): Report template html
+        """
+        document = lxml.html.document_fromstring(template)
+
+        for script in document.xpath("//script"):
+            script.drop_tree()
+
+        # the theme stylesheets become one slot holding the css of the chosen theme
+        self.theme_css = {}
+        theme_styles = [
+            (theme, document.get_element_by_id(style_id, None)) for theme, style_id in THEME_STYLE_IDS.items()
+        ]
+        for theme, style in theme_styles:
+            if style is not None:
+                self.theme_css[theme] = style.text or ""
+        styles = [style for _, style in theme_styles if style is not None]
+        if styles:
+            styles[0].addprevious(lxml.html.fromstring(f"<meta name='{SLOT_MARK.format('theme_style')}'>"))
+            for style in styles:
+                style.drop_tree()
+
+        symbols_container = document.find_class("symbols-container")[0]
+        # the template has a fixed number of card slots, the layout is made for them
+        self.max_symbols = len(symbols_container.find_class("symbol-item"))
+        self._fill(symbols_container, "price_symbols")
+        self._fill(document.get_element_by_id("news-container"), "news")
+        self._fill(document.get_element_by_id("generation-time"), "generation_time")
+        self._fill(document.get_element_by_id("theme-icon"), "theme_icon")
+        document.body.set("data-theme", SLOT_MARK.format("theme"))
+
+        compiled = "<!DOCTYPE html>\n" + lxml.html.tostring(document, encoding="unicode")
+        compiled = compiled.replace(f'<meta name="{SLOT_MARK.format("theme_style")}">', SLOT_MARK.format("theme_style"))
+
+        # even indexes are static html, odd indexes are slot names
+        chunks = compiled.split("@@SLOT:")
+        self.parts = [chunks[0]]
+        for chunk in chunks[1:]:
+            slot, _, rest = chunk.partition("@@")
+            self.parts.extend([slot, rest])
+        logger.debug(f"Compiled report template into {len(self.parts) // 2} slots")
+
+    @staticmethod
+    def _fill(element, slot: str):
+        for child in list(element):
+            element.remove(child)
+        element.text = SLOT_MARK.format(slot)
+
+    def render(self, news_data: list, prices_data: list, theme: str, generated_at: str) -> str:
+        """
+        Render the final static html
+
+        Args:
+            news_data (list): News items
+            prices_data (list): Price symbol data (only the first card slots are shown)
+            theme (str): 'morning' or 'evening'
+            generated_at (str): Generation time shown in the footer
+
+        Returns:
+            str: Report html
+        """
+        theme_css = self.theme_css.get(theme, "")
+        slots = {
+            "theme": _escape(theme),
+            "theme_icon": THEME_ICONS.get(theme, ""),
+            "theme_style": f'<style id="{THEME_STYLE_IDS.get(theme, "theme")}">{theme_css}</style>' if theme_css else "",
+            "price_symbols": "".join(
+                render_price_card(symbol, index)
+                for index, symbol in enumerate((prices_data or [])[:self.max_symbols], 1)
+            ),
+            "news": "".join(render_news_item(item) for item in news_data or [] if isinstance(item, dict)),
+            "generation_time": _escape(generated_at),
+        }
+        return "".join(part if index % 2 == 0 else slots[part] for index, part in enumerate(self.parts))
+
+
+@lru_cache(maxsize=4)
+def compile_report_template(template: str) -> CompiledReportTemplate:
+    """Compiled template, compiled once per template content"""
+    return CompiledReportTemplate(template)
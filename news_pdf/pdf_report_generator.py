@@ -4,19 +4,70 @@ News Report Generator
 A class-based system for generating HTML and PDF news reports with theme support.
 """
 
-import json
+import asyncio
+import time
+from dataclasses import dataclass
 import os
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from playwright.async_api import async_playwright
+from news_pdf.browser_pool import BrowserPool, get_browser_pool
 from utils.logger import logger
-from utils.read_write import read_text_file, write_text_file, read_json_file
-from yf_scraper.yf_requests import YfRequests
+from news_pdf.report_assets import get_template_cache
+from news_pdf.html_renderer import compile_report_template
+from news_pdf.report_cache import ReportCache, get_report_cache, report_key
+from utils.read_write import write_binary_file
+from yf_scraper.market_data_cache import get_market_data_cache
 from yf_scraper.qoute_fields import QouteFields as qf
 import pytz
 from config import Config
 import discord
-from discord_utils.process_news import process_news_to_list
+from discord_utils.process_news import NEWS_UPDATE_PROMPT, process_news_to_list
+
+
+@dataclass
+class ReportSpec:
+    """One report variant of a batch"""
+    report_time: str = 'auto'
+    hours_back: int = 24
+    output_pdf: str = None
+    name: str = None
+
+
+@dataclass
+class ReportResult:
+    """The PDF produced for a ReportSpec"""
+    spec: ReportSpec
+    pdf_bytes: bytes = None
+    key: str = None
+    cached: bool = False
+    error: str = None
+    
+    @property
+    def ok(self) -> bool:
+        return self.pdf_bytes is not None
+
+
+@dataclass
+class PreparedReport:
+    """The data of a report, gathered but not rendered yet"""
+    report_time: str
+    theme: str
+    news_data: list
+    prices_data: list
+    template: str = None
+    key: str = None
+    started: float = None
+
+
+@dataclass
+class ReportDraft:
+    """News of a scheduled report summarized ahead of its fire time, up to `cutoff`"""
+    report_time: str
+    hours_back: int
+    news_data: list
+    window_start: datetime
+    cutoff: datetime
+    created_at: float
 
 
 class PdfReportGenerator:
@@ -41,17 +92,45 @@ class PdfReportGenerator:
         }
     }
     
-    def __init__(self, discord_bot: discord.Client, template_file="news_pdf/template.html"):
+    # Seconds each report stage may take before its fallback is used
+    STAGE_TIMEOUTS = {
+        'news': 180,      # Discord history scan + LLM summary
+        'prices': 20,     # market summary
+        'template': 5,    # inlined template (usually from memory)
+        'render': 60,     # HTML to PDF
+    }
+    
+    # Shown instead of the news when they could not be loaded in time
+    NEWS_UNAVAILABLE = [{
+        'time': '',
+        'link': '#',
+        'message': 'החדשות אינן זמינות כרגע'
+    }]
+    
+    def __init__(self, discord_bot: discord.Client, template_file="news_pdf/template.html",
+                 browser_pool: BrowserPool = None, stage_timeouts: dict = None, report_cache: ReportCache = None):
         """
         Initialize the PdfReportGenerator.
         
         Args:
             discord_bot (discord.Client): Discord bot instance
             template_file (str): Path to the HTML template file
+            browser_pool (BrowserPool): Browser used for rendering (default: the global warm browser pool)
+            stage_timeouts (dict): Override of STAGE_TIMEOUTS {stage: seconds}
+            report_cache (ReportCache): Rendered reports by content hash (default: the global report cache)
         """
         self.discord_bot = discord_bot
         self.template_file = template_file
-        self.yf_requests = YfRequests()
+        self.browser_pool = browser_pool or get_browser_pool()
+        self.stage_timeouts = dict(self.STAGE_TIMEOUTS, **(stage_timeouts or {}))
+        self.report_cache = report_cache or get_report_cache()
+        # content hash of the last report and whether it came from the cache
+        self.last_report_key = None
+        self.last_report_cached = False
+        # {stage: {"seconds": float, "status": str}} of the last report
+        self.last_stage_timings = {}
+        # shared warm copy of the Yahoo market data (stale-while-revalidate)
+        self.market_data = get_market_data_cache()
         self._validate_files()
     
     def _validate_files(self):
@@ -91,54 +170,88 @@ class PdfReportGenerator:
 
 
 
-    async def _load_news_data(self, hours_back: int = 24) -> list:
+    async def _load_news_data(self, hours_back: int = 24, after: datetime = None, before: datetime = None,
+                              **process_options) -> list:
         """
         Load news data from Discord channel.
         
         Args:
             hours_back (int): Number of hours to look back
+            after (datetime): Load the news after this time instead of the last hours_back hours
+            before (datetime): Load the news before this time (default: up to now)
+            **process_options: Passed to process_news_to_list (e.g. prompt_file)
             
         Returns:
-            list: List of news items
+            list: List of news items (empty if there was no news), None if failed
         """
         try:
             news_list = await process_news_to_list(
                 discord_bot=self.discord_bot, 
-                hours_back=hours_back
+                hours_back=hours_back,
+                after=after,
+                before=before,
+                **process_options
             )
+            if news_list is None:
+                return None
             logger.info(f"✅ Loaded {len(news_list)} news items")
             return news_list
         except Exception as e:
             logger.error(f"❌ Error loading news data: {e}")
-            return []
+            return None
 
 
-    async def _load_market_summary(self) -> list:
+    async def _load_market_summary(self, fresh: bool = False) -> list:
         """
         Load and transform price data from market summary.
         
+        Args:
+            fresh (bool): Reload the market summary instead of serving the cached (possibly stale) copy
+        
         Returns:
-            list: List of price symbol data for the template
+            list: List of price symbol data for the template, None if failed
         """
         try:
-            response = self.yf_requests.get_market_summary()
-            price_symbols = []
-            
-            for company in response["marketSummaryResponse"]["result"]:
-                try:
-                    symbol_data = self._process_company_data(company)
-                    if symbol_data:
-                        price_symbols.append(symbol_data)
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error processing company data: {e}")
-                    continue
-            
+            response = await self.market_data.get_market_summary(fresh=fresh)
+            price_symbols = self._process_market_summary(response)
             logger.info(f"✅ Loaded {len(price_symbols)} price symbols from market summary")
             return price_symbols
             
         except Exception as e:
             logger.error(f"❌ Error loading market summary: {e}")
+            return None
+    
+    def _process_market_summary(self, response: dict) -> list:
+        """
+        Transform a market summary response into price symbol data.
+        
+        Args:
+            response (dict): Market summary response
+            
+        Returns:
+            list: List of price symbol data for the template
+        """
+        price_symbols = []
+        for company in response["marketSummaryResponse"]["result"]:
+            try:
+                symbol_data = self._process_company_data(company)
+                if symbol_data:
+                    price_symbols.append(symbol_data)
+                    
+            except Exception as e:
+                logger.error(f"❌ Error processing company data: {e}")
+                continue
+        return price_symbols
+    
+    def _cached_market_summary(self) -> list:
+        """Price symbols from the last market summary in cache, whatever its age (fallback)"""
+        response = self.market_data.get_last_market_summary()
+        if response is None:
+            return []
+        try:
+            return self._process_market_summary(response)
+        except Exception as e:
+            logger.error(f"❌ Error processing cached market summary: {e}")
             return []
     
 
@@ -195,29 +308,25 @@ class PdfReportGenerator:
     
     def _generate_html_report(self, template: str, news_data: list, prices_data: list, report_time: str = 'auto') -> str:
         """
-        Merge news data, price symbols, and theme into the HTML template.
+        Render news data, price symbols, and theme into static HTML (no script left to run).
         
         Args:
-            template (str): HTML template content
+            template (str): HTML template content (stylesheets inlined)
             news_data (list): List of news items
             prices_data (list): List of price symbol data
             report_time (str): Theme preference
             
         Returns:
-            str: Merged HTML content or None if failed
+            str: Rendered HTML content or None if failed
         """
         try:
-            # Convert data to JSON strings for JavaScript
-            news_json = json.dumps(news_data, ensure_ascii=False, indent=2)
-            price_symbols_json = json.dumps(prices_data or [], ensure_ascii=False, indent=2)
-            
             # Determine theme
             theme = self._determine_theme(report_time)
+            generated_at = datetime.now(pytz.timezone(Config.TIMEZONES.APP_TIMEZONE)).strftime('%d/%m/%Y %H:%M')
             
-            # Replace placeholders in template
-            html_content = template.replace('{{NEWS_DATA}}', news_json)
-            html_content = html_content.replace('{{PRICE_SYMBOLS}}', price_symbols_json)
-            html_content = html_content.replace('{{REPORT_TIME}}', theme)
+            # Fill the compiled template (compiled once per template version). The generation time
+            # is part of the rendered PDF, a cached PDF keeps the time its content was rendered
+            html_content = compile_report_template(template).render(news_data, prices_data, theme, generated_at)
             
             logger.info(f"✅ Successfully merged {len(news_data)} news items and {len(prices_data or [])} price symbols with {theme} theme")
             return html_content
@@ -227,104 +336,351 @@ class PdfReportGenerator:
             return None
  
     
-    async def _convert_html_to_pdf(self, html_file_path: str, pdf_file_path: str) -> bool:
+    async def _render_pdf(self, html_content: str, pdf_file_path: str = None) -> bytes:
         """
-        Convert HTML file to PDF using Playwright.
+        Render HTML to PDF in a page of the pooled browser, straight from memory.
+        
+        The html must be self-contained and static (stylesheets inlined, no script),
+        nothing is loaded or run so there is no idle-network wait.
         
         Args:
-            html_file_path (str): Path to the HTML file
-            pdf_file_path (str): Path for the output PDF file
+            html_content (str): Merged HTML content
+            pdf_file_path (str): Also write the PDF to this path (optional)
             
         Returns:
-            bool: True if successful, False otherwise
+            bytes: The PDF, or None if rendering failed
         """
         try:
-            async with async_playwright() as p:
-                # Launch browser
-                browser = await p.chromium.launch()
-                page = await browser.new_page()
-                
-                # Convert file path to file URL
-                file_url = f"file://{os.path.abspath(html_file_path)}"
-                
-                # Navigate to the HTML file
-                await page.goto(file_url)
-                
-                # Wait for content to load
-                await page.wait_for_load_state('networkidle')
+            async with self.browser_pool.page(java_script_enabled=False) as page:
+                # static html with inlined styles, there is nothing to load or run
+                await page.set_content(html_content, wait_until='load')
                 
                 # Generate PDF with RTL support and better page break handling
-                await page.pdf(
+                pdf_bytes = await page.pdf(
                     path=pdf_file_path,
                     format='A4',
                     print_background=True,
                     prefer_css_page_size=True
                 )
-                
-                await browser.close()
             
-            logger.info(f"✅ Successfully converted HTML to PDF: {pdf_file_path}")
-            return True
+            logger.info(f"✅ Successfully rendered PDF ({len(pdf_bytes) / 1024:.0f}KB) {pdf_file_path or 'in memory'}")
+            return pdf_bytes
             
         except Exception as e:
-            logger.error(f"❌ Error converting HTML to PDF: {e}")
-            return False
+            logger.error(f"❌ Error rendering PDF: {e}")
+            return None
+    
+    async def _run_stage(self, name: str, coro, fallback=None, label: str = None):
+        """
+        Run a report stage with its deadline and record its timing.
+        
+        Args:
+            name (str): Stage name (key of STAGE_TIMEOUTS)
+            coro: Stage coroutine, returning None means the stage failed
+            fallback (callable): Called for a replacement value if the stage failed or timed out
+            label (str): Name of the timing entry (default: the stage name)
+            
+        Returns:
+            The stage result, the fallback value, or None
+        """
+        started = time.perf_counter()
+        status = 'ok'
+        try:
+            result = await asyncio.wait_for(coro, self.stage_timeouts[name])
+            if result is None:
+                status = 'failed'
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ Report stage '{name}' timed out after {self.stage_timeouts[name]}s")
+            status, result = 'timeout', None
+        except Exception as e:
+            logger.error(f"❌ Report stage '{name}' failed: {e}")
+            status, result = 'error', None
+        
+        if result is None and fallback is not None:
+            result = fallback()
+            status += ' (fallback)'
+        self.last_stage_timings[label or name] = {'seconds': round(time.perf_counter() - started, 3), 'status': status}
+        return result
+    
+    async def _load_news_since_draft(self, draft: ReportDraft) -> list:
+        """The draft news followed by the news posted since the draft"""
+        news_update = await self._load_news_data(draft.hours_back, after=draft.cutoff, prompt_file=NEWS_UPDATE_PROMPT)
+        if news_update is None:
+            logger.warning("⚠️ Could not load the news since the draft, using the draft news only")
+            news_update = []
+        logger.info(f"✅ Appended {len(news_update)} news items to the {len(draft.news_data)} of the draft")
+        return list(draft.news_data) + news_update
+    
+    async def _gather_report_data(self, hours_back_values: list[int], news_loader=None, news_fallback=None,
+                                  fresh_prices: bool = False) -> tuple:
+        """
+        Load the news (once per look-back), prices and template concurrently.
+        
+        Args:
+            hours_back_values (list[int]): Look-back periods of the news
+            news_loader: Coroutine function hours_back -> news list (default: _load_news_data)
+            news_fallback: Function returning the news used when loading fails (default: NEWS_UNAVAILABLE)
+            fresh_prices (bool): Reload the prices instead of serving the cached copy (the cached one is the fallback)
+        
+        Returns:
+            tuple: ({hours_back: news list}, price symbols, inlined template or None)
+        """
+        news_loader = news_loader or self._load_news_data
+        news_fallback = news_fallback or (lambda: list(self.NEWS_UNAVAILABLE))
+        hours_back_values = list(dict.fromkeys(hours_back_values))
+        # independent stages, the slowest one sets the pace
+        results = await asyncio.gather(
+            self._run_stage('prices', self._load_market_summary(fresh_prices), self._cached_market_summary),
+            self._run_stage('template', asyncio.to_thread(get_template_cache().get, self.template_file)),
+            *[
+                self._run_stage('news', news_loader(hours_back), news_fallback,
+                                label='news' if len(hours_back_values) == 1 else f'news:{hours_back}h')
+                for hours_back in hours_back_values
+            ]
+        )
+        prices_data, template, news_lists = results[0], results[1], results[2:]
+        if not prices_data:
+            logger.warning("⚠️ No market data loaded, continuing with empty price list")
+        if template is None:
+            logger.error(f"❌ Error loading HTML template: {self.template_file}")
+        news_by_hours = dict(zip(hours_back_values, news_lists))
+        for hours_back, news_data in news_by_hours.items():
+            if not news_data:
+                logger.warning(f"⚠️ No news data loaded for the last {hours_back}h, continuing with empty news list")
+        return news_by_hours, prices_data, template
+    
+    async def _produce_report(self, key: str, news_data: list, prices_data: list, template: str,
+                              report_time: str, use_cache: bool, label: str = 'render') -> tuple:
+        """
+        Get the PDF of a report from the cache or render it in its own page.
+        
+        Returns:
+            tuple: (PDF bytes or None, True if it came from the cache)
+        """
+        cached = await self.report_cache.aget(key) if use_cache else None
+        if cached is not None:
+            return cached.pdf_bytes, True
+        
+        html_content = self._generate_html_report(template, news_data, prices_data, report_time)
+        if not html_content:
+            logger.error("❌ Failed to generate HTML content")
+            return None, False
+        
+        pdf_bytes = await self._run_stage('render', self._render_pdf(html_content), label=label)
+        if pdf_bytes is not None:
+            await self.report_cache.aput(key, pdf_bytes)
+        return pdf_bytes, False
+    
+    def _log_stage_timings(self, started: float, ok: bool):
+        self.last_stage_timings['total'] = {
+            'seconds': round(time.perf_counter() - started, 3),
+            'status': 'ok' if ok else 'failed'
+        }
+        logger.info("⏱️ Report stages: " + ", ".join(
+            f"{name} {timing['seconds']:.2f}s ({timing['status']})" for name, timing in self.last_stage_timings.items()
+        ))
+    
+    async def prepare_report(self, report_time: str = 'auto', hours_back: int = 24,
+                             draft: ReportDraft = None) -> PreparedReport:
+        """
+        Load the news, prices and template of a report concurrently, without rendering it.
+        
+        The data can be published right away (e.g. as Discord embeds) while the PDF
+        is rendered with render_prepared().
+        
+        Args:
+            report_time (str): Theme preference ('morning', 'evening', 'auto')
+            hours_back (int): Number of hours to look back for news
+            draft (ReportDraft): News summarized ahead of time, only the news posted since it are loaded
+            
+        Returns:
+            PreparedReport: The report data (template is None if it could not be loaded)
+        """
+        started = time.perf_counter()
+        self.last_stage_timings = {}
+        self.last_report_key = None
+        self.last_report_cached = False
+        
+        news_loader = news_fallback = None
+        if draft is not None:
+            news_loader = lambda _: self._load_news_since_draft(draft)
+            news_fallback = lambda: list(draft.news_data)
+        # the market data cache may still hold the prices the draft loaded minutes ago
+        news_by_hours, prices_data, template = await self._gather_report_data(
+            [hours_back], news_loader, news_fallback, fresh_prices=draft is not None
+        )
+        return self._new_prepared(report_time, news_by_hours[hours_back], prices_data, template, started)
+    
+    def _new_prepared(self, report_time: str, news_data: list, prices_data: list, template: str,
+                      started: float) -> PreparedReport:
+        prepared = PreparedReport(report_time, self._determine_theme(report_time), news_data,
+                                  prices_data or [], template, started=started)
+        if template is not None:
+            prepared.key = self.last_report_key = report_key(
+                prepared.news_data, prepared.prices_data, prepared.theme, template
+            )
+        return prepared
+    
+    async def prepare_draft(self, report_time: str, hours_back: int, fire_time: datetime) -> ReportDraft:
+        """
+        Get a scheduled report ready ahead of its fire time.
+        
+        Summarizes the news of the report window posted so far, warms the browser
+        and the market data, and renders the draft (an unchanged report at fire time
+        is then a cache hit). At fire time prepare_report(draft=...) only summarizes
+        the news posted since the draft and reloads the prices from Yahoo, bypassing
+        the market data cache (its last copy is only the fallback of a failed load).
+        
+        The generation time printed in a PDF is when it was rendered: a report served
+        from the draft render (or any cached render) shows when its content was built,
+        not when it was published.
+        
+        Args:
+            report_time (str): Theme preference ('morning', 'evening', 'auto')
+            hours_back (int): Number of hours the report looks back from its fire time
+            fire_time (datetime): When the report is published (timezone aware)
+            
+        Returns:
+            ReportDraft: The draft, or None if the news could not be summarized
+        """
+        logger.info(f"📝 Preparing {report_time} report draft ahead of {fire_time:%H:%M}...")
+        started = time.perf_counter()
+        self.last_stage_timings = {}
+        window_start = fire_time.astimezone(timezone.utc) - timedelta(hours=hours_back)
+        cutoff = datetime.now(timezone.utc)
+        
+        (news_by_hours, prices_data, template), _ = await asyncio.gather(
+            self._gather_report_data(
+                [hours_back],
+                news_loader=lambda hours: self._load_news_data(hours, after=window_start, before=cutoff),
+                news_fallback=lambda: None
+            ),
+            self.browser_pool.warmup()
+        )
+        news_data = news_by_hours[hours_back]
+        if news_data is None:
+            logger.error(f"❌ Could not prepare the {report_time} report draft")
+            return None
+        
+        draft = ReportDraft(report_time, hours_back, news_data, window_start, cutoff, time.time())
+        if template is not None:
+            await self.render_prepared(self._new_prepared(report_time, news_data, prices_data, template, started))
+        logger.info(f"✅ {report_time.capitalize()} report draft ready with {len(news_data)} news items "
+                    f"in {time.perf_counter() - started:.2f}s")
+        return draft
+    
+    async def render_prepared(self, prepared: PreparedReport, output_pdf: str = None, use_cache: bool = True) -> bytes:
+        """
+        Render the PDF of a prepared report (or reuse the PDF of identical inputs).
+        
+        Args:
+            prepared (PreparedReport): Report data from prepare_report()
+            output_pdf (str): Also write the PDF to this path
+            use_cache (bool): Reuse the PDF of a report with the same content
+            
+        Returns:
+            bytes: The PDF, or None if failed
+        """
+        pdf_bytes = None
+        if prepared.template is not None:
+            pdf_bytes, self.last_report_cached = await self._produce_report(
+                prepared.key, prepared.news_data, prepared.prices_data, prepared.template,
+                prepared.report_time, use_cache
+            )
+            if pdf_bytes is not None and output_pdf:
+                write_binary_file(output_pdf, pdf_bytes)
+        
+        self._log_stage_timings(prepared.started or time.perf_counter(), pdf_bytes is not None)
+        return pdf_bytes
+    
+    async def _build_report_pdf(self, report_time: str, hours_back: int, output_pdf: str = None,
+                                use_cache: bool = True, draft: ReportDraft = None) -> bytes:
+        """Load the report data concurrently, merge it into the inlined template and render it (or reuse it)"""
+        logger.info("🚀 Starting PDF report generation...")
+        
+        # Step 1: Load news (only since the draft, if any), prices and template concurrently
+        prepared = await self.prepare_report(report_time, hours_back, draft)
+        if prepared.template is None:
+            return None
+        
+        # Step 2: Reuse the PDF of identical inputs (rerun, retry), or merge and render it
+        return await self.render_prepared(prepared, output_pdf, use_cache)
+    
+    async def render_batch(self, specs: list[ReportSpec], use_cache: bool = True) -> list[ReportResult]:
+        """
+        Render several report variants in one go.
+        
+        The data is loaded once (news once per look-back period) and every variant is
+        rendered concurrently in its own page and browser context of the pooled
+        browser. Variants with the same content are rendered once.
+        
+        Args:
+            specs (list[ReportSpec]): Reports to produce
+            use_cache (bool): Reuse the PDFs of reports with the same content
+            
+        Returns:
+            list[ReportResult]: One result per spec, in the same order
+        """
+        logger.info(f"🚀 Starting batch of {len(specs)} PDF reports...")
+        started = time.perf_counter()
+        self.last_stage_timings = {}
+        
+        news_by_hours, prices_data, template = await self._gather_report_data([spec.hours_back for spec in specs])
+        if template is None:
+            return [ReportResult(spec, error="template unavailable") for spec in specs]
+        
+        # one render per distinct content
+        jobs = {}
+        spec_keys = []
+        for index, spec in enumerate(specs):
+            news_data = news_by_hours[spec.hours_back]
+            key = report_key(news_data, prices_data, self._determine_theme(spec.report_time), template)
+            spec_keys.append(key)
+            if key not in jobs:
+                jobs[key] = asyncio.ensure_future(self._produce_report(
+                    key, news_data, prices_data, template, spec.report_time, use_cache,
+                    label=f"render:{spec.name or index}"
+                ))
+        await asyncio.gather(*jobs.values(), return_exceptions=True)
+        
+        results = []
+        for spec, key in zip(specs, spec_keys):
+            job = jobs[key]
+            if job.exception() is not None:
+                results.append(ReportResult(spec, key=key, error=str(job.exception())))
+                continue
+            pdf_bytes, cached = job.result()
+            if pdf_bytes is not None and spec.output_pdf:
+                write_binary_file(spec.output_pdf, pdf_bytes)
+            results.append(ReportResult(spec, pdf_bytes, key, cached, None if pdf_bytes else "render failed"))
+        
+        produced = [job.result() for job in jobs.values() if job.exception() is None]
+        rendered = sum(1 for pdf_bytes, cached in produced if pdf_bytes is not None and not cached)
+        self._log_stage_timings(started, all(result.ok for result in results))
+        logger.info(f"🎉 Batch done: {sum(result.ok for result in results)}/{len(specs)} reports, "
+                    f"{rendered} rendered, {len(specs) - len(jobs)} shared")
+        return results
     
     async def generate_pdf_report(self, output_pdf: str = "news_pdf/output.pdf", report_time: str = 'auto', 
-                                hours_back: int = 24) -> bool:
+                                hours_back: int = 24, use_cache: bool = True, draft: ReportDraft = None) -> bool:
         """
         Generate a complete PDF report from news data with price symbols.
         This is the main method for generating reports.
         
         Args:
-            output_html (str): Path for the output HTML file
             output_pdf (str): Path for the output PDF file
             report_time (str): Theme preference ('morning', 'evening', 'auto')
             hours_back (int): Number of hours to look back for news
+            use_cache (bool): Reuse the PDF of a report with the same content
+            draft (ReportDraft): Draft from prepare_draft(), only the news posted since it are summarized
             
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            logger.info("🚀 Starting PDF report generation...")
-            
-            # Step 1: Load news data
-            news_data = await self._load_news_data(hours_back)
-            if not news_data:
-                logger.warning("⚠️ No news data loaded, continuing with empty news list")
-            
-            # Step 2: Load market summary data
-            prices_data = await self._load_market_summary()
-            if not prices_data:
-                logger.warning("⚠️ No market data loaded, continuing with empty price list")
-            
-            # Step 3: Load HTML template
-            try:
-                template = read_text_file(self.template_file)
-                logger.info("✅ HTML template loaded successfully")
-            except Exception as e:
-                logger.error(f"❌ Error loading HTML template: {e}")
-                return False
-            
-            # Step 4: Generate HTML content
-            html_content = self._generate_html_report(template, news_data, prices_data, report_time)
-            if not html_content:
-                logger.error("❌ Failed to generate HTML content")
-                return False
-            
-            # Step 5: Save HTML file
-            try:
-                html_file_path = "news_pdf/output.html"
-                write_text_file(html_file_path, html_content)
-                logger.info(f"✅ HTML file saved: {html_file_path}")
-            except Exception as e:
-                logger.error(f"❌ Error saving HTML file: {e}")
-                return False
-            
-            # Step 6: Convert to PDF
-            pdf_success = await self._convert_html_to_pdf(html_file_path, output_pdf)
-            if not pdf_success:
-                logger.error("❌ Failed to convert HTML to PDF")
+            pdf_bytes = await self._build_report_pdf(report_time, hours_back, output_pdf, use_cache, draft)
+            if pdf_bytes is None:
+                logger.error("❌ Failed to render PDF report")
                 return False
             
             logger.info(f"🎉 PDF report generated successfully: {output_pdf}")
@@ -334,3 +690,25 @@ class PdfReportGenerator:
             logger.error(f"❌ Error generating PDF report: {e}")
             return False
     
+    async def generate_pdf_bytes(self, report_time: str = 'auto', hours_back: int = 24, use_cache: bool = True) -> bytes:
+        """
+        Generate the PDF report in memory, without writing any file.
+        
+        Args:
+            report_time (str): Theme preference ('morning', 'evening', 'auto')
+            hours_back (int): Number of hours to look back for news
+            use_cache (bool): Reuse the PDF of a report with the same content
+            
+        Returns:
+            bytes: The PDF, or None if failed
+        """
+        try:
+            pdf_bytes = await self._build_report_pdf(report_time, hours_back, use_cache=use_cache)
+            if pdf_bytes is not None:
+                logger.info(f"🎉 PDF report generated in memory ({len(pdf_bytes) / 1024:.0f}KB)")
+            return pdf_bytes
+            
+        except Exception as e:
+            logger.error(f"❌ Error generating PDF report: {e}")
+            return None
+    
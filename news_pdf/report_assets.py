@@ -0,0 +1,131 @@
+"""
+Self-contained report templates.
+
+The stylesheets linked by the template (and any fonts or images they reference
+with url()) are inlined, so the page can be rendered from a string with
+set_content: Chromium never touches the disk or waits for the network.
+"""
+
+import base64
+import mimetypes
+import os
+import re
+import threading
+from utils.logger import logger
+from utils.read_write import read_text_file
+
+
+LINK_STYLESHEET_RE = re.compile(r'<link\s+([^>]*?)rel="stylesheet"([^>]*)>', re.IGNORECASE)
+HREF_RE = re.compile(r'href="([^"]+)"')
+ID_RE = re.compile(r'id="([^"]+)"')
+CSS_URL_RE = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+
+def _data_uri(file_path: str) -> str:
+    mime_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+    with open(file_path, "rb") as f:
+        return f"data:{mime_type};base64,{base64.b64encode(f.read()).decode('ascii')}"
+
+
+def inline_css_urls(css: str, base_dir: str) -> str:
+    """Replace url() references to local files (fonts, images) with data URIs"""
+    def replace(match):
+        url = match.group(2)
+        if url.startswith(("data:", "http:", "https:", "#")):
+            return match.group(0)
+        file_path = os.path.join(base_dir, url)
+        if not os.path.exists(file_path):
+            logger.warning(f"⚠️ Stylesheet asset not found: {file_path}")
+            return match.group(0)
+        return f'url("{_data_uri(file_path)}")'
+
+    return CSS_URL_RE.sub(replace, css)
+
+
+def inline_stylesheets(html: str, base_dir: str) -> tuple[str, list[str]]:
+    """
+    Replace the <link rel="stylesheet"> tags of a page with <style> tags
+
+    The id of the link is kept, so scripts that toggle the theme stylesheets by id
+    keep working on the <style> elements.
+
+    Args:
+        html (str): Page html
+        base_dir (str): Directory the stylesheet hrefs are relative to
+
+    Returns:
+        tuple[str, list[str]]: Inlined html and the paths of the inlined files
+    """
+    files = []
+
+    def replace(match):
+        attributes = match.group(1) + match.group(2)
+        href = HREF_RE.search(attributes)
+        if href is None or href.group(1).startswith(("http:", "https:")):
+            return match.group(0)
+        css_path = os.path.join(base_dir, href.group(1))
+        css = read_text_file(css_path)
+        if css is None:
+            return match.group(0)
+        files.append(css_path)
+        css = inline_css_urls(css, os.path.dirname(css_path))
+        style_id = ID_RE.search(attributes)
+        id_attribute = f' id="{style_id.group(1)}"' if style_id else ""
+        return f"<style{id_attribute}>\n{css}\n</style>"
+
+    return LINK_STYLESHEET_RE.sub(replace, html), files
+
+
+class InlinedTemplateCache:
+    """Inlined templates kept in memory, rebuilt when the template or a stylesheet changes"""
+
+    def __init__(self):
+        self._templates = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _mtimes(paths: list[str]) -> tuple:
+        return tuple(os.path.getmtime(path) if os.path.exists(path) else None for path in paths)
+
+    def get(self, template_path: str) -> str:
+        """
+        Get the self-contained template
+
+        Args:
+            template_path (str): Path of the html template
+
+        Returns:
+            str: Template with its stylesheets inlined, or None if it can't be read
+        """
+        with self._lock:
+            cached = self._templates.get(template_path)
+            if cached is not None:
+                html, paths, mtimes = cached
+                if self._mtimes(paths) == mtimes:
+                    return html
+
+            template = read_text_file(template_path)
+            if template is None:
+                return None
+            html, css_paths = inline_stylesheets(template, os.path.dirname(template_path))
+            paths = [template_path] + css_paths
+            self._templates[template_path] = (html, paths, self._mtimes(paths))
+            logger.debug(f"Inlined {len(css_paths)} stylesheets into {template_path}")
+            return html
+
+
+# Global template cache instance
+_template_cache = None
+
+
+def get_template_cache():
+    """
+    Get or create the global inlined template cache
+
+    Returns:
+        InlinedTemplateCache: Global template cache instance
+    """
+    global _template_cache
+    if _template_cache is None:
+        _template_cache = InlinedTemplateCache()
+    return _template_cache
@@ -0,0 +1,225 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from utils.logger import logger
+from utils.read_write import read_json_file, write_json_file
+
+
+REPORT_CACHE_DIR = os.path.join("data", "news_pdf", "reports")
+# Discord attachment urls are signed and expire, older uploads are not reused
+ATTACHMENT_MAX_AGE = 12 * 3600
+
+
+def _normalize_news(news_data: list) -> list:
+    """Keep what a news item renders, whitespace-insensitive"""
+    return [
+        {key: " ".join(str(item.get(key) or "").split()) for key in ("time", "link", "message")}
+        for item in news_data or []
+        if isinstance(item, dict)
+    ]
+
+
+def report_key(news_data: list, prices_data: list, theme: str, template: str) -> str:
+    """
+    Content hash of a report
+
+    Args:
+        news_data (list): News items
+        prices_data (list): Price symbol data
+        theme (str): Report theme
+        template (str): Template html (its content is the template version)
+
+    Returns:
+        str: Hex digest identifying the rendered PDF
+    """
+    payload = {
+        "news": _normalize_news(news_data),
+        "prices": prices_data or [],
+        "theme": theme,
+        "template": hashlib.sha256(template.encode("utf-8")).hexdigest(),
+    }
+    # stdlib json for a stable key whatever the codec backend
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ReportArtifact:
+    """A rendered report and where it was uploaded"""
+
+    def __init__(self, key: str, pdf_bytes: bytes, created_at: float = None, attachment_url: str = None,
+                 attached_at: float = None):
+        self.key = key
+        self.pdf_bytes = pdf_bytes
+        self.created_at = created_at or time.time()
+        self.attachment_url = attachment_url
+        self.attached_at = attached_at
+
+
+class ReportCache:
+    """
+    Rendered report PDFs keyed by the content hash of their inputs.
+
+    A rerun or retry with the same news, prices, theme and template gets the PDF
+    (and the Discord attachment url of its last upload) back without rendering.
+    PDFs are kept in memory and on disk, so hits survive a restart. The generation
+    time printed in a cached PDF is the time of its render. Use the async methods
+    from the event loop, they do the disk reads and writes in a worker thread.
+    """
+
+    def __init__(self, cache_dir: str = REPORT_CACHE_DIR, max_entries: int = 20):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str): Directory of the cached PDFs and their index
+            max_entries (int): Reports kept, the least recently used are removed first
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.index_file = os.path.join(cache_dir, "index.json")
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "bytes_saved": 0, "attachment_reuses": 0}
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _pdf_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    def _load_index(self):
+        if not os.path.exists(self.index_file):
+            return
+        for entry in read_json_file(self.index_file) or []:
+            if os.path.exists(self._pdf_path(entry["key"])):
+                # bytes are read from disk on the first hit
+                self._entries[entry["key"]] = ReportArtifact(
+                    entry["key"], None, entry.get("created_at"), entry.get("attachment_url"), entry.get("attached_at")
+                )
+
+    def _save_index(self):
+        write_json_file(self.index_file, [
+            {
+                "key": artifact.key,
+                "created_at": artifact.created_at,
+                "attachment_url": artifact.attachment_url,
+                "attached_at": artifact.attached_at,
+            }
+            for artifact in self._entries.values()
+        ])
+
+    def get(self, key: str):
+        """
+        Get a cached report
+
+        Args:
+            key (str): report_key() of the report
+
+        Returns:
+            ReportArtifact: The cached report, or None
+        """
+        with self._lock:
+            artifact = self._entries.get(key)
+            if artifact is not None and artifact.pdf_bytes is None:
+                try:
+                    with open(self._pdf_path(key), "rb") as f:
+                        artifact.pdf_bytes = f.read()
+                except OSError as e:
+                    logger.warning(f"⚠️ Cached report {key[:12]} unreadable, dropping it: {e}")
+                    del self._entries[key]
+                    artifact = None
+            if artifact is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += len(artifact.pdf_bytes)
+            logger.info(f"📦 Report cache hit {key[:12]} ({len(artifact.pdf_bytes) / 1024:.0f}KB)")
+            return artifact
+
+    def put(self, key: str, pdf_bytes: bytes) -> ReportArtifact:
+        """Store a rendered report"""
+        with self._lock:
+            artifact = ReportArtifact(key, pdf_bytes)
+            try:
+                with open(self._pdf_path(key), "wb") as f:
+                    f.write(pdf_bytes)
+            except OSError as e:
+                logger.warning(f"⚠️ Could not write cached report {key[:12]}: {e}")
+            self._entries[key] = artifact
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                try:
+                    os.remove(self._pdf_path(old_key))
+                except OSError:
+                    pass
+            self._save_index()
+            return artifact
+
+    def set_attachment(self, key: str, attachment_url: str):
+        """Remember the Discord attachment a report was uploaded as"""
+        with self._lock:
+            artifact = self._entries.get(key)
+            if artifact is not None:
+                artifact.attachment_url = attachment_url
+                artifact.attached_at = time.time()
+                self._save_index()
+
+    def get_attachment_url(self, key: str, max_age: float = ATTACHMENT_MAX_AGE):
+        """
+        Get the Discord attachment of a cached report, if it is recent enough to reuse
+
+        Args:
+            key (str): report_key() of the report
+            max_age (float): Maximum age of the upload in seconds
+
+        Returns:
+            str: Attachment url, or None
+        """
+        with self._lock:
+            artifact = self._entries.get(key)
+            if artifact is None or not artifact.attachment_url or time.time() - (artifact.attached_at or 0) > max_age:
+                return None
+            self.stats["attachment_reuses"] += 1
+            return artifact.attachment_url
+
+    async def aget(self, key: str):
+        """Async get, runs in a worker thread (the PDF may be read from disk)"""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key: str, pdf_bytes: bytes) -> ReportArtifact:
+        """Async put, runs in a worker thread"""
+        return await asyncio.to_thread(self.put, key, pdf_bytes)
+
+    async def aset_attachment(self, key: str, attachment_url: str):
+        """Async set_attachment, runs in a worker thread"""
+        await asyncio.to_thread(self.set_attachment, key, attachment_url)
+
+    def get_stats(self) -> dict:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return dict(
+            self.stats,
+            entries=len(self._entries),
+            hit_rate=round(self.stats["hits"] / lookups, 3) if lookups else None,
+        )
+
+
+# Global report cache instance
+_report_cache = None
+
+
+def get_report_cache():
+    """
+    Get or create the global report cache
+
+    Returns:
+        ReportCache: Global report cache instance
+    """
+    global _report_cache
+    if _report_cache is None:
+        _report_cache = ReportCache()
+    return _report_cache
@@ -83,6 +83,14 @@ class DiscordScheduler:
         except Exception as e:
             logger.error(f"Error sending dev alert: {e}")
     
+    async def send_breaker_alert(self, breaker, old_state, new_state):
+        """Health registry subscriber - report circuit breaker transitions to the dev channel"""
+        colors = {"open": 0xff0000, "half_open": 0xffa500, "closed": 0x00ff00}
+        message = f"🔌 **{breaker.host}**: {old_state} → {new_state}"
+        if new_state == "open":
+            message += f"\nRequests paused for {breaker.retry_after():.0f}s after {breaker.consecutive_failures} consecutive failures"
+        await self.send_dev_alert(message, colors.get(str(new_state), 0x00ff00), "🔌 Circuit Breaker")
+    
     def add_cron_job(self, 
                      func: Callable, 
                      cron_expression: str, 
@@ -8,11 +8,14 @@ from utils.logger import logger
 from .discord_scheduler import DiscordScheduler
 
 from .tasks.news_report import (
+    morning_news_draft_task,
     morning_news_report_task,
+    evening_news_draft_task,
     evening_news_report_task
 )
 from .tasks.economic_calendar_tasks import get_economic_calendar_task
 from .tasks.weekly_tasks import weekly_backup_task
+from .tasks.health_tasks import health_report_task
 from time import time
 from config import Config
 
@@ -46,6 +49,13 @@ class TaskDefinitions:
     def _setup_daily_tasks(self):
         """Setup daily recurring tasks"""
         
+        # Morning news report draft (15:55 daily), the report only adds the last minutes
+        self.discord_scheduler.add_cron_job(
+            func=lambda: morning_news_draft_task(self.discord_scheduler),
+            cron_expression="55 15 * * *",  # 3:55 PM daily
+            job_id="morning_news_draft"
+        )
+        
         # Morning news report (16:00 daily)
         self.discord_scheduler.add_cron_job(
             func=lambda: morning_news_report_task(self.discord_scheduler),
@@ -53,6 +63,13 @@ class TaskDefinitions:
             job_id="morning_news_report"
         )
         
+        # Evening news report draft (22:55 daily)
+        self.discord_scheduler.add_cron_job(
+            func=lambda: evening_news_draft_task(self.discord_scheduler),
+            cron_expression="55 22 * * *",  # 10:55 PM daily
+            job_id="evening_news_draft"
+        )
+        
         # Evening news report (23:00 daily)
         self.discord_scheduler.add_cron_job(
             func=lambda: evening_news_report_task(self.discord_scheduler),
@@ -60,6 +77,14 @@ class TaskDefinitions:
             job_id="evening_news_report"
         )
         
+        # Upstream health log (breakers and HTTP pools, every 15 minutes)
+        self.discord_scheduler.add_interval_job(
+            func=lambda: health_report_task(self.discord_scheduler),
+            job_id="health_report",
+            seconds=15 * 60,
+            send_alert=False
+        )
+        
         # Economic calendar check (8:00 AM weekdays)
         self.discord_scheduler.add_cron_job(
             func=lambda: get_economic_calendar_task(self.discord_scheduler),
@@ -3,7 +3,9 @@ Individual Task Functions - Easy to test and edit independently
 """
 
 from .news_report import (
+    morning_news_draft_task,
     morning_news_report_task,
+    evening_news_draft_task,
     evening_news_report_task
 )
 
@@ -17,9 +19,15 @@ from .weekly_tasks import (
     weekly_backup_task
 )
 
+from .health_tasks import (
+    health_report_task
+)
+
 __all__ = [
     # Daily tasks
+    'morning_news_draft_task',
     'morning_news_report_task',
+    'evening_news_draft_task',
     'evening_news_report_task',
     
     # Economic calendar tasks
@@ -29,4 +37,7 @@ __all__ = [
     
     # Weekly tasks
     'weekly_backup_task',
+    
+    # Health tasks
+    'health_report_task',
 ] 
\ No newline at end of file
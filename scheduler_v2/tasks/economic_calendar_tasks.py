@@ -7,36 +7,121 @@ from datetime import datetime, timedelta
 from typing import List, Set
 import pandas as pd
 from utils.logger import logger
-from investing_scraper.InvestingDataScraper import InvestingDataScraper
+from investing_scraper.InvestingDataScraper import get_investing_scraper
 from investing_scraper.investing_variables import InvestingVariables
+from investing_scraper.calendar_tracker import CalendarStateTracker, ChangeType
+from investing_scraper.calendar_store import get_calendar_store, normalize_event_date
 from config import Config
 import pytz
 
 
+# Change types that are worth a post-event update
+UPDATE_CHANGE_TYPES = {
+    ChangeType.ACTUAL_PUBLISHED,
+    ChangeType.ACTUAL_REVISED,
+    ChangeType.FORECAST_REVISED,
+    ChangeType.PREVIOUS_REVISED,
+}
+
+# Global economic calendar tracker instance
+_economic_calendar_tracker = None
+
+# Changed events not reported yet, by event day and time {(YYYY-MM-DD, time_str): {event_key: event}}
+_pending_updates = {}
+
+
+def _today() -> str:
+    return datetime.now(pytz.timezone(Config.TIMEZONES.APP_TIMEZONE)).date().isoformat()
+
+
+def _pending_key(event: dict) -> tuple:
+    """Pending update bucket of an event, (day, time) - the tracker fetches today's calendar"""
+    return normalize_event_date(event.get('date')) or _today(), event.get('time')
+
+
+async def fetch_today_economic_events():
+    """Fetch today's medium and high importance US economic events"""
+    scraper = get_investing_scraper()
+    return await scraper.get_calendar(
+        calendar_name=InvestingVariables.CALENDARS.ECONOMIC_CALENDAR,
+        current_tab=InvestingVariables.TIME_RANGES.TODAY,
+        importance=[
+            InvestingVariables.IMPORTANCE.HIGH,
+            InvestingVariables.IMPORTANCE.MEDIUM
+        ],
+        countries=[InvestingVariables.COUNTRIES.UNITED_STATES],
+        time_zone=pytz.timezone(Config.TIMEZONES.APP_TIMEZONE)
+    )
+
+
+def get_economic_calendar_tracker():
+    """
+    Get or create the global economic calendar tracker instance
+    
+    Returns:
+        CalendarStateTracker: Global tracker of today's economic calendar
+    """
+    global _economic_calendar_tracker
+    if _economic_calendar_tracker is None:
+        _economic_calendar_tracker = CalendarStateTracker(
+            InvestingVariables.CALENDARS.ECONOMIC_CALENDAR,
+            fetch_today_economic_events
+        )
+        _economic_calendar_tracker.subscribe(collect_update_changes)
+        _economic_calendar_tracker.subscribe(persist_calendar_changes)
+    return _economic_calendar_tracker
+
+
+async def collect_update_changes(changes):
+    """Tracker subscriber - keep changed events until their post-event update reports them"""
+    # changes of past days were not picked up by their update, don't post them with today's events
+    today = _today()
+    for day, time_str in [key for key in _pending_updates if key[0] < today]:
+        dropped = _pending_updates.pop((day, time_str))
+        logger.debug(f"Dropped {len(dropped)} unreported economic event changes of {day} {time_str}")
+    
+    for change in changes:
+        if change.change_type in UPDATE_CHANGE_TYPES:
+            _pending_updates.setdefault(_pending_key(change.event), {})[change.key] = change.event
+
+
+async def persist_calendar_changes(changes):
+    """Tracker subscriber - save the added and changed events (not every refresh) to the calendar store"""
+    changed_events = {change.key: change.event for change in changes if change.change_type != ChangeType.EVENT_REMOVED}
+    if changed_events:
+        saved = await get_calendar_store().aupsert(InvestingVariables.CALENDARS.ECONOMIC_CALENDAR, changed_events)
+        logger.debug(f"Saved {saved} changed economic calendar events")
+
+
 async def get_economic_calendar_task(discord_scheduler=None):
     """Get economic calendar and schedule alerts for unique times"""
     try:
         logger.info("📊 Fetching economic calendar...")
         
-        # Get calendar data using InvestingDataScraper
-        scraper = InvestingDataScraper()
-        calendar_data = await scraper.get_calendar(
-            calendar_name=InvestingVariables.CALENDARS.ECONOMIC_CALENDAR,
-            current_tab=InvestingVariables.TIME_RANGES.TODAY,
-            importance=[
-                InvestingVariables.IMPORTANCE.HIGH,
-                InvestingVariables.IMPORTANCE.MEDIUM
-            ],
-            countries=[InvestingVariables.COUNTRIES.UNITED_STATES],
-            time_zone=pytz.timezone(Config.TIMEZONES.APP_TIMEZONE)
-        )
+        # Don't spend requests while investing.com is blocking us, try again when the breaker allows it
+        scraper = get_investing_scraper()
+        if not scraper.is_available():
+            defer_seconds = max(scraper.retry_after(), 30)
+            logger.warning(f"⚠️ investing.com circuit breaker is open, deferring economic calendar by {defer_seconds:.0f}s")
+            if discord_scheduler:
+                discord_scheduler.add_date_job(
+                    func=get_economic_calendar_task,
+                    run_date=datetime.now(discord_scheduler.timezone) + timedelta(seconds=defer_seconds),
+                    job_id="deferred_economic_calendar",
+                    args=(discord_scheduler,),
+                    send_alert=False
+                )
+            return
         
-        if not calendar_data:
+        # Refresh the shared calendar snapshot (post-event updates diff against it)
+        tracker = get_economic_calendar_tracker()
+        await tracker.refresh()
+        today_events = tracker.get_events()
+        
+        if not today_events:
             logger.warning("⚠️ No economic calendar data received")
             return
         
-        today_events = calendar_data
-        
         # Send initial summary to alert channel (not dev)
         if discord_scheduler:
             await send_initial_calendar_summary_to_alert(discord_scheduler, today_events)
@@ -200,34 +285,36 @@ async def economic_warning_task(time_str: str, time_events, discord_scheduler=No
             )
 
 
-async def economic_update_task(time_str: str, discord_scheduler=None):
-    """Send post-event update for economic events"""
+async def economic_update_task(time_str: str, discord_scheduler=None, max_attempts: int = 3, retry_delay: int = 30):
+    """
+    Send post-event update for economic events.
+    Only events at time_str whose actual/forecast/previous changed since they were
+    last reported are sent. If the actuals are not published yet, retry a few times.
+    """
     try:
         logger.info(f"📊 Sending post-event update for {time_str}")
+        tracker = get_economic_calendar_tracker()
+        scraper = get_investing_scraper()
         
-        # Fetch updated calendar data
-        scraper = InvestingDataScraper()
-        calendar_data = await scraper.get_calendar(
-            calendar_name=InvestingVariables.CALENDARS.ECONOMIC_CALENDAR,
-            current_tab=InvestingVariables.TIME_RANGES.TODAY,
-            importance=[
-                InvestingVariables.IMPORTANCE.HIGH,
-                InvestingVariables.IMPORTANCE.MEDIUM
-            ],
-            countries=[InvestingVariables.COUNTRIES.UNITED_STATES],
-            time_zone=pytz.timezone(Config.TIMEZONES.APP_TIMEZONE)
-        )
-        
-        if not calendar_data:
-            logger.warning("⚠️ No economic calendar data for update")
-            return
-        
-        # Get today's events
-        today_key = list(calendar_data.keys())[0]
-        today_events = calendar_data[today_key]
+        for attempt in range(1, max_attempts + 1):
+            if not scraper.is_available():
+                if attempt == max_attempts:
+                    break
+                defer_seconds = max(scraper.retry_after(), retry_delay)
+                logger.warning(f"⚠️ investing.com circuit breaker is open, deferring update for {time_str} by {defer_seconds:.0f}s")
+                await asyncio.sleep(defer_seconds)
+                continue
+            
+            # Diff the updated calendar against the last snapshot (collected by the subscriber)
+            await tracker.refresh()
+            
+            missing_actual = [event for event in tracker.get_events(time_str) if not event.get('actual')]
+            if not missing_actual or attempt == max_attempts:
+                break
+            logger.debug(f"📊 {len(missing_actual)} events at {time_str} still without actual, retrying in {retry_delay}s")
+            await asyncio.sleep(retry_delay)
         
-        # Filter events for the specific time
-        time_events = [event for event in today_events if event.get('time') == time_str]
+        time_events = list(_pending_updates.pop((_today(), time_str), {}).values())
         
         if time_events and discord_scheduler:
             # Convert to DataFrame and then to CSV
@@ -251,7 +338,7 @@ async def economic_update_task(time_str: str, discord_scheduler=None):
             await discord_scheduler.send_alert(update_msg, 0x00ff00, "📊 Economic Events Update")
             logger.info(f"📊 Post-event update sent for {len(time_events)} events at {time_str}")
         else:
-            logger.info(f"📊 No events found for time {time_str}")
+            logger.info(f"📊 No changed events found for time {time_str}")
             
     except Exception as e:
         logger.error(f"❌ Error in economic update task for {time_str}: {e}")
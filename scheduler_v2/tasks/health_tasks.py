@@ -0,0 +1,14 @@
+"""
+Health Task Functions - periodic upstream health log
+"""
+
+from utils.logger import logger
+from utils.health_report import log_health_report
+
+
+async def health_report_task(discord_scheduler=None):
+    """Health report task - logs breaker and HTTP pool stats every 15 minutes"""
+    try:
+        log_health_report()
+    except Exception as e:
+        logger.error(f"❌ Error in health report: {e}")
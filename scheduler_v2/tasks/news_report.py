@@ -3,44 +3,194 @@ Daily Task Functions - News Reports
 """
 
 import asyncio
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from utils.logger import logger
-from news_pdf.pdf_report_generator import PdfReportGenerator
+from news_pdf.pdf_report_generator import PdfReportGenerator, ReportDraft
 from discord_utils.send_pdf import send_pdf
+from discord_utils.report_embeds import attach_pdf, build_report_embeds, send_report_embeds
 
+# Publish the report data as embeds first and attach the PDF once rendered
+FAST_PATH_REPORTS = True
 
-async def morning_news_report_task(discord_scheduler=None):
+# Post the link of the last upload of an identical cached report instead of uploading it again.
+# Off by default: the link dies when its message is deleted (e.g. by the clean_messages cog)
+REUSE_REPORT_ATTACHMENTS = False
+
+# Draft tasks of the reports {report_time: asyncio.Task -> ReportDraft}, kept while they run
+# so a report that fires before its draft is done waits for it instead of starting over
+_draft_tasks = {}
+# A draft older than this (e.g. its report did not run) is not used
+DRAFT_MAX_AGE = 30 * 60
+# Seconds a report waits for its draft still in flight before building from scratch
+DRAFT_WAIT_TIMEOUT = 120
+
+
+async def _take_draft(report_time: str) -> ReportDraft:
+    """Get (and remove) the draft of a report, waiting for it if still in flight, None if there is no usable draft"""
+    task = _draft_tasks.pop(report_time, None)
+    if task is None or task.cancelled():
+        logger.info(f"📝 No draft for the {report_time} report, building it from scratch")
+        return None
+    if not task.done():
+        logger.info(f"⏳ Waiting up to {DRAFT_WAIT_TIMEOUT}s for the {report_time} report draft...")
+    try:
+        draft = await asyncio.wait_for(asyncio.shield(task), DRAFT_WAIT_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(f"⚠️ The {report_time} report draft is not ready, building the report from scratch")
+        return None
+    except Exception as e:
+        logger.error(f"❌ The {report_time} report draft failed, building the report from scratch: {e}")
+        return None
+    if draft is None:
+        return None
+    if time.time() - draft.created_at > DRAFT_MAX_AGE:
+        logger.warning(f"⚠️ The {report_time} report draft is {(time.time() - draft.created_at) / 60:.0f} minutes old, ignoring it")
+        return None
+    return draft
+
+
+async def prepare_report_draft(discord_scheduler, report_time: str, hours_back: int, fire_hour: int):
+    """Summarize the news, warm the browser and render a draft ahead of the report due at fire_hour:00"""
+    now = datetime.now(discord_scheduler.timezone)
+    fire_time = now.replace(hour=fire_hour, minute=0, second=0, microsecond=0)
+    if fire_time < now:
+        fire_time += timedelta(days=1)
+    
+    pdf_generator = PdfReportGenerator(discord_scheduler.bot)
+    task = asyncio.ensure_future(pdf_generator.prepare_draft(report_time, hours_back, fire_time))
+    _draft_tasks[report_time] = task
+    await asyncio.shield(task)
+
+
+def _reusable_attachment(pdf_generator: PdfReportGenerator, report_key: str, reuse_attachment: bool):
+    """Discord upload of an identical cached report to link instead of uploading, None if it should be uploaded"""
+    if not reuse_attachment or not pdf_generator.last_report_cached:
+        return None
+    return pdf_generator.report_cache.get_attachment_url(report_key)
+
+
+async def send_report(discord_scheduler, pdf_generator: PdfReportGenerator, pdf_path: str, message: str, filename: str,
+                      reuse_attachment: bool = REUSE_REPORT_ATTACHMENTS):
+    """Send a generated report (optionally linking the Discord upload of an identical cached report)"""
+    report_cache = pdf_generator.report_cache
+    report_key = pdf_generator.last_report_key
+    attachment_url = _reusable_attachment(pdf_generator, report_key, reuse_attachment)
+    channel = discord_scheduler.bot.get_channel(discord_scheduler.alert_channel_id)
+    if attachment_url and channel:
+        await channel.send(content=f"{message}\n{attachment_url}")
+        logger.info("✅ Reused the Discord attachment of an identical report")
+        return
+
+    sent_message = await send_pdf(discord_scheduler.bot, discord_scheduler.alert_channel_id, pdf_path, message, filename)
+    if sent_message and sent_message.attachments and report_key:
+        await report_cache.aset_attachment(report_key, sent_message.attachments[0].url)
+
+
+async def publish_report(discord_scheduler, pdf_generator: PdfReportGenerator, report_time: str, hours_back: int,
+                         pdf_path: str, message: str, filename: str, title: str, draft: ReportDraft = None,
+                         reuse_attachment: bool = REUSE_REPORT_ATTACHMENTS) -> bool:
+    """
+    Fast path: publish the news and prices as embeds as soon as they are gathered,
+    then render the PDF (or take it from the report cache) and attach it to the same message.
+    
+    Returns:
+        bool: True if the PDF was delivered
+    """
+    channel = discord_scheduler.bot.get_channel(discord_scheduler.alert_channel_id)
+    if channel is None:
+        logger.error(f"❌ Could not find channel with ID: {discord_scheduler.alert_channel_id}")
+        return False
+    
+    prepared = await pdf_generator.prepare_report(report_time, hours_back, draft)
+    embeds = build_report_embeds(prepared.news_data, prepared.prices_data, prepared.theme, title)
+    messages = await send_report_embeds(channel, f"{message}\n⏳ PDF version on its way...", embeds)
+    logger.info(f"⏱️ Report content published after {time.perf_counter() - prepared.started:.2f}s")
+    
+    pdf_bytes = await pdf_generator.render_prepared(prepared, pdf_path)
+    if pdf_bytes is None:
+        logger.error("❌ Failed to render PDF report")
+        if messages:
+            await messages[0].edit(content=f"{message}\n⚠️ The PDF version could not be generated.")
+        return False
+    if not messages:
+        # the embeds did not go out, fall back to the PDF message
+        await send_report(discord_scheduler, pdf_generator, pdf_path, message, filename, reuse_attachment)
+        return True
+    
+    report_cache = pdf_generator.report_cache
+    attachment_url = _reusable_attachment(pdf_generator, prepared.key, reuse_attachment)
+    if attachment_url:
+        await messages[0].edit(content=f"{message}\n{attachment_url}")
+        logger.info("✅ Reused the Discord attachment of an identical report")
+        return True
+    
+    edited = await attach_pdf(messages[0], pdf_bytes, filename, content=message)
+    if edited is None:
+        return False
+    if edited.attachments:
+        await report_cache.aset_attachment(prepared.key, edited.attachments[0].url)
+    return True
+
+
+async def morning_news_draft_task(discord_scheduler=None):
+    """Morning news report draft task - runs at 15:55, ahead of the 16:00 report"""
+    try:
+        await prepare_report_draft(discord_scheduler, "morning", 17, 16)
+    except Exception as e:
+        logger.error(f"❌ Error preparing morning news report draft: {e}")
+
+
+async def evening_news_draft_task(discord_scheduler=None):
+    """Evening news report draft task - runs at 22:55, ahead of the 23:00 report"""
+    try:
+        await prepare_report_draft(discord_scheduler, "evening", 7, 23)
+    except Exception as e:
+        logger.error(f"❌ Error preparing evening news report draft: {e}")
+
+
+async def morning_news_report_task(discord_scheduler=None, fast_path: bool = FAST_PATH_REPORTS):
     """Morning news report task - runs at 16:00"""
     try:
         logger.info("📰 Generating morning news report...")
         
         # Generate PDF report
         pdf_generator = PdfReportGenerator(discord_scheduler.bot if discord_scheduler else None)
-        success = await pdf_generator.generate_pdf_report(output_pdf="news_pdf/morning_report.pdf", report_time="morning", hours_back=17)
-        
-        if success and discord_scheduler:
-            await send_pdf(discord_scheduler.bot, discord_scheduler.alert_channel_id, "news_pdf/morning_report.pdf", "📰 **Morning News Report**\nMorning news summary is ready!", "morning_report.pdf")
+        draft = await _take_draft("morning")
+        if fast_path and discord_scheduler:
+            await publish_report(discord_scheduler, pdf_generator, "morning", 17, "news_pdf/morning_report.pdf",
+                                 "📰 **Morning News Report**", "morning_report.pdf", "Morning News Report", draft)
+        else:
+            success = await pdf_generator.generate_pdf_report(output_pdf="news_pdf/morning_report.pdf", report_time="morning", hours_back=17, draft=draft)
+            
+            if success and discord_scheduler:
+                await send_report(discord_scheduler, pdf_generator, "news_pdf/morning_report.pdf", "📰 **Morning News Report**\nMorning news summary is ready!", "morning_report.pdf")
         
-        logger.info("✅ Morning news report completed")
+        logger.info(f"✅ Morning news report completed (report cache: {pdf_generator.report_cache.get_stats()})")
         
     except Exception as e:
         logger.error(f"❌ Error in morning news report: {e}")
 
 
 
-async def evening_news_report_task(discord_scheduler=None):
+async def evening_news_report_task(discord_scheduler=None, fast_path: bool = FAST_PATH_REPORTS):
     """Evening news report task - runs at 23:00:03"""
     try:
         logger.info("📰 Generating evening news report...")
         
         # Generate PDF report
         pdf_generator = PdfReportGenerator(discord_scheduler.bot if discord_scheduler else None)
-        success = await pdf_generator.generate_pdf_report(output_pdf="news_pdf/evening_report.pdf", report_time="evening", hours_back=7)
-        
-        if success and discord_scheduler:
-            await send_pdf(discord_scheduler.bot, discord_scheduler.alert_channel_id, "news_pdf/evening_report.pdf", "📰 **Evening News Report**\nEnd of day news summary is ready!", "evening_report.pdf")
+        draft = await _take_draft("evening")
+        if fast_path and discord_scheduler:
+            await publish_report(discord_scheduler, pdf_generator, "evening", 7, "news_pdf/evening_report.pdf",
+                                 "📰 **Evening News Report**", "evening_report.pdf", "Evening News Report", draft)
+        else:
+            success = await pdf_generator.generate_pdf_report(output_pdf="news_pdf/evening_report.pdf", report_time="evening", hours_back=7, draft=draft)
+            
+            if success and discord_scheduler:
+                await send_report(discord_scheduler, pdf_generator, "news_pdf/evening_report.pdf", "📰 **Evening News Report**\nEnd of day news summary is ready!", "evening_report.pdf")
         
-        logger.info("✅ Evening news report completed")
+        logger.info(f"✅ Evening news report completed (report cache: {pdf_generator.report_cache.get_stats()})")
         
     except Exception as e:
         logger.error(f"❌ Error in evening news report: {e}")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test Bulk Quotes - chunking of large watchlists and how the bulk fetcher merges
+chunks and reports failed chunks and missing symbols. Yahoo is a stand-in client
+answering from the saved quote response.
+"""
+
+import sys
+import os
+import asyncio
+from urllib.parse import quote
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.read_write import read_json_file
+from yf_scraper.bulk_quotes import BulkQuoteFetcher, chunk_symbols
+from yf_scraper.yf_requests import AsyncYfRequests
+
+QUOTE_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "yf_scraper", "responses",
+                             "finance_quote_^DJI_^GSPC_^IXIC_^RUT_^VIX.json")
+
+
+class StubYfRequests(AsyncYfRequests):
+    """
+    Answers get_quote from the saved response: symbols of the fixture get its quote,
+    other symbols get a minimal quote, symbols in `missing` are left out, a chunk
+    with a symbol in `failing` raises and one with a symbol in `erroring` gets a Yahoo error
+    """
+
+    def __init__(self, missing=(), failing=(), erroring=(), delay: float = 0):
+        self.fixture = {item["symbol"]: item for item in read_json_file(QUOTE_FIXTURE)["quoteResponse"]["result"]}
+        self.missing, self.failing, self.erroring = set(missing), set(failing), set(erroring)
+        self.delay = delay
+        self.requests = []
+        self.in_flight = self.max_in_flight = 0
+
+    async def get_quote(self, symbols, fields=None, formatted=True, records=False):
+        self.requests.append(list(symbols))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failing.intersection(symbols):
+                raise ConnectionError("connection reset")
+            if self.erroring.intersection(symbols):
+                return {"quoteResponse": {"result": None, "error": "Invalid symbols"}}
+            result = [
+                self.fixture.get(symbol) or {"symbol": symbol, "regularMarketPrice": {"raw": 1.0, "fmt": "1.00"}}
+                for symbol in symbols if symbol not in self.missing
+            ]
+            return {"quoteResponse": {"result": result, "error": None}}
+        finally:
+            self.in_flight -= 1
+
+
+def _symbols(count: int) -> list[str]:
+    return [f"SYM{index}" for index in range(count)]
+
+
+def test_chunk_symbols_count_boundary():
+    """Chunks hold at most max_symbols symbols, in order"""
+    assert chunk_symbols(_symbols(50), max_symbols=50) == [_symbols(50)]
+    chunks = chunk_symbols(_symbols(101), max_symbols=50)
+    assert [len(chunk) for chunk in chunks] == [50, 50, 1]
+    assert sum(chunks, []) == _symbols(101)
+    assert chunk_symbols([]) == []
+
+
+def test_chunk_symbols_length_boundary():
+    """The url-encoded length of the joined symbols stays within the budget"""
+    symbols = ["^GSPC", "BRK.B", "^DJI"]
+    # %5EGSPC + %2C + BRK.B + %2C + %5EDJI
+    encoded = "%2C".join(quote(symbol, safe="") for symbol in symbols)
+    assert chunk_symbols(symbols, max_symbols_length=len(encoded)) == [symbols]
+    assert chunk_symbols(symbols, max_symbols_length=len(encoded) - 1) == [["^GSPC", "BRK.B"], ["^DJI"]]
+    # a symbol longer than the budget still gets a chunk of its own
+    assert chunk_symbols(symbols, max_symbols_length=1) == [["^GSPC"], ["BRK.B"], ["^DJI"]]
+
+
+def test_chunk_symbols_drops_duplicates():
+    """Duplicates are dropped and the first position is kept"""
+    assert chunk_symbols(["^VIX", "^DJI", "^VIX", "^GSPC", "^DJI"], max_symbols=2) == [["^VIX", "^DJI"], ["^GSPC"]]
+
+
+def test_fetch_merges_chunks_in_order():
+    """Chunks are merged into one frame indexed by symbol, in the order of the watchlist"""
+    symbols = ["^VIX", "^GSPC", "AAPL", "^DJI", "^VIX", "MSFT"]
+    client = StubYfRequests(delay=0.01)
+    result = asyncio.run(BulkQuoteFetcher(client, max_symbols=2, concurrency=2).fetch(symbols))
+
+    assert client.requests == [["^VIX", "^GSPC"], ["AAPL", "^DJI"], ["MSFT"]]
+    assert client.max_in_flight == 2
+    assert list(result.quotes.index) == ["^VIX", "^GSPC", "AAPL", "^DJI", "MSFT"]
+    # formatted fields are flattened to their raw value
+    assert result.quotes.loc["^GSPC", "regularMarketPrice"] == client.fixture["^GSPC"]["regularMarketPrice"]["raw"]
+    assert result.failures == [] and result.missing == []
+
+
+def test_fetch_reports_failures_and_missing():
+    """A failed chunk is reported with all its symbols, unanswered symbols are missing"""
+    symbols = ["^GSPC", "^DJI", "BAD", "^IXIC", "ERR", "GONE", "^RUT"]
+    client = StubYfRequests(missing={"GONE"}, failing={"BAD"}, erroring={"ERR"})
+    result = asyncio.run(BulkQuoteFetcher(client, max_symbols=2).fetch(symbols))
+
+    assert [(failure.symbols, failure.error) for failure in result.failures] == [
+        (["BAD", "^IXIC"], "connection reset"),
+        (["ERR", "GONE"], "Invalid symbols"),
+    ]
+    assert result.failed_symbols == ["BAD", "^IXIC", "ERR", "GONE"]
+    # GONE was in a failed chunk, it is a failure rather than missing
+    assert result.missing == []
+    assert list(result.quotes.index) == ["^GSPC", "^DJI", "^RUT"]
+
+    result = asyncio.run(BulkQuoteFetcher(StubYfRequests(missing={"GONE"}), max_symbols=2).fetch(symbols))
+    assert result.failures == [] and result.missing == ["GONE"]
+    assert "GONE" not in result.quotes.index
+
+
+def test_fetch_all_chunks_failed():
+    """Nothing answered: an empty frame, every symbol in the failures"""
+    result = asyncio.run(BulkQuoteFetcher(StubYfRequests(failing={"^GSPC"})).fetch(["^GSPC", "^DJI"]))
+    assert result.quotes.empty
+    assert result.failed_symbols == ["^GSPC", "^DJI"] and result.missing == []
+
+
+if __name__ == "__main__":
+    print("🚀 Bulk Quotes Test Suite")
+    print("=" * 50)
+    test_chunk_symbols_count_boundary()
+    print("✅ Chunks respect max_symbols")
+    test_chunk_symbols_length_boundary()
+    print("✅ Chunks respect the url length budget")
+    test_chunk_symbols_drops_duplicates()
+    print("✅ Duplicate symbols are dropped")
+    test_fetch_merges_chunks_in_order()
+    print("✅ Chunks are merged in order")
+    test_fetch_reports_failures_and_missing()
+    print("✅ Failures and missing symbols are reported")
+    test_fetch_all_chunks_failed()
+    print("✅ All chunks failed")
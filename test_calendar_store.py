@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test Calendar Store - date normalization, upserts and queries of the SQLite
+calendar store, loaded with the saved calendars in data/investing_scraper.
+"""
+
+import sys
+import os
+import csv
+import asyncio
+import tempfile
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from investing_scraper.calendar_store import CalendarStore, normalize_event_date
+from investing_scraper.investing_variables import InvestingVariables
+
+
+FIXTURES_DIR = os.path.join("data", "investing_scraper")
+ECONOMIC = InvestingVariables.CALENDARS.ECONOMIC_CALENDAR
+HOLIDAY = InvestingVariables.CALENDARS.HOLIDAY_CALENDAR
+
+
+def load_events(file_name: str) -> list:
+    """Load a saved calendar as flat event rows"""
+    with open(os.path.join(FIXTURES_DIR, file_name), encoding="utf-8") as f:
+        return [{key: value or None for key, value in row.items()} for row in csv.DictReader(f)]
+
+
+def _row_count(store: CalendarStore, calendar_name: str) -> int:
+    return store._connect().execute("SELECT COUNT(*) FROM events WHERE calendar = ?", (calendar_name,)).fetchone()[0]
+
+
+def test_normalize_event_date():
+    """Hebrew, dotted, English and ISO dates become YYYY-MM-DD"""
+    assert normalize_event_date("יום שלישי, 15 ביולי, 2025") == "2025-07-15"
+    assert normalize_event_date("יום שישי, 4 ביולי, 2025") == "2025-07-04"
+    assert normalize_event_date("04.07.2025") == "2025-07-04"
+    assert normalize_event_date(" 03.07.2025 ") == "2025-07-03"
+    assert normalize_event_date("Tuesday, July 15, 2025") == "2025-07-15"
+    assert normalize_event_date("2025-07-15") == "2025-07-15"
+    assert normalize_event_date("unknown") is None
+    assert normalize_event_date("") is None
+    assert normalize_event_date(None) is None
+
+
+def test_upsert_updates_on_conflict(tmp_path):
+    """Upserting an event again updates its row instead of adding one"""
+    store = CalendarStore(str(tmp_path / "calendar.sqlite3"))
+    events = load_events("economic_calendar_2025-07-15.csv")
+    assert store.upsert(ECONOMIC, events) == len(events)
+    assert store.upsert(ECONOMIC, events) == len(events)
+    assert _row_count(store, ECONOMIC) == len(events)
+
+    pending = next(event for event in events if not event["actual"])
+    store.upsert(ECONOMIC, [dict(pending, actual="1.2%")])
+    assert _row_count(store, ECONOMIC) == len(events)
+    stored = [event for event in store.query(ECONOMIC) if event["description"] == pending["description"]
+              and event["date"] == pending["date"]]
+    assert [event["actual"] for event in stored] == ["1.2%"]
+
+    # rows sharing an identity are distinct events
+    assert store.upsert(ECONOMIC, [pending, dict(pending, actual="2nd")]) == 2
+    assert _row_count(store, ECONOMIC) == len(events) + 1
+    store.close()
+
+
+def test_query_filters(tmp_path):
+    """query filters by normalized date range, country and importance"""
+    store = CalendarStore(str(tmp_path / "calendar.sqlite3"))
+    events = load_events("economic_calendar_2025-07-15.csv")
+    store.upsert(ECONOMIC, events)
+    store.upsert(HOLIDAY, load_events("holiday_calendar_2025-07-15.csv"))
+
+    july_first = store.query(ECONOMIC, date_from="2025-07-01", date_to="2025-07-01")
+    assert july_first and all(event["date"] == "יום שלישי, 1 ביולי, 2025" for event in july_first)
+    assert len(july_first) == sum(1 for event in events if event["date"] == "יום שלישי, 1 ביולי, 2025")
+    # ordered by date then time
+    times = [event["time"] for event in july_first]
+    assert times == sorted(times)
+
+    everything = store.query(ECONOMIC, date_from="2025-01-01", date_to="2025-12-31")
+    assert len(everything) == len(events)
+    assert store.query(ECONOMIC, date_from="2026-01-01") == []
+    assert len(store.query(ECONOMIC, country="ארצות הברית")) == len(events)
+    assert store.query(ECONOMIC, country="יפן") == []
+
+    high = store.query(ECONOMIC, importance=[InvestingVariables.IMPORTANCE.HIGH])
+    assert len(high) == sum(1 for event in events if "גבוהה" in (event["volatility"] or ""))
+    # holiday rows of the economic calendar ("חופשה") have no importance
+    rated = sum(1 for event in events if "תנודתיות" in (event["volatility"] or ""))
+    assert rated < len(events)
+    assert len(store.query(ECONOMIC, importance=list(InvestingVariables.IMPORTANCE))) == rated
+
+    # dotted holiday dates are normalized too
+    holidays = store.query(HOLIDAY, date_from="2025-07-04", date_to="2025-07-04")
+    assert [event["date"] for event in holidays] == ["04.07.2025"]
+    store.close()
+
+
+def test_async_methods(tmp_path):
+    """aupsert / aquery run the same operations in a worker thread"""
+    store = CalendarStore(str(tmp_path / "calendar.sqlite3"))
+    events = load_events("holiday_calendar_2025-07-15.csv")
+
+    async def run():
+        saved = await store.aupsert(HOLIDAY, events)
+        return saved, await store.aquery(HOLIDAY)
+
+    saved, stored = asyncio.run(run())
+    assert saved == len(events) and stored == sorted(stored, key=lambda event: normalize_event_date(event["date"]))
+    assert len(stored) == len(events)
+    store.close()
+
+
+if __name__ == "__main__":
+    from pathlib import Path
+
+    print("🚀 Calendar Store Test Suite")
+    print("=" * 50)
+    test_normalize_event_date()
+    print("✅ Dates are normalized")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_upsert_updates_on_conflict(Path(temp_dir) / "upsert")
+        print("✅ Upsert updates on conflict")
+        test_query_filters(Path(temp_dir) / "query")
+        print("✅ Query filters")
+        test_async_methods(Path(temp_dir) / "async")
+        print("✅ Async upsert and query")
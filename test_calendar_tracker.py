@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test Calendar Tracker - snapshot indexing and diffing of the economic calendar.
+The saved economic calendar in data/investing_scraper is the base snapshot, each
+test edits a copy of it the way a later fetch would.
+"""
+
+import sys
+import os
+import csv
+import asyncio
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from investing_scraper.calendar_tracker import ChangeType, CalendarStateTracker, diff_events, index_events
+from scheduler_v2.tasks import economic_calendar_tasks
+
+
+CALENDAR = "economic_calendar"
+FIXTURE = os.path.join("data", "investing_scraper", "economic_calendar_2025-07-15.csv")
+
+
+def load_events() -> list:
+    """Load the saved economic calendar as flat event rows"""
+    with open(FIXTURE, encoding="utf-8") as f:
+        return [{key: value or None for key, value in row.items()} for row in csv.DictReader(f)]
+
+
+def _diff(old_events: list, new_events: list) -> list:
+    return diff_events(index_events(CALENDAR, old_events), index_events(CALENDAR, new_events))
+
+
+def _first(events: list, with_actual: bool) -> int:
+    return next(index for index, event in enumerate(events) if bool(event["actual"]) == with_actual)
+
+
+def test_same_fetch_has_no_changes():
+    """Refetching an unchanged calendar produces no change"""
+    events = load_events()
+    assert _diff(events, load_events()) == []
+
+
+def test_actual_published_and_revised():
+    """An actual appearing is a publish, an actual changing is a revision"""
+    old_events = load_events()
+    new_events = load_events()
+    pending, released = _first(new_events, with_actual=False), _first(new_events, with_actual=True)
+    new_events[pending]["actual"] = "1.2%"
+    new_events[released]["actual"] = "revised"
+
+    changes = {change.event["description"]: change for change in _diff(old_events, new_events)}
+    assert len(changes) == 2
+
+    published = changes[new_events[pending]["description"]]
+    assert published.change_type == ChangeType.ACTUAL_PUBLISHED
+    assert (published.field, published.old_value, published.new_value) == ("actual", None, "1.2%")
+
+    revised = changes[new_events[released]["description"]]
+    assert revised.change_type == ChangeType.ACTUAL_REVISED
+    assert (revised.old_value, revised.new_value) == (old_events[released]["actual"], "revised")
+
+
+def test_forecast_and_previous_revisions():
+    """Forecast and previous changes get their own types, other fields are generic"""
+    old_events = load_events()
+    new_events = load_events()
+    new_events[0]["forecast"] = "50.0"
+    new_events[1]["previous"] = "48.6"
+    new_events[2]["volatility"] = "low"
+
+    change_types = {(change.field, change.change_type) for change in _diff(old_events, new_events)}
+    assert change_types == {
+        ("forecast", ChangeType.FORECAST_REVISED),
+        ("previous", ChangeType.PREVIOUS_REVISED),
+        ("volatility", ChangeType.FIELD_CHANGED),
+    }
+
+
+def test_added_and_removed():
+    """Rows only in the new fetch are added, rows only in the old fetch are removed"""
+    old_events = load_events()
+    new_events = load_events()
+    removed = new_events.pop(3)
+    added = dict(new_events[0], description="New event", time="23:59")
+    new_events.append(added)
+
+    changes = _diff(old_events, new_events)
+    assert [(change.change_type, change.event) for change in changes] == [
+        (ChangeType.EVENT_ADDED, added),
+        (ChangeType.EVENT_REMOVED, removed),
+    ]
+
+
+def test_duplicate_rows_are_numbered():
+    """Rows sharing an identity are all kept and diffed by occurrence"""
+    events = load_events()
+    duplicate = dict(events[0], actual="second")
+    indexed = index_events(CALENDAR, events + [duplicate])
+    assert len(indexed) == len(events) + 1
+
+    first_key = next(key for key, event in indexed.items() if event is events[0])
+    assert first_key[-1] == 0
+    assert indexed[first_key[:-1] + (1,)] is duplicate
+
+    # only the second occurrence changes
+    changed = dict(duplicate, actual="third")
+    changes = _diff(events + [duplicate], events + [changed])
+    assert [(change.key[-1], change.change_type) for change in changes] == [(1, ChangeType.ACTUAL_REVISED)]
+
+
+def test_tracker_applies_snapshots():
+    """The tracker diffs every fetch against the previous one"""
+    tracker = CalendarStateTracker(CALENDAR, fetch_events=None)
+    events = load_events()
+    assert len(tracker.apply(events)) == len(events)
+    assert [change.change_type for change in tracker.apply(events[1:])] == [ChangeType.EVENT_REMOVED]
+    assert [change.change_type for change in tracker.apply(events)] == [ChangeType.EVENT_ADDED]
+    assert tracker.apply(events) == []
+    assert events[0] in tracker.get_events(events[0]["time"])
+
+
+def test_pending_updates_are_kept_per_day():
+    """Changes wait in (day, time) buckets and changes of past days are dropped"""
+    pending = economic_calendar_tasks._pending_updates
+    pending.clear()
+    today = economic_calendar_tasks._today()
+    tracker = CalendarStateTracker(CALENDAR, fetch_events=None)
+    # the saved calendar is from July 2025, its changes are left over from a past day
+    old_events = load_events()
+    tracker.apply(old_events)
+    past_change = dict(old_events[0], actual="1.0")
+    asyncio.run(economic_calendar_tasks.collect_update_changes(tracker.apply([past_change] + old_events[1:])))
+    assert list(pending) == [("2025-07-01", past_change["time"])]
+
+    today_event = dict(old_events[0], date=today)
+    tracker.apply([today_event])
+    asyncio.run(economic_calendar_tasks.collect_update_changes(tracker.apply([dict(today_event, actual="2.0")])))
+    assert list(pending) == [(today, today_event["time"])]
+    pending.clear()
+
+
+if __name__ == "__main__":
+    print("🚀 Calendar Tracker Test Suite")
+    print("=" * 50)
+    test_same_fetch_has_no_changes()
+    print("✅ Unchanged fetch has no changes")
+    test_actual_published_and_revised()
+    print("✅ Actual published vs revised")
+    test_forecast_and_previous_revisions()
+    print("✅ Forecast and previous revisions")
+    test_added_and_removed()
+    print("✅ Added and removed events")
+    test_duplicate_rows_are_numbered()
+    print("✅ Duplicate rows are numbered")
+    test_tracker_applies_snapshots()
+    print("✅ Tracker applies snapshots")
+    test_pending_updates_are_kept_per_day()
+    print("✅ Pending updates are kept per day")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test JSON Codec - both backends of utils.json_codec agree, plus a micro-benchmark
+over the sample JSON files of the repository.
+"""
+
+import sys
+import os
+import glob
+import tempfile
+import time
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils import json_codec
+from utils.read_write import read_json_file, write_json_file
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_PATTERNS = [
+    "yf_scraper/responses/*.json",
+    "investing_scraper/*.json",
+    "investing_scraper/requests_json/*.json",
+    "news_pdf/news_data.json",
+]
+
+
+def sample_files() -> list[str]:
+    files = []
+    for pattern in SAMPLE_PATTERNS:
+        files.extend(sorted(glob.glob(os.path.join(ROOT, pattern))))
+    return files
+
+
+def _with_backends(func):
+    previous = json_codec.get_backend()
+    try:
+        for backend in json_codec.BACKENDS:
+            json_codec.set_backend(backend)
+            func(backend)
+    finally:
+        json_codec.set_backend(previous)
+
+
+def test_backends_roundtrip():
+    """Every backend parses the samples the same way and reads back what it writes"""
+    data = {"title": "דוח מסחר יומי", "price": 6278.17, "items": [1, None, True], "nested": {"a": []}}
+    expected = {}
+
+    def check(backend):
+        assert json_codec.loads(json_codec.dumps(data)) == data
+        assert json_codec.loads(json_codec.dumps_bytes(data, pretty=True)) == data
+        assert json_codec.dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+        assert json_codec.dumps({"a": 1}, pretty=True) == '{\n  "a": 1\n}'
+        assert "דוח" in json_codec.dumps(data)
+        for path in sample_files():
+            with open(path, "rb") as f:
+                raw = f.read()
+            parsed = json_codec.loads(raw)
+            assert json_codec.loads(raw.decode("utf-8")) == parsed
+            expected.setdefault(path, parsed)
+            assert parsed == expected[path], f"{backend} parsed {path} differently"
+        try:
+            json_codec.loads(b"{not json")
+            raise AssertionError("invalid json was accepted")
+        except json_codec.JSONDecodeError:
+            pass
+
+    _with_backends(check)
+
+
+def test_read_write_json_file():
+    """read_write honors the indent: 4 spaces by default, 2 through the codec, compact with indent=None"""
+    data = {"symbol": "^GSPC", "name": "S&P 500", "values": [1.5, 2]}
+    with tempfile.TemporaryDirectory() as directory:
+        pretty_path = os.path.join(directory, "pretty.json")
+        two_space_path = os.path.join(directory, "two_space.json")
+        compact_path = os.path.join(directory, "compact.json")
+        write_json_file(pretty_path, data)
+        write_json_file(two_space_path, data, indent=2)
+        write_json_file(compact_path, data, indent=None)
+
+        assert read_json_file(pretty_path) == data == read_json_file(compact_path) == read_json_file(two_space_path)
+        with open(compact_path, encoding="utf-8") as f:
+            assert "\n" not in f.read()
+        with open(pretty_path, encoding="utf-8") as f:
+            assert f.read().startswith('{\n    "symbol"')
+        with open(two_space_path, encoding="utf-8") as f:
+            assert f.read().startswith('{\n  "symbol"')
+
+        bad_path = os.path.join(directory, "bad.json")
+        with open(bad_path, "w") as f:
+            f.write("{")
+        assert read_json_file(bad_path) is None
+
+
+def _time(func, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds
+
+
+def benchmark_json_codec(rounds: int = 50):
+    """loads / compact dumps / pretty dumps per backend over the sample files"""
+    samples = []
+    for path in sample_files():
+        with open(path, "rb") as f:
+            raw = f.read()
+        samples.append((os.path.relpath(path, ROOT), raw, json_codec.loads(raw)))
+    total_bytes = sum(len(raw) for _, raw, _ in samples)
+    print(f"📊 {len(samples)} sample files, {total_bytes:,} bytes, {rounds} rounds")
+
+    results = {}
+
+    def run(backend):
+        results[backend] = {
+            "loads": sum(_time(lambda: json_codec.loads(raw), rounds) for _, raw, _ in samples),
+            "dumps": sum(_time(lambda: json_codec.dumps(data), rounds) for _, _, data in samples),
+            "dumps pretty": sum(_time(lambda: json_codec.dumps(data, pretty=True), rounds) for _, _, data in samples),
+        }
+
+    _with_backends(run)
+    for operation in ("loads", "dumps", "dumps pretty"):
+        line = ", ".join(f"{backend} {timings[operation] * 1e3:.2f}ms" for backend, timings in results.items())
+        if "orjson" in results:
+            line += f" ({results['json'][operation] / results['orjson'][operation]:.1f}x)"
+        print(f"📊 {operation}: {line}")
+
+    largest = max(samples, key=lambda sample: len(sample[1]))
+    compact = len(json_codec.dumps_bytes(largest[2]))
+    pretty = len(json_codec.dumps_bytes(largest[2], pretty=True))
+    print(f"📊 {largest[0]}: {pretty:,} bytes pretty -> {compact:,} bytes compact")
+
+
+if __name__ == "__main__":
+    print("🚀 JSON Codec Test Suite")
+    print("=" * 50)
+    print(f"📊 Backends: {', '.join(json_codec.BACKENDS)} (using {json_codec.get_backend()})")
+    test_backends_roundtrip()
+    print("✅ Backends roundtrip")
+    test_read_write_json_file()
+    print("✅ read_write json files")
+    print()
+    benchmark_json_codec()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test News Feed - the bounded seen-set, the publish time cursor and the stream of
+new stories of the Yahoo news feed, polled from canned streams instead of Yahoo.
+"""
+
+import sys
+import os
+import asyncio
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from yf_scraper.news_feed import BoundedSeenSet, YahooNewsFeed
+
+
+def _story(uuid: str, published: str) -> dict:
+    return {"id": uuid, "content": {"id": uuid, "title": f"Story {uuid}", "pubDate": published}}
+
+
+def _stream(*stories) -> list:
+    """A news stream, newest first like Yahoo sends it"""
+    return sorted(stories, key=lambda item: item["content"]["pubDate"], reverse=True)
+
+
+class CannedNewsFeed(YahooNewsFeed):
+    """Polls the given streams in order (an Exception is raised), then stops"""
+
+    def __init__(self, streams: list, **kwargs):
+        super().__init__(http_session=object(), yf_session=object(), interval=0.001, **kwargs)
+        self.streams = list(streams)
+
+    async def fetch_stream(self) -> list:
+        stream = self.streams.pop(0)
+        if not self.streams:
+            self.stop()
+        if isinstance(stream, Exception):
+            raise stream
+        return stream
+
+
+async def _collect(feed: YahooNewsFeed) -> list:
+    return [story["id"] async for story in feed.stream()]
+
+
+def test_seen_set_evicts_oldest():
+    """The oldest ids are forgotten first, adding an id again makes it recent"""
+    seen = BoundedSeenSet(maxsize=3)
+    for item_id in ("a", "b", "c"):
+        seen.add(item_id)
+    seen.add("a")
+    seen.add("d")
+    assert len(seen) == 3
+    assert "b" not in seen
+    assert all(item_id in seen for item_id in ("a", "c", "d"))
+
+
+def test_cursor_advances():
+    """The cursor follows the newest story, stories older than it are not reported again"""
+    feed = CannedNewsFeed([], seen_size=3)
+    first = feed._new_items(_stream(_story("a", "2025-07-10T10:00:00Z"), _story("b", "2025-07-10T11:00:00Z")))
+    assert [story["id"] for story in first] == ["a", "b"]
+    assert feed.cursor == "2025-07-10T11:00:00Z"
+
+    new = feed._new_items(_stream(_story("c", "2025-07-10T12:00:00Z"), _story("b", "2025-07-10T11:00:00Z")))
+    assert [story["id"] for story in new] == ["c"]
+    assert feed.cursor == "2025-07-10T12:00:00Z"
+
+    new = feed._new_items(_stream(_story("d", "2025-07-10T13:00:00Z")))
+    assert [story["id"] for story in new] == ["d"]
+    assert feed.cursor == "2025-07-10T13:00:00Z"
+
+    # "b" fell out of the 3-id seen-set, but it is older than the cursor
+    assert "b" not in feed.seen
+    assert feed._new_items(_stream(_story("b", "2025-07-10T11:00:00Z"))) == []
+    assert feed.cursor == "2025-07-10T13:00:00Z"
+
+
+def test_stream_yields_only_new_stories():
+    """The first poll primes the feed, later polls yield each new uuid once, oldest first"""
+    a, b, c, d = (_story(uuid, f"2025-07-10T1{hour}:00:00Z") for hour, uuid in enumerate("abcd"))
+    feed = CannedNewsFeed([
+        _stream(a, b),
+        _stream(a, b, c),
+        _stream(a, b, c),
+        ConnectionError("Yahoo is down"),
+        _stream(b, c, d),
+    ])
+    assert asyncio.run(_collect(feed)) == ["c", "d"]
+    assert feed.polls == 4
+
+    feed = CannedNewsFeed([_stream(a, b), _stream(b, c)], skip_existing=False)
+    assert asyncio.run(_collect(feed)) == ["a", "b", "c"]
+
+
+if __name__ == "__main__":
+    print("🚀 News Feed Test Suite")
+    print("=" * 50)
+    test_seen_set_evicts_oldest()
+    print("✅ Seen-set evicts the oldest ids")
+    test_cursor_advances()
+    print("✅ Cursor advances")
+    test_stream_yields_only_new_stories()
+    print("✅ Stream yields only new stories")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test Quote Records - field projection of quote requests and the compact record parser,
+plus a payload / decode / memory benchmark over the saved quote responses.
+"""
+
+import sys
+import os
+import json
+import time
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.read_write import read_json_file
+from yf_scraper.bulk_quotes import flatten_quote
+from yf_scraper.qoute_fields import ALL_QUOTE_FIELDS, PRICE_FIELDS, QouteFields as qf
+from yf_scraper.quote_records import parse_quote_records, quote_record_type
+from yf_scraper.yf_requests import AsyncYfRequests
+
+RESPONSES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "yf_scraper", "responses")
+QUOTE_FIXTURES = {
+    "finance_quote_^DJI_^GSPC_^IXIC_^RUT_^VIX.json": lambda data: data["quoteResponse"]["result"],
+    "marketSummary_full.json": lambda data: data["marketSummaryResponse"]["result"],
+    "trending_US.json": lambda data: data["finance"]["result"][0]["quotes"],
+}
+
+
+def load_fixture_results() -> list[dict]:
+    """Quote results of the saved responses"""
+    results = []
+    for file_name, extract in QUOTE_FIXTURES.items():
+        results.extend(extract(read_json_file(os.path.join(RESPONSES_DIR, file_name))))
+    return results
+
+
+def project_result(item: dict, fields) -> dict:
+    """
+    What Yahoo returns for `item` with fields=<fields>&formatted=false: the requested
+    fields as plain values, plus the metadata keys it always sends
+    """
+    return {
+        key: value.get("raw") if isinstance(value, dict) and "raw" in value else value
+        for key, value in item.items()
+        if key in fields or key not in ALL_QUOTE_FIELDS and not isinstance(value, dict)
+    }
+
+
+def test_build_quote_params_projection():
+    """Only the requested fields are sent, no dunder names, no logo params unless asked"""
+    client = AsyncYfRequests.__new__(AsyncYfRequests)
+
+    default = client.build_quote_params(["^GSPC"])
+    assert default["fields"].split(",") == list(ALL_QUOTE_FIELDS)
+    assert "__module__" not in default["fields"] and "QouteFields" not in default["fields"]
+    assert default["formatted"] == "true" and default["imgLabels"] == "logoUrl"
+
+    projected = client.build_quote_params(["^GSPC", "^DJI"], PRICE_FIELDS, formatted=False)
+    assert projected["fields"].split(",") == list(PRICE_FIELDS)
+    assert projected["formatted"] == "false"
+    assert projected["symbols"] == "^GSPC,^DJI"
+    assert "imgLabels" not in projected and "topPickThisMonth" not in projected
+
+
+def test_parse_quote_records():
+    """Formatted and raw responses give the same typed records"""
+    response = read_json_file(os.path.join(RESPONSES_DIR, "marketSummary_full.json"))
+    fields = (qf.SHORT_NAME, qf.REGULAR_MARKET_PRICE, qf.REGULAR_MARKET_CHANGE_PERCENT, qf.REGULAR_MARKET_TIME)
+
+    records = parse_quote_records(response, fields)
+    raw_records = parse_quote_records(
+        [project_result(item, fields) for item in response["marketSummaryResponse"]["result"]], fields
+    )
+
+    assert records == raw_records
+    assert records[0]._fields == ("symbol",) + fields
+    gspc = next(record for record in records if record.symbol == "^GSPC")
+    assert isinstance(gspc.regularMarketPrice, float) and isinstance(gspc.regularMarketTime, int)
+    assert gspc.shortName == "S&P 500"
+    assert parse_quote_records({"quoteResponse": {"result": [{"symbol": "X"}]}}, fields)[0].regularMarketPrice is None
+    assert quote_record_type(fields) is type(records[0])
+
+
+def _deep_size(obj) -> int:
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(key) + _deep_size(value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(_deep_size(item) for item in obj)
+    return size
+
+
+def _time(func, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds
+
+
+def benchmark_quote_projection(rounds: int = 500):
+    """Full formatted quotes vs PRICE_FIELDS raw quotes parsed into records"""
+    results = load_fixture_results()
+    full_payload = json.dumps({"quoteResponse": {"result": results, "error": None}})
+    projected = [project_result(item, PRICE_FIELDS) for item in results]
+    lean_payload = json.dumps({"quoteResponse": {"result": projected, "error": None}})
+
+    full_decode = _time(lambda: json.loads(full_payload), rounds)
+    lean_decode = _time(lambda: json.loads(lean_payload), rounds)
+    full_data, lean_data = json.loads(full_payload), json.loads(lean_payload)
+    full_parse = _time(lambda: [flatten_quote(item) for item in full_data["quoteResponse"]["result"]], rounds)
+    lean_parse = _time(lambda: parse_quote_records(lean_data, PRICE_FIELDS), rounds)
+
+    full_rows = [flatten_quote(item) for item in full_data["quoteResponse"]["result"]]
+    records = parse_quote_records(lean_data, PRICE_FIELDS)
+    full_memory = sum(_deep_size(row) for row in full_rows) / len(full_rows)
+    lean_memory = sum(_deep_size(record) for record in records) / len(records)
+
+    print(f"📊 {len(results)} fixture quotes, {rounds} rounds")
+    print(f"📊 payload: {len(full_payload):,} -> {len(lean_payload):,} bytes ({len(lean_payload) / len(full_payload):.0%})")
+    print(f"📊 json decode: {full_decode * 1e6:.0f}µs -> {lean_decode * 1e6:.0f}µs")
+    print(f"📊 parse: {full_parse * 1e6:.0f}µs (flatten dicts) -> {lean_parse * 1e6:.0f}µs (records)")
+    print(f"📊 memory per quote: {full_memory:,.0f} -> {lean_memory:,.0f} bytes")
+
+
+if __name__ == "__main__":
+    print("🚀 Quote Records Test Suite")
+    print("=" * 50)
+    test_build_quote_params_projection()
+    print("✅ Quote params projection")
+    test_parse_quote_records()
+    print("✅ Quote record parsing")
+    print()
+    benchmark_quote_projection()
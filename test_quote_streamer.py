@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test Quote Streamer - PricingData codec, live quote table and subscribe/unsubscribe
+against the local streamer replay built from yf_scraper/responses, plus a benchmark.
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.http_session import PooledHttpSession
+from yf_scraper.pricing_proto import decode_pricing_data, encode_pricing_data
+from yf_scraper.quote_streamer import QuoteStreamer
+from yf_scraper.replay_server import StreamerReplayServer, load_fixture_quotes
+
+
+def test_pricing_data_roundtrip():
+    """Encoded messages decode to the same values (floats at float32 precision)"""
+    message = {
+        "id": "^GSPC", "price": 6263.26, "time": 1752163029000, "exchange": "SNP", "quote_type": 9,
+        "market_hours": 1, "change_percent": -0.41, "day_volume": 2_500_000_000, "change": -25.75,
+        "market_cap": 5.2e13, "options_type": -1,
+    }
+    decoded = decode_pricing_data(encode_pricing_data(message))
+
+    assert decoded["id"] == "^GSPC"
+    assert decoded["time"] == 1752163029000
+    assert decoded["day_volume"] == 2_500_000_000
+    assert decoded["options_type"] == -1
+    assert decoded["market_cap"] == 5.2e13
+    assert abs(decoded["price"] - 6263.26) < 1e-3
+    assert abs(decoded["change"] + 25.75) < 1e-4
+
+
+async def _stream_from_replay(json_frames: bool):
+    async with StreamerReplayServer(interval=0.01, json_frames=json_frames) as server:
+        streamer = QuoteStreamer(server.url, http_session=PooledHttpSession("stream-test"))
+        try:
+            await streamer.subscribe(["^GSPC", "^DJI"])
+            streamer.start()
+            assert await streamer.wait_connected(5)
+            await asyncio.sleep(0.2)
+            first = {symbol: streamer.get_price(symbol) for symbol in ("^GSPC", "^DJI", "^IXIC")}
+
+            await streamer.subscribe(["^IXIC"])
+            await streamer.unsubscribe(["^DJI"])
+            await asyncio.sleep(0.2)
+            second = {symbol: streamer.get_price(symbol) for symbol in ("^GSPC", "^DJI", "^IXIC")}
+            return first, second, streamer.get_stats()
+        finally:
+            await streamer.stop()
+            await streamer.http_session.close()
+
+
+def test_streamer_subscribe_unsubscribe():
+    """Subscribed symbols are kept live, unsubscribed ones leave the table"""
+    for json_frames in (False, True):
+        first, second, stats = asyncio.run(_stream_from_replay(json_frames))
+
+        assert first["^GSPC"] is not None and first["^DJI"] is not None
+        assert first["^IXIC"] is None
+        assert second["^IXIC"] is not None
+        assert second["^DJI"] is None
+        assert abs(second["^GSPC"].price - 6263) < 100
+        assert stats["decode_errors"] == 0
+
+
+def benchmark_streamer(messages: int = 50000):
+    """Decode + table update throughput over replayed frames"""
+    server = StreamerReplayServer()
+    symbols = list(server.quotes)
+    frames = [server.next_tick(symbols[index % len(symbols)]) for index in range(messages)]
+
+    streamer = QuoteStreamer("ws://unused")
+    streamer.symbols = set(symbols)
+    start = time.perf_counter()
+    for frame in frames:
+        streamer.handle_message(frame)
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for index in range(messages):
+        streamer.get_price(symbols[index % len(symbols)])
+    lookup = time.perf_counter() - start
+
+    print(f"📊 {len(symbols)} fixture symbols, {messages} frames")
+    print(f"📊 decode + update: {messages / elapsed:,.0f} msg/s ({elapsed / messages * 1e6:.1f}µs/msg)")
+    print(f"📊 lookup: {lookup / messages * 1e9:.0f}ns/lookup")
+
+
+if __name__ == "__main__":
+    print("🚀 Quote Streamer Test Suite")
+    print("=" * 50)
+    test_pricing_data_roundtrip()
+    print("✅ PricingData roundtrip")
+    test_streamer_subscribe_unsubscribe()
+    print("✅ Subscribe/unsubscribe against the replay server")
+    print(f"📊 Fixture symbols: {len(load_fixture_quotes())}")
+    print()
+    benchmark_streamer()
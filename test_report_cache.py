@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Test Report Cache - content keys, LRU eviction, attachment reuse and the disk
+index of the rendered report cache. No browser is needed, PDFs are stand-in bytes.
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import time
+from types import SimpleNamespace
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from news_pdf.report_cache import ATTACHMENT_MAX_AGE, ReportCache, report_key
+from scheduler_v2.tasks.news_report import send_report
+
+
+TEMPLATE = "<html><body>{{ news }}</body></html>"
+NEWS = [
+    {"time": "09:30", "link": "https://example.com/a", "message": "Stocks open higher"},
+    {"time": "10:00", "link": "#", "message": "Oil slips"},
+]
+PRICES = [{"ticker": "SPY", "price": "550.1", "changePercent": "0.4%", "isPositive": True}]
+
+
+def test_report_key_is_stable():
+    """Same content gives the same key whatever the field order or whitespace"""
+    key = report_key(NEWS, PRICES, "morning", TEMPLATE)
+    reordered_news = [{"message": item["message"], "link": item["link"], "time": item["time"]} for item in NEWS]
+    reordered_prices = [dict(reversed(list(symbol.items()))) for symbol in PRICES]
+    assert report_key(reordered_news, reordered_prices, "morning", TEMPLATE) == key
+
+    # whitespace and fields the report doesn't render are ignored, so is junk in the list
+    normalized_news = [dict(item, message=f"  {item['message'].replace(' ', '   ')}\n", source="rss") for item in NEWS]
+    assert report_key(normalized_news + ["junk"], PRICES, "morning", TEMPLATE) == key
+
+
+def test_report_key_changes_with_content():
+    """News, its order, prices, theme and template are all part of the key"""
+    key = report_key(NEWS, PRICES, "morning", TEMPLATE)
+    assert report_key(list(reversed(NEWS)), PRICES, "morning", TEMPLATE) != key
+    assert report_key(NEWS[:1], PRICES, "morning", TEMPLATE) != key
+    assert report_key(NEWS, [dict(PRICES[0], price="551.0")], "morning", TEMPLATE) != key
+    assert report_key(NEWS, PRICES, "evening", TEMPLATE) != key
+    assert report_key(NEWS, PRICES, "morning", TEMPLATE + " ") != key
+
+
+def test_lru_eviction(tmp_path):
+    """The least recently used report is evicted, with its PDF"""
+    cache = ReportCache(str(tmp_path), max_entries=2)
+    cache.put("a", b"pdf a")
+    cache.put("b", b"pdf b")
+    # a hit makes "a" the most recently used
+    assert cache.get("a").pdf_bytes == b"pdf a"
+    cache.put("c", b"pdf c")
+
+    assert cache.get("b") is None
+    assert not os.path.exists(tmp_path / "b.pdf")
+    assert cache.get("a") is not None and cache.get("c") is not None
+    stats = cache.get_stats()
+    assert stats["entries"] == 2 and stats["misses"] == 1 and stats["hits"] == 3
+
+
+def test_attachment_reuse_cap(tmp_path):
+    """Discord uploads are reused for 12 hours only"""
+    cache = ReportCache(str(tmp_path))
+    cache.put("a", b"pdf a")
+    assert cache.get_attachment_url("a") is None
+
+    cache.set_attachment("a", "https://cdn.discordapp.com/a.pdf")
+    assert cache.get_attachment_url("a") == "https://cdn.discordapp.com/a.pdf"
+
+    cache._entries["a"].attached_at = time.time() - ATTACHMENT_MAX_AGE - 60
+    assert cache.get_attachment_url("a") is None
+    assert ATTACHMENT_MAX_AGE == 12 * 3600
+    # unknown reports have no attachment
+    cache.set_attachment("missing", "https://cdn.discordapp.com/missing.pdf")
+    assert cache.get_attachment_url("missing") is None
+    assert cache.get_stats()["attachment_reuses"] == 1
+
+
+def test_index_reloads_from_disk(tmp_path):
+    """A new cache instance (e.g. after a restart) finds the reports and uploads on disk"""
+    async def fill():
+        cache = ReportCache(str(tmp_path))
+        await cache.aput("a", b"pdf a")
+        await cache.aput("b", b"pdf b")
+        await cache.aset_attachment("a", "https://cdn.discordapp.com/a.pdf")
+
+    asyncio.run(fill())
+    # a report whose PDF is gone is dropped from the index
+    os.remove(tmp_path / "b.pdf")
+
+    reloaded = ReportCache(str(tmp_path))
+    assert list(reloaded._entries) == ["a"]
+    artifact = asyncio.run(reloaded.aget("a"))
+    assert artifact.pdf_bytes == b"pdf a"
+    assert reloaded.get_attachment_url("a") == "https://cdn.discordapp.com/a.pdf"
+    assert reloaded.get("b") is None
+
+
+class StubChannel:
+    """Records what is sent to it"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content=None, file=None, **kwargs):
+        self.sent.append((content, file.filename if file else None))
+        return SimpleNamespace(attachments=[SimpleNamespace(url="https://cdn.discordapp.com/new.pdf")] if file else [])
+
+
+async def _send_cached_report(tmp_path, reuse_attachment: bool = None):
+    cache = ReportCache(str(tmp_path))
+    cache.put("a", b"pdf a")
+    cache.set_attachment("a", "https://cdn.discordapp.com/a.pdf")
+    pdf_path = str(tmp_path / "report.pdf")
+    with open(pdf_path, "wb") as f:
+        f.write(b"pdf a")
+
+    channel = StubChannel()
+    scheduler = SimpleNamespace(bot=SimpleNamespace(get_channel=lambda _: channel), alert_channel_id=1)
+    generator = SimpleNamespace(report_cache=cache, last_report_key="a", last_report_cached=True)
+    kwargs = {} if reuse_attachment is None else {"reuse_attachment": reuse_attachment}
+    await send_report(scheduler, generator, pdf_path, "Report", "report.pdf", **kwargs)
+    return channel.sent
+
+
+def test_cached_report_is_uploaded_by_default(tmp_path):
+    """A cache hit uploads the cached PDF unless attachment reuse is turned on"""
+    assert asyncio.run(_send_cached_report(tmp_path / "default")) == [("Report", "report.pdf")]
+    assert asyncio.run(_send_cached_report(tmp_path / "reuse", reuse_attachment=True)) == [
+        ("Report\nhttps://cdn.discordapp.com/a.pdf", None)
+    ]
+
+
+if __name__ == "__main__":
+    from pathlib import Path
+
+    print("🚀 Report Cache Test Suite")
+    print("=" * 50)
+    test_report_key_is_stable()
+    print("✅ Report key is stable")
+    test_report_key_changes_with_content()
+    print("✅ Report key follows the content")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_lru_eviction(Path(temp_dir) / "lru")
+        print("✅ LRU eviction")
+        test_attachment_reuse_cap(Path(temp_dir) / "attachment")
+        print("✅ Attachment reuse is capped at 12h")
+        test_index_reloads_from_disk(Path(temp_dir) / "index")
+        print("✅ Index reloads from disk")
+        test_cached_report_is_uploaded_by_default(Path(temp_dir) / "upload")
+        print("✅ Cached reports are uploaded by default")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test Report Draft - a report finished from its draft reloads the prices instead of
+reusing the market summary the draft loaded. Yahoo and Discord are stand-ins, no
+browser is launched (the reports are prepared, not rendered).
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from news_pdf.browser_pool import BrowserPool
+from news_pdf.pdf_report_generator import PdfReportGenerator, ReportDraft
+from news_pdf.report_cache import ReportCache
+from yf_scraper.market_data_cache import MarketDataCache
+
+
+def _market_summary(price: float) -> dict:
+    return {"marketSummaryResponse": {"result": [{
+        "symbol": "^GSPC",
+        "shortName": "S&P 500",
+        "regularMarketPrice": {"fmt": f"{price:.2f}"},
+        "regularMarketChange": {"fmt": "1.00"},
+        "regularMarketChangePercent": {"fmt": "0.02%"},
+    }]}}
+
+
+class StubYahoo:
+    """Returns the next price on every market summary request"""
+
+    def __init__(self, prices: list):
+        self.prices = list(prices)
+        self.calls = 0
+
+    async def get_market_summary(self):
+        self.calls += 1
+        price = self.prices.pop(0)
+        if isinstance(price, Exception):
+            raise price
+        return _market_summary(price)
+
+
+def _generator(yahoo: StubYahoo, cache_dir: str) -> PdfReportGenerator:
+    generator = PdfReportGenerator(None, browser_pool=BrowserPool(health_check_interval=0),
+                                   report_cache=ReportCache(cache_dir))
+    generator.market_data = MarketDataCache(client=yahoo)
+
+    async def load_news(hours_back, after=None, before=None, **process_options):
+        return [{"time": "15:50", "link": "#", "message": "News since the draft"}]
+    generator._load_news_data = load_news
+    return generator
+
+
+def _draft() -> ReportDraft:
+    now = datetime.now(timezone.utc)
+    return ReportDraft("evening", 12, [{"time": "12:00", "link": "#", "message": "Draft news"}],
+                       now - timedelta(hours=12), now, time.time())
+
+
+async def _run_fire_time(prices: list, cache_dir: str):
+    yahoo = StubYahoo(prices)
+    generator = _generator(yahoo, cache_dir)
+    # the draft warmed the market data cache a moment ago, the copy is still fresh
+    draft_prices = await generator._load_market_summary()
+    prepared = await generator.prepare_report("evening", 12, draft=_draft())
+    return draft_prices, prepared, yahoo, generator
+
+
+def test_fire_time_reloads_prices():
+    """Prices at fire time come from a new load, not from the draft's cached copy"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        draft_prices, prepared, yahoo, generator = asyncio.run(_run_fire_time([6000.0, 6012.5], cache_dir))
+    assert yahoo.calls == 2
+    assert [symbol["price"] for symbol in draft_prices] == ["6000.00"]
+    assert [symbol["price"] for symbol in prepared.prices_data] == ["6012.50"]
+    assert generator.last_stage_timings["prices"]["status"] == "ok"
+
+
+def test_fire_time_falls_back_to_cached_prices():
+    """A failed reload falls back to the last cached market summary"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        draft_prices, prepared, yahoo, generator = asyncio.run(
+            _run_fire_time([6000.0, ConnectionError("Yahoo is down")], cache_dir)
+        )
+    assert yahoo.calls == 2
+    assert prepared.prices_data == draft_prices
+    assert generator.last_stage_timings["prices"]["status"] == "failed (fallback)"
+
+
+if __name__ == "__main__":
+    print("🚀 Report Draft Test Suite")
+    print("=" * 50)
+    test_fire_time_reloads_prices()
+    print("✅ Fire time reloads the prices")
+    test_fire_time_falls_back_to_cached_prices()
+    print("✅ Failed reload falls back to the cached prices")
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Test Resilience - circuit breaker transitions, the health registry call path and
+the retry policy, run offline against a local server that returns retryable statuses.
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from aiohttp import ClientSession, web
+from utils.resilience import (
+    RETRY_STATUSES, BreakerState, CircuitBreaker, CircuitOpenError, HealthRegistry, RetryPolicy, UpstreamStatusError
+)
+
+
+# no backoff, the tests don't wait
+NO_DELAY = RetryPolicy(max_attempts=4, base_delay=0, max_delay=0)
+
+
+async def _start_flaky_server(statuses: list):
+    """Local server answering with the given statuses in order, then 200"""
+    calls = []
+
+    async def handle(request):
+        status = statuses[len(calls)] if len(calls) < len(statuses) else 200
+        calls.append(status)
+        return web.json_response({"call": len(calls)}, status=status)
+
+    app = web.Application()
+    app.router.add_get("/", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/", calls
+
+
+def _attempt(session: ClientSession, url: str):
+    """One request the way the scrapers do it: retryable statuses raise"""
+    async def attempt():
+        async with session.get(url) as response:
+            if response.status in RETRY_STATUSES:
+                raise UpstreamStatusError(response.status, "local")
+            return await response.json()
+    return attempt
+
+
+def test_breaker_transitions():
+    """closed → open after the threshold → half_open after the timeout → closed on a good probe"""
+    transitions = []
+    breaker = CircuitBreaker("local", failure_threshold=2, recovery_timeout=0.05,
+                             on_transition=lambda _, old, new: transitions.append((old, new)))
+    assert breaker.state == BreakerState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == BreakerState.CLOSED and breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == BreakerState.OPEN
+    assert not breaker.allow_request() and breaker.stats["rejected"] == 1
+    assert breaker.retry_after() > 0
+
+    time.sleep(0.06)
+    assert breaker.state == BreakerState.HALF_OPEN
+    # one probe only
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == BreakerState.CLOSED and breaker.consecutive_failures == 0
+
+    assert transitions == [
+        (BreakerState.CLOSED, BreakerState.OPEN),
+        (BreakerState.OPEN, BreakerState.HALF_OPEN),
+        (BreakerState.HALF_OPEN, BreakerState.CLOSED),
+    ]
+
+
+def test_failed_probe_reopens():
+    """A failed half-open probe reopens the circuit at once"""
+    breaker = CircuitBreaker("local", failure_threshold=3, recovery_timeout=0.05)
+    for _ in range(3):
+        breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == BreakerState.OPEN and breaker.stats["opened"] == 2
+
+
+async def _run_open_circuit():
+    registry = HealthRegistry(failure_threshold=2, recovery_timeout=60, retry_policy=NO_DELAY)
+    notified = []
+
+    async def on_transition(breaker, old_state, new_state):
+        notified.append((breaker.host, new_state))
+    registry.subscribe(on_transition)
+    registry.subscribe(on_transition)
+
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        raise UpstreamStatusError(503, "local")
+
+    # the breaker opens on the second failure, the retry loop stops there
+    try:
+        await registry.call("local", failing)
+        raise AssertionError("call should have raised")
+    except CircuitOpenError as e:
+        assert e.host == "local" and e.retry_after > 0
+        assert isinstance(e.__cause__, UpstreamStatusError)
+    assert len(calls) == 2
+
+    # open: rejected without calling the upstream
+    try:
+        await registry.call("local", failing)
+        raise AssertionError("call should have raised")
+    except CircuitOpenError:
+        pass
+    assert len(calls) == 2
+    assert not registry.is_available("local")
+
+    await asyncio.sleep(0)
+    return registry.get_stats(), notified
+
+
+def test_registry_rejects_open_circuit():
+    """HealthRegistry.call raises CircuitOpenError instead of calling an open upstream"""
+    stats, notified = asyncio.run(_run_open_circuit())
+    host_stats = stats["hosts"]["local"]
+    assert host_stats["state"] == "open" and host_stats["rejected"] == 1 and host_stats["failures"] == 2
+    assert [(transition["from"], transition["to"]) for transition in stats["transitions"]] == [("closed", "open")]
+    # subscribed twice, notified once
+    assert notified == [("local", BreakerState.OPEN)]
+
+
+async def _run_retry_on_status(statuses: list, retry_policy: RetryPolicy):
+    runner, url, calls = await _start_flaky_server(statuses)
+    registry = HealthRegistry(failure_threshold=10, retry_policy=retry_policy)
+    try:
+        async with ClientSession() as session:
+            try:
+                result = await registry.call("local", _attempt(session, url))
+            except UpstreamStatusError as e:
+                result = e
+    finally:
+        await runner.cleanup()
+    return result, calls, registry.get_breaker("local")
+
+
+def test_retry_on_status():
+    """Retryable statuses are retried until a success, the breaker stays closed"""
+    result, calls, breaker = asyncio.run(_run_retry_on_status([503, 429], NO_DELAY))
+    assert result == {"call": 3}
+    assert calls == [503, 429, 200]
+    assert breaker.state == BreakerState.CLOSED
+    assert breaker.stats["failures"] == 2 and breaker.stats["successes"] == 1
+
+
+def test_retry_gives_up_after_max_attempts():
+    """The last failure is raised once every attempt is used"""
+    policy = RetryPolicy(max_attempts=2, base_delay=0, max_delay=0)
+    result, calls, breaker = asyncio.run(_run_retry_on_status([502, 502, 502], policy))
+    assert isinstance(result, UpstreamStatusError) and result.status == 502
+    assert calls == [502, 502]
+    assert breaker.consecutive_failures == 2
+
+
+def test_retry_delay_is_bounded():
+    """Jittered backoff stays within the exponential cap"""
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    for attempt, cap in ((1, 1.0), (2, 2.0), (3, 4.0), (6, 5.0)):
+        assert all(0 <= policy.get_delay(attempt) <= cap for _ in range(100))
+
+
+if __name__ == "__main__":
+    print("🚀 Resilience Test Suite")
+    print("=" * 50)
+    test_breaker_transitions()
+    print("✅ Breaker goes closed → open → half_open → closed")
+    test_failed_probe_reopens()
+    print("✅ Failed probe reopens the breaker")
+    test_registry_rejects_open_circuit()
+    print("✅ Open circuit raises CircuitOpenError")
+    test_retry_on_status()
+    print("✅ Retryable statuses are retried")
+    test_retry_gives_up_after_max_attempts()
+    print("✅ Retries stop at max attempts")
+    test_retry_delay_is_bounded()
+    print("✅ Backoff delay is bounded")
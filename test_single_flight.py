@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test Single Flight - coalescing of concurrent identical calls, memoized results,
+and the bounds that keep the memo from growing with every distinct key.
+"""
+
+import sys
+import os
+import asyncio
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.single_flight import SingleFlight, freeze_key
+
+
+class Call:
+    """Counts executions, returns the key"""
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.executions = 0
+
+    def __call__(self, key):
+        async def run():
+            self.executions += 1
+            await asyncio.sleep(self.delay)
+            return key
+        return run
+
+
+def test_concurrent_calls_share_one_execution():
+    """Identical concurrent calls run once, then the result is memoized"""
+    async def run():
+        group, call = SingleFlight("test", ttl=60), Call(delay=0.01)
+        key = freeze_key({"dateFrom": "2025-07-01", "country": [5]})
+        results = await asyncio.gather(*[group.do(key, call(key)) for _ in range(3)])
+        results.append(await group.do(freeze_key({"country": [5], "dateFrom": "2025-07-01"}), call(key)))
+        return results, call.executions, group.get_stats()
+
+    results, executions, stats = asyncio.run(run())
+    assert len(set(results)) == 1 and executions == 1
+    assert stats["coalesced"] == 2 and stats["cache_hits"] == 1 and stats["memoized"] == 1
+
+
+def test_expired_results_are_swept_on_insert():
+    """Results of keys never asked again are dropped once expired"""
+    async def run():
+        group, call = SingleFlight("test", ttl=0.01), Call()
+        for window in range(5):
+            await group.do(("window", window), call(window))
+        memoized_before = len(group._results)
+        await asyncio.sleep(0.02)
+        await group.do(("window", 99), call(99))
+        return memoized_before, list(group._results)
+
+    memoized_before, memoized_after = asyncio.run(run())
+    assert memoized_before == 5
+    assert memoized_after == [("window", 99)]
+
+
+def test_memo_is_bounded():
+    """At most max_entries results are kept, the least recently used go first"""
+    async def run():
+        group, call = SingleFlight("test", ttl=60, max_entries=3), Call()
+        for window in range(3):
+            await group.do(window, call(window))
+        # a hit makes 0 the most recently used
+        await group.do(0, call(0))
+        await group.do(3, call(3))
+        return list(group._results), call.executions
+
+    memoized, executions = asyncio.run(run())
+    assert memoized == [2, 0, 3]
+    assert executions == 4
+
+
+if __name__ == "__main__":
+    print("🚀 Single Flight Test Suite")
+    print("=" * 50)
+    test_concurrent_calls_share_one_execution()
+    print("✅ Concurrent calls share one execution")
+    test_expired_results_are_swept_on_insert()
+    print("✅ Expired results are swept")
+    test_memo_is_bounded()
+    print("✅ Memo is bounded")
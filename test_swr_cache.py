@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Test SWR Cache - fresh / stale / expired transitions of the stale-while-revalidate
+cache, dedup of background revalidations and concurrent loads, peek and refresh,
+and the market data cache built on it. Time is controlled by aging the entries.
+"""
+
+import sys
+import os
+import asyncio
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.swr_cache import SWRCache
+from yf_scraper.market_data_cache import MarketDataCache
+
+TTL, MAX_STALE = 10, 60
+
+
+class Loader:
+    """Returns value-1, value-2, ... (or raises), counting calls, optionally slow"""
+
+    def __init__(self, delay: float = 0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        call = self.calls
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("upstream down")
+        return f"value-{call}"
+
+
+def _age(cache: SWRCache, key, seconds: float):
+    """Make a cached value `seconds` older"""
+    cache._entries[key].loaded_at -= seconds
+
+
+async def _settle():
+    """Let background refreshes run"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_fresh_value_is_served_from_cache():
+    """A value younger than the ttl is served without loading"""
+    async def run():
+        cache, loader = SWRCache("test"), Loader()
+        first = await cache.get("key", loader, TTL, MAX_STALE)
+        _age(cache, "key", TTL - 1)
+        second = await cache.get("key", loader, TTL, MAX_STALE)
+        return first, second, loader.calls, cache.get_stats()
+
+    first, second, calls, stats = asyncio.run(run())
+    assert first == second == "value-1" and calls == 1
+    assert stats["misses"] == 1 and stats["hits"] == 1
+
+
+def test_stale_value_is_served_while_one_refresh_runs():
+    """Stale values are served at once while a single background refresh runs"""
+    async def run():
+        cache, loader = SWRCache("test"), Loader(delay=0.01)
+        await cache.get("key", loader, TTL, MAX_STALE)
+        _age(cache, "key", TTL + 1)
+        # stale: every caller gets the old value at once, only one revalidation starts
+        stale = await asyncio.gather(*[cache.get("key", loader, TTL, MAX_STALE) for _ in range(5)])
+        calls_while_refreshing = loader.calls
+        await asyncio.sleep(0.05)
+        refreshed = await cache.get("key", loader, TTL, MAX_STALE)
+        return stale, calls_while_refreshing, refreshed, loader.calls, cache.get_stats()
+
+    stale, calls_while_refreshing, refreshed, calls, stats = asyncio.run(run())
+    assert stale == ["value-1"] * 5
+    assert calls_while_refreshing == 2
+    assert refreshed == "value-2" and calls == 2
+    assert stats["stale_hits"] == 5 and stats["refreshes"] == 1 and stats["hits"] == 1
+
+
+def test_expired_value_waits_for_a_shared_load():
+    """Past max_stale the callers wait for one load they all share"""
+    async def run():
+        cache, loader = SWRCache("test"), Loader(delay=0.01)
+        await cache.get("key", loader, TTL, MAX_STALE)
+        _age(cache, "key", MAX_STALE + 1)
+        values = await asyncio.gather(*[cache.get("key", loader, TTL, MAX_STALE) for _ in range(3)])
+        return values, loader.calls, cache.get_stats()
+
+    values, calls, stats = asyncio.run(run())
+    assert values == ["value-2"] * 3 and calls == 2
+    assert stats["misses"] == 2 and stats["coalesced"] == 2
+
+
+def test_failed_load_keeps_the_last_value():
+    """A failed load serves the last value, and raises only when there is none"""
+    async def run():
+        cache = SWRCache("test")
+        await cache.get("key", Loader(), TTL, MAX_STALE)
+        _age(cache, "key", MAX_STALE + 1)
+        expired = await cache.get("key", Loader(fail=True), TTL, MAX_STALE)
+
+        # a failed background revalidation keeps the stale value too
+        _age(cache, "key", -MAX_STALE + TTL)
+        stale = await cache.get("key", Loader(fail=True), TTL, MAX_STALE)
+        await _settle()
+        try:
+            await cache.get("other", Loader(fail=True), TTL, MAX_STALE)
+            raised = False
+        except ConnectionError:
+            raised = True
+        return expired, stale, cache.peek("key"), raised, cache.get_stats()
+
+    expired, stale, peeked, raised, stats = asyncio.run(run())
+    assert expired == stale == peeked == "value-1"
+    assert raised and stats["errors"] == 3
+
+
+def test_peek_never_loads():
+    """peek returns the cached value whatever its age, without loading"""
+    async def run():
+        cache, loader = SWRCache("test"), Loader()
+        missing = cache.peek("key")
+        await cache.get("key", loader, TTL, MAX_STALE)
+        _age(cache, "key", MAX_STALE * 10)
+        old = cache.peek("key")
+        cache.invalidate("key")
+        return missing, old, cache.peek("key"), loader.calls
+
+    missing, old, invalidated, calls = asyncio.run(run())
+    assert missing is None and old == "value-1" and invalidated is None and calls == 1
+
+
+def test_refresh_bypasses_a_fresh_value():
+    """refresh loads even when the cached value is fresh"""
+    async def run():
+        cache, loader = SWRCache("test"), Loader(delay=0.01)
+        await cache.get("key", loader, TTL, MAX_STALE)
+        # concurrent refreshes share one load
+        refreshed = await asyncio.gather(cache.refresh("key", loader), cache.refresh("key", loader))
+        served = await cache.get("key", loader, TTL, MAX_STALE)
+        try:
+            await cache.refresh("key", Loader(fail=True))
+            raised = False
+        except ConnectionError:
+            raised = True
+        return refreshed, served, loader.calls, raised, cache.peek("key")
+
+    refreshed, served, calls, raised, peeked = asyncio.run(run())
+    assert refreshed == ["value-2", "value-2"] and served == "value-2" and calls == 2
+    # a failed refresh raises, the last value stays for fallbacks
+    assert raised and peeked == "value-2"
+
+
+class StubYahoo:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_market_summary(self):
+        self.calls += 1
+        return {"summary": self.calls}
+
+
+def test_market_data_cache_fresh_summary():
+    """get_market_summary serves the cache, fresh=True always reloads"""
+    async def run():
+        yahoo = StubYahoo()
+        market_data = MarketDataCache(client=yahoo)
+        first = await market_data.get_market_summary()
+        ttl, max_stale = market_data.ttls["market_summary"]
+        _age(market_data.cache, "market_summary", ttl + 1)
+        stale = await market_data.get_market_summary()
+        await _settle()
+        _age(market_data.cache, "market_summary", ttl + 1)
+        fresh = await market_data.get_market_summary(fresh=True)
+        return first, stale, fresh, market_data.get_last_market_summary()
+
+    first, stale, fresh, last = asyncio.run(run())
+    assert first == stale == {"summary": 1}
+    assert fresh == last == {"summary": 3}
+
+
+if __name__ == "__main__":
+    print("🚀 SWR Cache Test Suite")
+    print("=" * 50)
+    test_fresh_value_is_served_from_cache()
+    print("✅ Fresh values are served from the cache")
+    test_stale_value_is_served_while_one_refresh_runs()
+    print("✅ Stale values are served while one refresh runs")
+    test_expired_value_waits_for_a_shared_load()
+    print("✅ Expired values wait for a shared load")
+    test_failed_load_keeps_the_last_value()
+    print("✅ Failed loads keep the last value")
+    test_peek_never_loads()
+    print("✅ peek never loads")
+    test_refresh_bypasses_a_fresh_value()
+    print("✅ refresh bypasses a fresh value")
+    test_market_data_cache_fresh_summary()
+    print("✅ Market data cache reloads the summary when asked")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Test Table Parsers - parity between the lxml and bs4 calendar table engines,
+plus a benchmark. The saved calendars in data/investing_scraper are rendered back
+into investing.com table markup and parsed by every engine.
+"""
+
+import sys
+import os
+import csv
+import json
+import time
+from html import escape
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from investing_scraper.scrape_plans import ScrapePlanRegistry
+from investing_scraper.table_parsers import BeautifulSoupTableParser, LxmlTableParser, LXML_AVAILABLE
+
+
+FIXTURES_DIR = os.path.join("data", "investing_scraper")
+CSV_FIXTURES = {
+    "economic_calendar": "economic_calendar_2025-07-15.csv",
+    "earnings_calendar": "earnings_calendar_2025-07-13.csv",
+    "holiday_calendar": "holiday_calendar_2025-07-15.csv",
+}
+
+
+def _cell(value):
+    return escape(value or "")
+
+
+def _economic_row(event, date=None):
+    date_row = f'<tr><td colspan="8" class="theDay" id="theDay1">{_cell(date)}</td></tr>' if date else ""
+    return date_row + (
+        '<tr class="js-event-item">'
+        f'<td class="first left time js-time">{_cell(event.get("time"))}</td>'
+        f'<td class="left flagCur noWrap"><span title="{_cell(event.get("country"))}" class="ceFlags"></span>&nbsp;USD</td>'
+        f'<td class="left textNum sentiment noWrap" title="{_cell(event.get("volatility"))}"><i class="grayFullBullishIcon"></i></td>'
+        f'<td class="left event"><a href="#">{_cell(event.get("description"))}</a></td>'
+        f'<td class="bold act blackFont">{_cell(event.get("actual"))}</td>'
+        f'<td class="fore">{_cell(event.get("forecast"))}</td>'
+        f'<td class="prev blackFont">{_cell(event.get("previous"))}</td>'
+        '<td class="alert js-injected-user-alert-container"></td>'
+        '</tr>'
+    )
+
+
+def _earnings_row(event, date=None):
+    date_row = f'<tr><td colspan="9" class="theDay">{_cell(date)}</td></tr>' if date else ""
+    return date_row + (
+        '<tr>'
+        f'<td class="flag"><span title="{_cell(event.get("country"))}" class="ceFlags"></span></td>'
+        f'<td class="left noWrap earnCalCompany"><span class="earnCalCompanyName">{_cell(event.get("company_name"))}</span>&nbsp;(<a href="#">{_cell(event.get("company_ticker"))}</a>)</td>'
+        f'<td class="leftStrong">{_cell(event.get("eps"))}</td>'
+        f'<td class="leftStrong">{_cell(event.get("eps_forcast"))}</td>'
+        f'<td class="leftStrong">{_cell(event.get("revenue"))}</td>'
+        f'<td class="leftStrong">{_cell(event.get("revenue_forcast"))}</td>'
+        f'<td class="right">{_cell(event.get("company_mkcap"))}</td>'
+        f'<td class="right time"><span class="genToolTip oneliner reverseToolTip" data-tooltip="{_cell(event.get("time"))}"></span></td>'
+        '</tr>'
+    )
+
+
+def _holiday_row(event, date=None):
+    return (
+        '<tr>'
+        f'<td class="date bold center">{_cell(date)}</td>'
+        f'<td class="bold cur"><span class="ceFlags"></span><a href="#">{_cell(event.get("country"))}</a></td>'
+        f'<td>{_cell(event.get("exchange_name"))}</td>'
+        f'<td class="last">{_cell(event.get("holiday"))}</td>'
+        '</tr>'
+    )
+
+
+ROW_BUILDERS = {
+    "economic_calendar": _economic_row,
+    "earnings_calendar": _earnings_row,
+    "holiday_calendar": _holiday_row,
+}
+
+
+def build_table_html(page_name: str, events_by_date: dict) -> str:
+    """Render saved events back into the <tr> markup investing.com returns"""
+    build_row = ROW_BUILDERS[page_name]
+    rows = []
+    for date, events in events_by_date.items():
+        for index, event in enumerate(events):
+            rows.append(build_row(event, date if index == 0 else None))
+    return "\n".join(rows)
+
+
+def load_fixtures() -> dict:
+    """Load the saved calendars as {name: (page_name, events_by_date)}"""
+    fixtures = {}
+    for page_name, file_name in CSV_FIXTURES.items():
+        events_by_date = {}
+        with open(os.path.join(FIXTURES_DIR, file_name), encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                date = row.pop("date")
+                events_by_date.setdefault(date, []).append({key: value or None for key, value in row.items()})
+        fixtures[file_name] = (page_name, events_by_date)
+
+    with open(os.path.join(FIXTURES_DIR, "temp.json"), encoding="utf-8") as f:
+        fixtures["temp.json"] = ("economic_calendar", json.load(f))
+    return fixtures
+
+
+def _parsers():
+    parsers = [BeautifulSoupTableParser()]
+    if LXML_AVAILABLE:
+        parsers.append(LxmlTableParser())
+    return parsers
+
+
+def test_parsers_match_fixtures():
+    """Every engine recovers exactly the saved events"""
+    registry = ScrapePlanRegistry()
+    for name, (page_name, expected) in load_fixtures().items():
+        plan = registry.get_plan(page_name)
+        table_html = build_table_html(page_name, expected)
+        for parser in _parsers():
+            parsed = parser.parse(plan, table_html)
+            assert parsed == expected, f"{parser.name} does not match fixture {name}"
+
+
+def test_lxml_matches_reference_engine():
+    """The lxml engine returns exactly what the bs4 reference engine returns"""
+    if not LXML_AVAILABLE:
+        print("⚠️ lxml is not installed, skipping")
+        return
+    registry = ScrapePlanRegistry()
+    reference, fast = BeautifulSoupTableParser(), LxmlTableParser()
+    for name, (page_name, events_by_date) in load_fixtures().items():
+        plan = registry.get_plan(page_name)
+        table_html = build_table_html(page_name, events_by_date)
+        assert fast.parse(plan, table_html) == reference.parse(plan, table_html), f"Engines differ on {name}"
+        # malformed and empty tables
+        assert fast.parse(plan, "") == reference.parse(plan, "")
+        assert fast.parse(plan, "<tr><td>only</td></tr>") == reference.parse(plan, "<tr><td>only</td></tr>")
+
+
+def benchmark_parsers(repeat: int = 50, rounds: int = 5):
+    """Benchmark the engines on the fixtures, enlarged to a week-long range"""
+    registry = ScrapePlanRegistry()
+    for name, (page_name, events_by_date) in load_fixtures().items():
+        plan = registry.get_plan(page_name)
+        # repeat the dates to simulate a week-long / custom range calendar
+        enlarged = {f"{date} #{copy}": events for copy in range(repeat) for date, events in events_by_date.items()}
+        table_html = build_table_html(page_name, enlarged)
+        row_count = sum(len(events) for events in enlarged.values())
+
+        results = {}
+        for parser in _parsers():
+            start = time.perf_counter()
+            for _ in range(rounds):
+                parser.parse(plan, table_html)
+            results[parser.name] = (time.perf_counter() - start) / rounds
+
+        summary = ", ".join(f"{engine}: {seconds * 1000:.1f}ms" for engine, seconds in results.items())
+        if "lxml" in results:
+            summary += f" (x{results['bs4'] / results['lxml']:.1f})"
+        print(f"📊 {name} ({row_count} rows): {summary}")
+
+
+if __name__ == "__main__":
+    print("🚀 Table Parsers Test Suite")
+    print("=" * 50)
+    test_parsers_match_fixtures()
+    print("✅ All engines match the saved fixtures")
+    test_lxml_matches_reference_engine()
+    print("✅ lxml engine matches the bs4 reference engine")
+    print()
+    benchmark_parsers()
@@ -0,0 +1,58 @@
+"""
+Upstream health report: circuit breakers of the health registry and the
+pooled HTTP sessions, for the !status command and the periodic health log.
+"""
+
+from utils.http_session import get_all_http_stats
+from utils.logger import logger
+from utils.resilience import get_health_registry
+
+
+def format_health_report() -> str:
+    """
+    Build a readable report of the breakers and HTTP pools
+
+    Returns:
+        str: One line per breaker and per pool
+    """
+    health = get_health_registry().get_stats()
+    lines = ["Circuit breakers:"]
+    for host, stats in health["hosts"].items():
+        line = (f"  {host}: {stats['state']}, {stats['successes']} ok / {stats['failures']} failed, "
+                f"opened {stats['opened']}x, rejected {stats['rejected']}")
+        if stats["retry_after"]:
+            line += f", retry in {stats['retry_after']:.0f}s"
+        lines.append(line)
+    if not health["hosts"]:
+        lines.append("  (no upstream called yet)")
+    for transition in health["transitions"][-5:]:
+        lines.append(f"  last: {transition['host']} {transition['from']} → {transition['to']}")
+
+    lines.append("HTTP pools:")
+    http_stats = get_all_http_stats()
+    for name, stats in http_stats.items():
+        line = (f"  {name}: {stats['requests']} requests, {stats['errors']} errors, "
+                f"reuse {stats['reuse_ratio']:.0%}, {'open' if stats['open'] else 'closed'}")
+        proxies = stats.get("proxies")
+        if proxies:
+            ejected = sum(1 for proxy in proxies.values() if proxy["ejected"])
+            line += f", {len(proxies) - ejected}/{len(proxies)} proxies healthy"
+        lines.append(line)
+    if not http_stats:
+        lines.append("  (no session opened yet)")
+    return "\n".join(lines)
+
+
+def log_health_report():
+    """Write a one-line summary of the breakers and HTTP pools to the log"""
+    health = get_health_registry().get_stats()
+    breakers = ", ".join(
+        f"{host} {stats['state']} ({stats['failures']} failed, opened {stats['opened']}x)"
+        for host, stats in health["hosts"].items()
+    ) or "none"
+    pools = ", ".join(
+        f"{name} {stats['requests']} req/{stats['errors']} err"
+        for name, stats in get_all_http_stats().items()
+    ) or "none"
+    logger.info(f"🩺 Upstream health - breakers: {breakers} | HTTP pools: {pools} | "
+                f"{len(health['transitions'])} recent transitions")
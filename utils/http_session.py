@@ -0,0 +1,193 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+import aiohttp
+from utils.logger import logger
+from utils.proxy_pool import PROXY_FAILURE_STATUSES, ProxyPool
+
+
+class PooledHttpSession:
+    """
+    Long-lived aiohttp session backed by a keep-alive connection pool.
+
+    The underlying ClientSession is created lazily inside the running event loop
+    and reused for every request, so DNS, TCP and TLS setup is paid once per
+    pooled connection instead of once per request.
+    """
+
+    def __init__(self, name: str, limit: int = 100, limit_per_host: int = 8,
+                 keepalive_timeout: float = 60, timeout: float = 30, headers: dict = None,
+                 proxy_pool: ProxyPool = None, use_cookie_jar: bool = True):
+        """
+        Initialize the pooled session.
+
+        Args:
+            name (str): Name used in logs and stats
+            limit (int): Maximum number of open connections in the pool
+            limit_per_host (int): Maximum number of open connections per host
+            keepalive_timeout (float): Seconds an idle connection is kept alive
+            timeout (float): Total timeout in seconds for a single request
+            headers (dict): Default headers sent with every request
+            proxy_pool (ProxyPool): Route every request through the best healthy proxy of this pool
+            use_cookie_jar (bool): Keep response cookies (disable when the caller manages cookies itself)
+        """
+        self.name = name
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.headers = headers
+        self.proxy_pool = proxy_pool
+        self.use_cookie_jar = use_cookie_jar
+        self._session = None
+        self._loop = None
+        self._lock = None
+        self.stats = {
+            "requests": 0,
+            "errors": 0,
+            "new_connections": 0,
+            "reused_connections": 0,
+            "sessions_created": 0,
+        }
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """Build a trace config that counts new versus reused pool connections"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_connection_create_end(session, context, params):
+            self.stats["new_connections"] += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self.stats["reused_connections"] += 1
+
+        async def on_request_end(session, context, params):
+            self.stats["requests"] += 1
+
+        async def on_request_exception(session, context, params):
+            self.stats["errors"] += 1
+
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        return trace_config
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Get the shared ClientSession, creating it in the running loop if needed"""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is loop:
+            return self._session
+
+        # a session is bound to the loop it was created in (scripts call asyncio.run repeatedly)
+        if self._loop is not loop:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._session is None or self._session.closed or self._loop is not loop:
+                connector = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=300,
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    headers=self.headers,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    trace_configs=[self._build_trace_config()],
+                    cookie_jar=None if self.use_cookie_jar else aiohttp.DummyCookieJar(),
+                )
+                self._loop = loop
+                self.stats["sessions_created"] += 1
+                logger.debug(f"Created pooled HTTP session: {self.name}")
+        return self._session
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, **kwargs):
+        """
+        Send a request through the pooled session.
+
+        Usage:
+            async with http_session.request("POST", url, data=payload) as response:
+                body = await response.read()
+
+        With a proxy pool, `sticky_key=...` keeps related requests on the same exit.
+        """
+        session = await self.get_session()
+        sticky_key = kwargs.pop("sticky_key", None)
+        if self.proxy_pool is None or "proxy" in kwargs:
+            async with session.request(method, url, **kwargs) as response:
+                yield response
+            return
+
+        endpoint = self.proxy_pool.acquire(sticky_key)
+        started = time.monotonic()
+        recorded = False
+        try:
+            async with session.request(method, url, proxy=endpoint.url, **kwargs) as response:
+                self.proxy_pool.record(
+                    endpoint, response.status not in PROXY_FAILURE_STATUSES, time.monotonic() - started
+                )
+                recorded = True
+                yield response
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # connect/tunnel errors count against the exit, errors while the caller reads the body don't
+            if not recorded:
+                self.proxy_pool.record(endpoint, False)
+            raise
+
+    def get_stats(self) -> dict:
+        """Get pool statistics (requests, errors, new vs reused connections)"""
+        stats = dict(self.stats)
+        opened = stats["new_connections"] + stats["reused_connections"]
+        stats["reuse_ratio"] = round(stats["reused_connections"] / opened, 3) if opened else 0.0
+        stats["open"] = self._session is not None and not self._session.closed
+        if self.proxy_pool is not None:
+            stats["proxies"] = self.proxy_pool.get_stats()
+        return stats
+
+    async def close(self):
+        """Close the session and release all pooled connections"""
+        session, loop = self._session, self._loop
+        self._session = None
+        self._loop = None
+        if session is None or session.closed:
+            return
+        try:
+            # a session from another (finished) loop can't be awaited here, it is just dropped
+            if loop is asyncio.get_running_loop():
+                await session.close()
+            logger.info(f"✅ Closed HTTP session {self.name}: {self.get_stats()}")
+        except Exception as e:
+            logger.error(f"❌ Error closing HTTP session {self.name}: {e}")
+
+
+# Global pooled sessions, one per upstream
+_http_sessions = {}
+
+
+def get_http_session(name: str, **kwargs) -> PooledHttpSession:
+    """
+    Get or create a named global pooled HTTP session
+
+    Args:
+        name (str): Session name (usually one per upstream host)
+        **kwargs: PooledHttpSession arguments, used only when the session is created
+
+    Returns:
+        PooledHttpSession: Global pooled session instance
+    """
+    if name not in _http_sessions:
+        _http_sessions[name] = PooledHttpSession(name, **kwargs)
+    return _http_sessions[name]
+
+
+def get_all_http_stats() -> dict:
+    """Get pool statistics for every global session"""
+    return {name: session.get_stats() for name, session in _http_sessions.items()}
+
+
+async def close_all_http_sessions():
+    """Close every global pooled session (called on bot shutdown)"""
+    for session in list(_http_sessions.values()):
+        await session.close()
@@ -0,0 +1,100 @@
+"""
+JSON codec used by the scrapers, the AI parsing and the report building.
+
+orjson is used when it is installed, the stdlib json module otherwise. Both
+backends behave the same for the data this bot handles:
+- dumps() is compact by default (machine-only payloads), pretty=True indents
+- non-ASCII text is written as UTF-8, not \\u escapes
+- decode errors raise json.JSONDecodeError (orjson's error is a subclass)
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from utils.logger import logger
+
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def _orjson_loads(data):
+    return orjson.loads(data)
+
+
+def _orjson_dumps(obj, pretty: bool = False) -> bytes:
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    return orjson.dumps(obj, option=option)
+
+
+def _stdlib_loads(data):
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj, pretty: bool = False) -> bytes:
+    if pretty:
+        text = json.dumps(obj, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+BACKENDS = {"json": (_stdlib_loads, _stdlib_dumps)}
+if orjson is not None:
+    BACKENDS["orjson"] = (_orjson_loads, _orjson_dumps)
+
+_backend = "orjson" if orjson is not None else "json"
+
+
+def get_backend() -> str:
+    """Name of the backend in use ("orjson" or "json")"""
+    return _backend
+
+
+def set_backend(name: str):
+    """
+    Switch the backend (used by benchmarks, or to rule out the codec when debugging)
+
+    Args:
+        name (str): "orjson" or "json"
+    """
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"JSON backend {name} is not available (available: {', '.join(BACKENDS)})")
+    _backend = name
+    logger.debug(f"JSON backend set to {name}")
+
+
+def loads(data):
+    """
+    Parse JSON
+
+    Args:
+        data (str | bytes): JSON text, bytes are decoded as UTF-8 (no need to decode them first)
+
+    Returns:
+        The parsed value
+    """
+    return BACKENDS[_backend][0](data)
+
+
+def dumps_bytes(obj, pretty: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes
+
+    Args:
+        obj: Value to serialize
+        pretty (bool): Indent with 2 spaces (for files people read), compact otherwise
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    return BACKENDS[_backend][1](obj, pretty)
+
+
+def dumps(obj, pretty: bool = False) -> str:
+    """Serialize to a JSON string (see dumps_bytes)"""
+    return dumps_bytes(obj, pretty).decode("utf-8")
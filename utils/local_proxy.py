@@ -0,0 +1,161 @@
+"""
+Local stand-in forward proxy for testing the proxy pool offline.
+
+Handles plain http requests (absolute-form) and CONNECT tunnels, records the
+Proxy-Authorization usernames it sees (to check sticky sessions) and can add
+latency or fail requests on purpose.
+"""
+
+import asyncio
+import base64
+import random
+from urllib.parse import urlsplit
+from utils.logger import logger
+
+
+class LocalForwardProxy:
+    """Minimal asyncio HTTP forward proxy with fault injection"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, delay: float = 0.0, fail_rate: float = 0.0):
+        """
+        Initialize the proxy.
+
+        Args:
+            host (str): Listen address
+            port (int): Listen port (0 picks a free port)
+            delay (float): Seconds added before every response
+            fail_rate (float): Share of requests answered with 502 Bad Gateway
+        """
+        self.host = host
+        self.port = port
+        self.delay = delay
+        self.fail_rate = fail_rate
+        self.usernames = []
+        self.stats = {"requests": 0, "failed": 0, "tunnels": 0}
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def proxy_url(self, username: str = "user", password: str = "pass") -> str:
+        """Proxy url with credentials, like the ones of the proxy pool"""
+        return f"http://{username}:{password}@{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.debug(f"Local proxy listening on {self.url}")
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            request_line, *header_lines = head.decode("latin-1").split("\r\n")
+            method, target, version = request_line.split(" ", 2)
+            headers = {}
+            for line in header_lines:
+                if ":" in line:
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+
+            self.stats["requests"] += 1
+            self._record_username(headers.get("proxy-authorization"))
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if random.random() < self.fail_rate:
+                self.stats["failed"] += 1
+                writer.write(b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+                await writer.drain()
+                return
+
+            if method == "CONNECT":
+                await self._tunnel(target, reader, writer)
+            else:
+                await self._forward(method, target, version, header_lines, reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:
+            logger.error(f"❌ Local proxy error: {e}")
+        finally:
+            writer.close()
+
+    def _record_username(self, authorization: str):
+        if not authorization or not authorization.lower().startswith("basic "):
+            return
+        credentials = base64.b64decode(authorization.split(" ", 1)[1]).decode("latin-1")
+        self.usernames.append(credentials.split(":", 1)[0])
+
+    async def _tunnel(self, target: str, reader, writer):
+        host, port = target.rsplit(":", 1)
+        upstream_reader, upstream_writer = await asyncio.open_connection(host, int(port))
+        self.stats["tunnels"] += 1
+        writer.write(b"HTTP/1.1 200 Connection Established\r\n\r\n")
+        await writer.drain()
+        await self._relay(reader, writer, upstream_reader, upstream_writer)
+
+    async def _forward(self, method, target, version, header_lines, reader, writer):
+        url = urlsplit(target)
+        path = url.path or "/"
+        if url.query:
+            path += f"?{url.query}"
+
+        # one request per connection keeps the relay simple
+        forwarded = [f"{method} {path} {version}"]
+        for line in header_lines:
+            name = line.split(":", 1)[0].strip().lower()
+            if line and name not in ("proxy-authorization", "proxy-connection", "connection"):
+                forwarded.append(line)
+        forwarded.append("Connection: close")
+
+        upstream_reader, upstream_writer = await asyncio.open_connection(url.hostname, url.port or 80)
+        upstream_writer.write(("\r\n".join(forwarded) + "\r\n\r\n").encode("latin-1"))
+        await self._relay(reader, writer, upstream_reader, upstream_writer)
+
+    async def _relay(self, reader, writer, upstream_reader, upstream_writer):
+        """Pipe both directions until the upstream is done"""
+        to_upstream = asyncio.ensure_future(self._pipe(reader, upstream_writer))
+        try:
+            await self._pipe(upstream_reader, writer)
+        finally:
+            to_upstream.cancel()
+            upstream_writer.close()
+
+    @staticmethod
+    async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while not reader.at_eof():
+                data = await reader.read(65536)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if writer.can_write_eof():
+                try:
+                    writer.write_eof()
+                except (OSError, RuntimeError):
+                    pass
+
+
+if __name__ == "__main__":
+    async def main():
+        async with LocalForwardProxy(port=8899) as proxy:
+            print(f"Proxy running on {proxy.url}, Ctrl+C to stop")
+            await asyncio.Event().wait()
+
+    asyncio.run(main())
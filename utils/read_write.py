@@ -1,4 +1,5 @@
 import json
+from utils import json_codec
 from utils.logger import logger
 from utils.caller_info import get_function_and_caller_info
 
@@ -24,12 +25,12 @@ def write_text_file(file_path, data):
 
 def read_json_file(file_path):
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return json_codec.loads(f.read())
     except FileNotFoundError:
         logger.error(f"File not found: {file_path} ({get_function_and_caller_info()})")
         return None
-    except json.JSONDecodeError:
+    except json_codec.JSONDecodeError:
         logger.error(f"JSONDecodeError in read_json_file: {file_path} ({get_function_and_caller_info()})")
         return None
     except Exception as e:
@@ -37,11 +38,16 @@ def read_json_file(file_path):
         return None
 
 def write_json_file(file_path, data, indent=4):
+    # indent=None/0 writes compact json, the codec pretty-prints with 2 spaces, other indents go through stdlib json
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
-    except json.JSONDecodeError:
-        logger.error(f"JSONDecodeError in write_json_file: {file_path} ({get_function_and_caller_info()})")
+        if indent and indent != 2:
+            encoded = json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
+        else:
+            encoded = json_codec.dumps_bytes(data, pretty=bool(indent))
+        with open(file_path, "wb") as f:
+            f.write(encoded)
+    except TypeError as e:
+        logger.error(f"Value is not JSON serializable in write_json_file: {file_path}: {e} ({get_function_and_caller_info()})")
         return None
     except Exception as e:
         logger.error(f"Error in write_json_file: {str(e)} ({get_function_and_caller_info()})")
@@ -0,0 +1,287 @@
+import asyncio
+import random
+import time
+from enum import StrEnum
+from typing import Awaitable, Callable
+import aiohttp
+from utils.logger import logger
+
+
+# Upstream statuses worth retrying (403/429 are how investing.com rate limits us)
+RETRY_STATUSES = (403, 429, 500, 502, 503, 504)
+
+
+class BreakerState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class UpstreamStatusError(Exception):
+    """Retryable HTTP status from an upstream host"""
+
+    def __init__(self, status: int, host: str = None):
+        super().__init__(f"{host or 'upstream'} returned status {status}")
+        self.status = status
+        self.host = host
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host whose circuit breaker is open"""
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(f"Circuit breaker for {host} is open, retry in {retry_after:.0f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter"""
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 1.0, max_delay: float = 30.0):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts (int): Attempts including the first one
+            base_delay (float): Backoff of the first retry in seconds
+            max_delay (float): Maximum backoff in seconds
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def get_delay(self, attempt: int) -> float:
+        """Random delay before retry number `attempt` (1-based), so callers don't retry in lockstep"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of one upstream host.
+
+    closed: requests pass, consecutive failures are counted.
+    open: requests are rejected until recovery_timeout passes.
+    half_open: one probe request is let through, its result closes or reopens the circuit.
+    """
+
+    def __init__(self, host: str, failure_threshold: int = 5, recovery_timeout: float = 120,
+                 on_transition: Callable = None):
+        """
+        Initialize the breaker.
+
+        Args:
+            host (str): Upstream host name
+            failure_threshold (int): Consecutive failures that open the circuit
+            recovery_timeout (float): Seconds the circuit stays open before a probe
+            on_transition (callable): Called with (breaker, old_state, new_state)
+        """
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.on_transition = on_transition
+        self._state = BreakerState.CLOSED
+        self._opened_at = None
+        self._probe_in_flight = False
+        self.consecutive_failures = 0
+        self.stats = {"successes": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    def _set_state(self, new_state: BreakerState):
+        old_state = self._state
+        if old_state == new_state:
+            return
+        self._state = new_state
+        if new_state == BreakerState.OPEN:
+            self._opened_at = time.monotonic()
+            self.stats["opened"] += 1
+        if self.on_transition:
+            self.on_transition(self, old_state, new_state)
+
+    @property
+    def state(self) -> BreakerState:
+        if self._state == BreakerState.OPEN and self.retry_after() == 0:
+            self._set_state(BreakerState.HALF_OPEN)
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a probe through"""
+        if self._state != BreakerState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent now (reserves the probe when half open)"""
+        state = self.state
+        if state == BreakerState.CLOSED:
+            return True
+        if state == BreakerState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.stats["rejected"] += 1
+        return False
+
+    def is_available(self) -> bool:
+        """Check without reserving anything whether requests would currently pass"""
+        state = self.state
+        return state == BreakerState.CLOSED or (state == BreakerState.HALF_OPEN and not self._probe_in_flight)
+
+    def release(self):
+        """Give back a reserved probe without a result (e.g. the call was cancelled)"""
+        self._probe_in_flight = False
+
+    def record_success(self):
+        self.stats["successes"] += 1
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+        self._set_state(BreakerState.CLOSED)
+
+    def record_failure(self):
+        self.stats["failures"] += 1
+        self.consecutive_failures += 1
+        probe_failed = self._probe_in_flight
+        self._probe_in_flight = False
+        if probe_failed or self.consecutive_failures >= self.failure_threshold:
+            if self._state == BreakerState.OPEN:
+                self._opened_at = time.monotonic()
+            self._set_state(BreakerState.OPEN)
+
+    def get_stats(self) -> dict:
+        return dict(
+            self.stats,
+            state=str(self.state),
+            consecutive_failures=self.consecutive_failures,
+            retry_after=round(self.retry_after(), 1),
+        )
+
+
+class HealthRegistry:
+    """
+    Shared view of upstream health: one circuit breaker per host.
+
+    Subscribers (coroutine functions) are notified of every breaker state
+    transition, and every transition is counted for the stats.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 120, retry_policy: RetryPolicy = None):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._breakers = {}
+        self._subscribers = []
+        self.transitions = []
+
+    def get_breaker(self, host: str) -> CircuitBreaker:
+        """Get or create the breaker of a host"""
+        if host not in self._breakers:
+            self._breakers[host] = CircuitBreaker(
+                host, self.failure_threshold, self.recovery_timeout, on_transition=self._on_transition
+            )
+        return self._breakers[host]
+
+    def is_available(self, host: str) -> bool:
+        """Check whether requests to a host would currently pass its breaker"""
+        return self.get_breaker(host).is_available()
+
+    def retry_after(self, host: str) -> float:
+        """Seconds until the breaker of a host lets requests through again"""
+        return self.get_breaker(host).retry_after()
+
+    def subscribe(self, callback: Callable[[CircuitBreaker, BreakerState, BreakerState], Awaitable[None]]):
+        """Register a coroutine function called with (breaker, old_state, new_state), once per callback"""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _on_transition(self, breaker: CircuitBreaker, old_state: BreakerState, new_state: BreakerState):
+        self.transitions.append({
+            "host": breaker.host,
+            "from": str(old_state),
+            "to": str(new_state),
+            "at": time.time(),
+        })
+        del self.transitions[:-50]
+        log = logger.warning if new_state == BreakerState.OPEN else logger.info
+        log(f"🔌 Circuit breaker {breaker.host}: {old_state} → {new_state}")
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        for callback in list(self._subscribers):
+            loop.create_task(self._notify(callback, breaker, old_state, new_state))
+
+    async def _notify(self, callback, breaker, old_state, new_state):
+        try:
+            await callback(breaker, old_state, new_state)
+        except Exception as e:
+            logger.error(f"❌ Error in circuit breaker subscriber: {e}")
+
+    async def call(self, host: str, func: Callable[[], Awaitable], retry_policy: RetryPolicy = None):
+        """
+        Call an upstream through its breaker, retrying transient failures
+
+        Args:
+            host (str): Upstream host name
+            func (callable): Coroutine function doing one attempt. It should raise
+                UpstreamStatusError, aiohttp.ClientError or asyncio.TimeoutError on transient failures
+            retry_policy (RetryPolicy): Override of the registry retry policy
+
+        Returns:
+            The result of func
+
+        Raises:
+            CircuitOpenError: If the breaker is open (or reopens while retrying)
+        """
+        retry_policy = retry_policy or self.retry_policy
+        breaker = self.get_breaker(host)
+
+        for attempt in range(1, retry_policy.max_attempts + 1):
+            if not breaker.allow_request():
+                raise CircuitOpenError(host, breaker.retry_after())
+            try:
+                result = await func()
+            except (UpstreamStatusError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                breaker.record_failure()
+                if attempt == retry_policy.max_attempts:
+                    raise
+                if breaker.state == BreakerState.OPEN:
+                    raise CircuitOpenError(host, breaker.retry_after()) from e
+                delay = retry_policy.get_delay(attempt)
+                logger.warning(f"⚠️ {host} attempt {attempt}/{retry_policy.max_attempts} failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except Exception:
+                breaker.record_failure()
+                raise
+            breaker.record_success()
+            return result
+
+    def get_stats(self) -> dict:
+        """Get breaker stats per host and the recent transitions"""
+        return {
+            "hosts": {host: breaker.get_stats() for host, breaker in self._breakers.items()},
+            "transitions": list(self.transitions),
+        }
+
+
+# Global health registry instance
+_health_registry = None
+
+
+def get_health_registry():
+    """
+    Get or create the global upstream health registry
+
+    Returns:
+        HealthRegistry: Global health registry instance
+    """
+    global _health_registry
+    if _health_registry is None:
+        _health_registry = HealthRegistry()
+    return _health_registry
@@ -0,0 +1,109 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable
+from utils.logger import logger
+
+
+def freeze_key(value) -> Hashable:
+    """Turn nested dicts/lists (e.g. request payloads) into a hashable key"""
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), freeze_key(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(freeze_key(item) for item in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return str(value)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical async calls and memoizes their results.
+
+    Concurrent calls with the same key share one in-flight call, and successful
+    (non-None) results are kept for `ttl` seconds. Expired results are swept on
+    every insert and at most `max_entries` are kept (least recently used first out),
+    so many distinct keys (e.g. custom date ranges) don't grow the memo forever.
+    """
+
+    def __init__(self, name: str, ttl: float = 0, max_entries: int = 256):
+        """
+        Initialize the single-flight group.
+
+        Args:
+            name (str): Name used in logs
+            ttl (float): Seconds a result is memoized (0 disables memoization)
+            max_entries (int): Maximum number of memoized results
+        """
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._in_flight = {}
+        self._results = OrderedDict()
+        self.stats = {"calls": 0, "cache_hits": 0, "coalesced": 0, "executions": 0}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable], ttl: float = None):
+        """
+        Run func once per key, sharing the result with concurrent and recent callers
+
+        Args:
+            key (Hashable): Call identity
+            func (callable): Coroutine function to run on a miss
+            ttl (float): Override of the memoization ttl for this call
+
+        Returns:
+            The result of func
+        """
+        ttl = self.ttl if ttl is None else ttl
+        self.stats["calls"] += 1
+
+        cached = self._results.get(key)
+        if cached is not None:
+            expires_at, result = cached
+            if time.monotonic() < expires_at:
+                self._results.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                logger.debug(f"{self.name}: memoized result for {key}")
+                return result
+            del self._results[key]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            logger.debug(f"{self.name}: joining in-flight call for {key}")
+            return await asyncio.shield(task)
+
+        task = asyncio.ensure_future(func())
+        self._in_flight[key] = task
+        self.stats["executions"] += 1
+        try:
+            result = await asyncio.shield(task)
+        finally:
+            if self._in_flight.get(key) is task:
+                del self._in_flight[key]
+
+        if result is not None and ttl > 0:
+            self._store(key, result, ttl)
+        return result
+
+    def _store(self, key: Hashable, result, ttl: float):
+        now = time.monotonic()
+        for expired_key in [cached_key for cached_key, (expires_at, _) in self._results.items() if expires_at <= now]:
+            del self._results[expired_key]
+        self._results[key] = (now + ttl, result)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    def invalidate(self, key: Hashable = None):
+        """Forget a memoized result (or all of them)"""
+        if key is None:
+            self._results.clear()
+        else:
+            self._results.pop(key, None)
+
+    def get_stats(self) -> dict:
+        """Get call statistics"""
+        return dict(self.stats, memoized=len(self._results), in_flight=len(self._in_flight))
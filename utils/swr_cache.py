@@ -0,0 +1,143 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Hashable
+from utils.logger import logger
+
+
+class CacheEntry:
+    """A cached value and when it was loaded"""
+
+    def __init__(self, value, loaded_at: float):
+        self.value = value
+        self.loaded_at = loaded_at
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.loaded_at
+
+
+class SWRCache:
+    """
+    In-process stale-while-revalidate cache.
+
+    fresh (age < ttl): served from cache.
+    stale (ttl <= age < max_stale): served from cache while one background refresh runs.
+    expired or missing: the caller waits for the load, shared with concurrent callers.
+    Failed loads keep the last value, so a flaky upstream doesn't empty the cache.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize the cache.
+
+        Args:
+            name (str): Name used in logs
+        """
+        self.name = name
+        self._entries = {}
+        self._loads = {}
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0, "refreshes": 0, "errors": 0}
+
+    def _start_load(self, key: Hashable, loader: Callable[[], Awaitable]) -> asyncio.Task:
+        task = self._loads.get(key)
+        if task is not None and not task.done():
+            return task
+
+        async def load():
+            try:
+                value = await loader()
+                if value is not None:
+                    self._entries[key] = CacheEntry(value, time.monotonic())
+                return value
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"❌ {self.name}: failed to load {key}: {e}")
+                raise
+            finally:
+                self._loads.pop(key, None)
+
+        task = asyncio.ensure_future(load())
+        self._loads[key] = task
+        return task
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable], ttl: float, max_stale: float = None):
+        """
+        Get a value, loading or revalidating it as needed
+
+        Args:
+            key (Hashable): Cache key
+            loader (callable): Coroutine function loading the value (None results are not cached)
+            ttl (float): Seconds a value is fresh
+            max_stale (float): Seconds a value may be served while revalidating (default: 10 x ttl)
+
+        Returns:
+            The cached or loaded value
+        """
+        max_stale = ttl * 10 if max_stale is None else max_stale
+        entry = self._entries.get(key)
+
+        if entry is not None and entry.age < ttl:
+            self.stats["hits"] += 1
+            return entry.value
+
+        if entry is not None and entry.age < max_stale:
+            self.stats["stale_hits"] += 1
+            if key not in self._loads:
+                self.stats["refreshes"] += 1
+                logger.debug(f"{self.name}: serving stale {key} ({entry.age:.1f}s old), refreshing")
+                task = self._start_load(key, loader)
+                # the error is logged by the load, nobody awaits a background refresh
+                task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            return entry.value
+
+        if key in self._loads:
+            self.stats["coalesced"] += 1
+        else:
+            self.stats["misses"] += 1
+        try:
+            return await asyncio.shield(self._start_load(key, loader))
+        except Exception:
+            if entry is not None:
+                logger.warning(f"⚠️ {self.name}: serving expired {key} ({entry.age:.0f}s old) after a failed load")
+                return entry.value
+            raise
+
+    async def refresh(self, key: Hashable, loader: Callable[[], Awaitable]):
+        """
+        Load a value now, whatever the age of the cached copy
+
+        A load already in flight is shared. Unlike get(), a failed load raises
+        instead of serving the last value, use peek() for that.
+
+        Args:
+            key (Hashable): Cache key
+            loader (callable): Coroutine function loading the value (None results are not cached)
+
+        Returns:
+            The loaded value
+        """
+        self.stats["refreshes"] += 1
+        return await asyncio.shield(self._start_load(key, loader))
+
+    def peek(self, key: Hashable):
+        """Get the cached value (whatever its age) without loading, or None"""
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def invalidate(self, key: Hashable = None):
+        """Drop a cached value (or all of them)"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def get_stats(self) -> dict:
+        """Get hit/miss counters and the age of every cached value"""
+        lookups = self.stats["hits"] + self.stats["stale_hits"] + self.stats["misses"] + self.stats["coalesced"]
+        served = self.stats["hits"] + self.stats["stale_hits"]
+        return dict(
+            self.stats,
+            hit_ratio=round(served / lookups, 3) if lookups else 0.0,
+            ages={str(key): round(entry.age, 1) for key, entry in self._entries.items()},
+            refreshing=len(self._loads),
+        )
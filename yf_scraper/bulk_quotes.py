@@ -0,0 +1,164 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from urllib.parse import quote, urlencode
+import pandas as pd
+from utils.logger import logger
+from yf_scraper.yf_requests import AsyncYfRequests
+
+
+@dataclass
+class ChunkFailure:
+    """A chunk of symbols whose request failed"""
+    symbols: list[str]
+    error: str
+
+
+@dataclass
+class BulkQuoteResult:
+    """Merged quotes of a bulk request"""
+    quotes: pd.DataFrame
+    failures: list[ChunkFailure] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def failed_symbols(self) -> list[str]:
+        return [symbol for failure in self.failures for symbol in failure.symbols]
+
+
+def chunk_symbols(symbols: list[str], max_symbols: int = 50, max_symbols_length: int = 2000) -> list[list[str]]:
+    """
+    Split symbols into chunks that fit in one request
+
+    Args:
+        symbols (list[str]): Symbols (duplicates are dropped, order is kept)
+        max_symbols (int): Maximum symbols per chunk
+        max_symbols_length (int): Maximum url-encoded length of the joined `symbols` value
+
+    Returns:
+        list[list[str]]: Chunks of symbols
+    """
+    chunks = []
+    current, current_length = [], 0
+    for symbol in dict.fromkeys(symbols):
+        # symbols like ^GSPC or BRK.B grow when encoded, +3 for the encoded comma
+        symbol_length = len(quote(symbol, safe="")) + (3 if current else 0)
+        if current and (len(current) >= max_symbols or current_length + symbol_length > max_symbols_length):
+            chunks.append(current)
+            current, current_length = [], 0
+            symbol_length = len(quote(symbol, safe=""))
+        current.append(symbol)
+        current_length += symbol_length
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def flatten_quote(quote_data: dict) -> dict:
+    """Keep the raw value of formatted fields ({"raw": ..., "fmt": ...})"""
+    return {
+        key: value.get("raw", value.get("fmt")) if isinstance(value, dict) else value
+        for key, value in quote_data.items()
+    }
+
+
+class BulkQuoteFetcher:
+    """
+    Fetches quotes of large watchlists.
+
+    Symbols are split into chunks that keep the request url under the limit,
+    chunks are fetched concurrently with bounded parallelism, and the results are
+    merged into one DataFrame indexed by symbol. A failed chunk is reported in the
+    result instead of failing the whole batch.
+    """
+
+    def __init__(self, client: AsyncYfRequests = None, max_symbols: int = 50, max_url_length: int = 4000,
+                 concurrency: int = 4, fields: list[str] = None, formatted: bool = True):
+        """
+        Initialize the fetcher.
+
+        Args:
+            client (AsyncYfRequests): Yahoo client (default: a client on the shared Yahoo session)
+            max_symbols (int): Maximum symbols per request
+            max_url_length (int): Maximum length of a request url
+            concurrency (int): Maximum number of chunks fetched at the same time
+            fields (list[str]): Fields to request (default: every QouteFields field)
+            formatted (bool): Ask for formatted values, False requests plain numbers
+        """
+        self.client = client or AsyncYfRequests()
+        self.max_symbols = max_symbols
+        self.max_url_length = max_url_length
+        self.concurrency = concurrency
+        self.fields = fields
+        self.formatted = formatted
+
+    def _symbols_length_budget(self) -> int:
+        """Url length left for the symbols value once the other quote params are in"""
+        # the crumb is added by the Yahoo session, leave room for it
+        params = self.client.build_quote_params([], self.fields, self.formatted)
+        base_url = f"{self.client.QUOTE_URL}?{urlencode(params)}&crumb={'x' * 32}"
+        budget = self.max_url_length - len(base_url)
+        if budget <= 0:
+            raise ValueError(f"max_url_length {self.max_url_length} is shorter than the quote url ({len(base_url)})")
+        return budget
+
+    async def _fetch_chunk(self, semaphore: asyncio.Semaphore, symbols: list[str]) -> list[dict]:
+        async with semaphore:
+            response = await self.client.get_quote(symbols, self.fields, self.formatted)
+        quote_response = response.get("quoteResponse") or {}
+        if quote_response.get("error"):
+            raise ValueError(quote_response["error"])
+        return quote_response.get("result") or []
+
+    async def fetch(self, symbols: list[str]) -> BulkQuoteResult:
+        """
+        Fetch quotes of all symbols
+
+        Args:
+            symbols (list[str]): Symbols to quote
+
+        Returns:
+            BulkQuoteResult: Quotes DataFrame (indexed by symbol), failed chunks and symbols missing from the responses
+        """
+        started = time.perf_counter()
+        chunks = chunk_symbols(symbols, self.max_symbols, self._symbols_length_budget())
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(
+            *[self._fetch_chunk(semaphore, chunk) for chunk in chunks],
+            return_exceptions=True
+        )
+
+        rows, failures = [], []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Quote chunk {chunk[0]}..{chunk[-1]} ({len(chunk)} symbols) failed: {result}")
+                failures.append(ChunkFailure(chunk, str(result) or type(result).__name__))
+                continue
+            rows.extend(flatten_quote(item) for item in result)
+
+        quotes = pd.DataFrame(rows)
+        if not quotes.empty:
+            quotes = quotes.drop_duplicates(subset="symbol", keep="last").set_index("symbol")
+
+        failed = {symbol for failure in failures for symbol in failure.symbols}
+        missing = [symbol for symbol in dict.fromkeys(symbols) if symbol not in quotes.index and symbol not in failed]
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"📈 Fetched {len(quotes)} quotes in {len(chunks)} chunks ({len(failures)} failed) in {elapsed:.2f}s")
+        return BulkQuoteResult(quotes, failures, missing, elapsed)
+
+
+if __name__ == "__main__":
+    async def main():
+        fetcher = BulkQuoteFetcher()
+        try:
+            trending = await fetcher.client.get_trending_us()
+            symbols = [item["symbol"] for item in trending["finance"]["result"][0]["quotes"]]
+            result = await fetcher.fetch(symbols + ["^GSPC", "^DJI", "^IXIC", "^RUT", "^VIX"])
+            print(result.quotes[["regularMarketPrice", "regularMarketChangePercent"]])
+            print(f"failures: {result.failures}, missing: {result.missing}")
+        finally:
+            await fetcher.client.close()
+
+    asyncio.run(main())
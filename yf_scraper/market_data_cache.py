@@ -0,0 +1,84 @@
+import asyncio
+from utils.logger import logger
+from utils.swr_cache import SWRCache
+from yf_scraper.yf_requests import AsyncYfRequests
+
+
+# Seconds each endpoint stays fresh, and how long a stale copy may be served while it refreshes
+ENDPOINT_TTLS = {
+    "market_summary": (15, 300),
+    "market_time": (60, 600),
+    "trending_us": (60, 600),
+}
+
+
+class MarketDataCache:
+    """
+    Shared warm copy of the Yahoo market endpoints.
+
+    Reports and slash commands read through this cache instead of calling Yahoo
+    live: fresh data is returned directly, stale data is returned instantly while
+    a background refresh runs, and concurrent misses share one request.
+    """
+
+    def __init__(self, client: AsyncYfRequests = None, ttls: dict = None):
+        """
+        Initialize the cache.
+
+        Args:
+            client (AsyncYfRequests): Yahoo client (default: a client on the shared Yahoo session)
+            ttls (dict): Override of ENDPOINT_TTLS {endpoint: (ttl, max_stale)}
+        """
+        self.client = client or AsyncYfRequests()
+        self.ttls = dict(ENDPOINT_TTLS, **(ttls or {}))
+        self.cache = SWRCache("yahoo-market-data")
+
+    async def _get(self, endpoint: str, loader):
+        ttl, max_stale = self.ttls[endpoint]
+        return await self.cache.get(endpoint, loader, ttl, max_stale)
+
+    async def get_market_summary(self, fresh: bool = False):
+        """Market summary, reloaded from Yahoo (not served from the cache) when fresh is True"""
+        if fresh:
+            return await self.cache.refresh("market_summary", self.client.get_market_summary)
+        return await self._get("market_summary", self.client.get_market_summary)
+
+    async def get_market_time(self):
+        return await self._get("market_time", self.client.get_market_time)
+
+    async def get_trending_us(self):
+        return await self._get("trending_us", self.client.get_trending_us)
+
+    def get_last_market_summary(self):
+        """Last market summary whatever its age (for fallbacks), or None"""
+        return self.cache.peek("market_summary")
+
+    async def warmup(self):
+        """Load every endpoint, e.g. at startup"""
+        results = await asyncio.gather(
+            self.get_market_summary(), self.get_market_time(), self.get_trending_us(),
+            return_exceptions=True
+        )
+        failed = [endpoint for endpoint, result in zip(ENDPOINT_TTLS, results) if isinstance(result, Exception)]
+        if failed:
+            logger.warning(f"⚠️ Market data warmup failed for: {', '.join(failed)}")
+
+    def get_stats(self) -> dict:
+        return self.cache.get_stats()
+
+
+# Global market data cache instance
+_market_data_cache = None
+
+
+def get_market_data_cache():
+    """
+    Get or create the global market data cache
+
+    Returns:
+        MarketDataCache: Global market data cache instance
+    """
+    global _market_data_cache
+    if _market_data_cache is None:
+        _market_data_cache = MarketDataCache()
+    return _market_data_cache
@@ -0,0 +1,185 @@
+import asyncio
+from collections import OrderedDict
+from utils import json_codec
+from utils.http_session import PooledHttpSession, get_http_session
+from utils.logger import logger
+from utils.proxy_pool import get_proxy_pool
+from yf_scraper.headers import headers
+from yf_scraper.yf_session import YahooSession, get_yf_session
+
+
+NEWS_URL = "https://finance.yahoo.com/xhr/ncp"
+NEWS_PARAMS = {
+    "location": "US",
+    "queryRef": "topicsDetailFeed",
+    "serviceKey": "ncp_fin",
+    "lang": "en-US",
+    "region": "US",
+}
+# stock market news topic list
+NEWS_SERVICE_CONFIG = {
+    "imageTags": ["168x126|1|80", "168x126|2|80"],
+    "listId": "530aec16-61ed-4c8e-8fd8-f60d01bd0722",
+    "spaceId": "1183308065",
+}
+NEWS_SESSION = {
+    "authed": "0",
+    "site": "finance",
+    "device": "desktop",
+    "lang": "en-US",
+    "region": "US",
+    "intl": "us",
+}
+
+
+class BoundedSeenSet:
+    """Set of the most recently seen ids, the oldest are forgotten first"""
+
+    def __init__(self, maxsize: int = 2000):
+        self.maxsize = maxsize
+        self._ids = OrderedDict()
+
+    def __contains__(self, item_id) -> bool:
+        return item_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, item_id):
+        self._ids[item_id] = None
+        self._ids.move_to_end(item_id)
+        while len(self._ids) > self.maxsize:
+            self._ids.popitem(last=False)
+
+
+class YahooNewsFeed:
+    """
+    Polls the Yahoo Finance stock market news stream and yields only new stories.
+
+    Stories are deduplicated by uuid in a bounded seen-set, and the publish time of
+    the newest story is kept as a cursor so stories that fell out of the seen-set
+    are not reported again.
+    """
+
+    def __init__(self, http_session: PooledHttpSession = None, interval: float = 60, page_size: int = 50,
+                 seen_size: int = 2000, skip_existing: bool = True, yf_session: YahooSession = None):
+        """
+        Initialize the feed.
+
+        Args:
+            http_session (PooledHttpSession): HTTP session (default: the shared Yahoo session)
+            interval (float): Seconds between polls
+            page_size (int): Stories requested per poll
+            seen_size (int): Number of story ids remembered
+            skip_existing (bool): Don't yield the stories already in the stream on the first poll
+            yf_session (YahooSession): Shared Yahoo cookies (default: global Yahoo session)
+        """
+        self.http_session = http_session or get_http_session(
+            "yahoo", limit_per_host=8, proxy_pool=get_proxy_pool(), use_cookie_jar=False
+        )
+        self.yf_session = yf_session or get_yf_session()
+        self.interval = interval
+        self.page_size = page_size
+        self.skip_existing = skip_existing
+        self.seen = BoundedSeenSet(seen_size)
+        self.cursor = None
+        self.polls = 0
+        self._stopped = asyncio.Event()
+        self.headers = dict(
+            headers,
+            **{
+                "Content-Type": "text/plain;charset=UTF-8",
+                "Origin": "https://finance.yahoo.com",
+                "Referer": "https://finance.yahoo.com/topic/stock-market-news/",
+            }
+        )
+
+    def _build_body(self) -> str:
+        service_config = dict(NEWS_SERVICE_CONFIG, snippetCount=self.page_size, count=self.page_size)
+        return json_codec.dumps({"serviceConfig": service_config, "session": NEWS_SESSION})
+
+    async def fetch_stream(self) -> list:
+        """Fetch the current news stream (newest first)"""
+        data = await self.yf_session.request_json(
+            self.http_session, "POST", NEWS_URL, NEWS_PARAMS, headers=self.headers, data=self._build_body()
+        )
+        return data["data"]["main"]["stream"] or []
+
+    def _new_items(self, stream: list) -> list:
+        """Pick the unseen stories of a stream, oldest first, and advance the cursor"""
+        new_items = []
+        for item in stream:
+            content = item.get("content") or {}
+            item_id = content.get("id") or item.get("id")
+            if not item_id or item_id in self.seen:
+                continue
+            self.seen.add(item_id)
+            published = content.get("pubDate")
+            if self.cursor and published and published < self.cursor:
+                # older than what was already reported, it only fell out of the seen-set
+                continue
+            new_items.append(content)
+
+        new_items.sort(key=lambda content: content.get("pubDate") or "")
+        published_dates = [content["pubDate"] for content in new_items if content.get("pubDate")]
+        if published_dates:
+            self.cursor = max(published_dates + ([self.cursor] if self.cursor else []))
+        return new_items
+
+    async def poll(self) -> list:
+        """
+        Poll the stream once
+
+        Returns:
+            list: New stories (the `content` of each stream item), oldest first
+        """
+        stream = await self.fetch_stream()
+        new_items = self._new_items(stream)
+        self.polls += 1
+        if self.polls == 1 and self.skip_existing:
+            logger.info(f"📰 News feed primed with {len(new_items)} existing stories")
+            return []
+        if new_items:
+            logger.info(f"📰 {len(new_items)} new stories")
+        return new_items
+
+    async def stream(self):
+        """
+        Yield new stories as they are published, until stop() is called
+
+        Usage:
+            async for story in feed.stream():
+                print(story["title"])
+        """
+        self._stopped.clear()
+        failures = 0
+        while not self._stopped.is_set():
+            try:
+                for item in await self.poll():
+                    yield item
+                failures = 0
+                delay = self.interval
+            except Exception as e:
+                failures += 1
+                delay = min(self.interval * 2 ** failures, 15 * 60)
+                logger.error(f"❌ Error polling news feed ({failures} in a row), retrying in {delay:.0f}s: {e}")
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self):
+        """Stop the stream after the current poll"""
+        self._stopped.set()
+
+
+if __name__ == "__main__":
+    async def main():
+        feed = YahooNewsFeed(interval=30, skip_existing=False)
+        try:
+            async for story in feed.stream():
+                print(story.get("pubDate"), story.get("title"))
+        finally:
+            await feed.http_session.close()
+
+    asyncio.run(main())
@@ -0,0 +1,163 @@
+"""
+Minimal protobuf codec for Yahoo Finance streamer PricingData messages.
+
+The streamer (wss://streamer.finance.yahoo.com) sends every tick as a base64
+encoded PricingData protobuf. Only the wire format needed by that one message
+is implemented here, so there is no protobuf dependency or generated code.
+"""
+
+import base64
+import struct
+
+
+# field number -> (name, type) of PricingData
+PRICING_FIELDS = {
+    1: ("id", "string"),
+    2: ("price", "float"),
+    3: ("time", "sint64"),
+    4: ("currency", "string"),
+    5: ("exchange", "string"),
+    6: ("quote_type", "int32"),
+    7: ("market_hours", "int32"),
+    8: ("change_percent", "float"),
+    9: ("day_volume", "sint64"),
+    10: ("day_high", "float"),
+    11: ("day_low", "float"),
+    12: ("change", "float"),
+    13: ("short_name", "string"),
+    14: ("expire_date", "sint64"),
+    15: ("open_price", "float"),
+    16: ("previous_close", "float"),
+    17: ("strike_price", "float"),
+    18: ("underlying_symbol", "string"),
+    19: ("open_interest", "sint64"),
+    20: ("options_type", "int32"),
+    21: ("mini_option", "sint64"),
+    22: ("last_size", "sint64"),
+    23: ("bid", "float"),
+    24: ("bid_size", "sint64"),
+    25: ("ask", "float"),
+    26: ("ask_size", "sint64"),
+    27: ("price_hint", "sint64"),
+    28: ("vol_24hr", "sint64"),
+    29: ("vol_all_currencies", "sint64"),
+    30: ("from_currency", "string"),
+    31: ("last_market", "string"),
+    32: ("circulating_supply", "double"),
+    33: ("market_cap", "double"),
+}
+FIELD_NUMBERS = {name: (number, field_type) for number, (name, field_type) in PRICING_FIELDS.items()}
+
+WIRE_VARINT, WIRE_FIXED64, WIRE_BYTES, WIRE_FIXED32 = 0, 1, 2, 5
+WIRE_TYPES = {
+    "string": WIRE_BYTES, "float": WIRE_FIXED32, "double": WIRE_FIXED64,
+    "sint64": WIRE_VARINT, "int32": WIRE_VARINT,
+}
+
+_float = struct.Struct("<f")
+_double = struct.Struct("<d")
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 64:
+            raise ValueError("Varint too long")
+
+
+def _write_varint(value: int) -> bytes:
+    value &= (1 << 64) - 1
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def decode_pricing_data(data: bytes) -> dict:
+    """
+    Decode a PricingData protobuf
+
+    Args:
+        data (bytes): Serialized message
+
+    Returns:
+        dict: {field name: value} of the fields present (unknown fields are skipped)
+    """
+    message = {}
+    pos, end = 0, len(data)
+    while pos < end:
+        key, pos = _read_varint(data, pos)
+        number, wire_type = key >> 3, key & 0x07
+        if wire_type == WIRE_VARINT:
+            value, pos = _read_varint(data, pos)
+        elif wire_type == WIRE_FIXED32:
+            value, pos = data[pos:pos + 4], pos + 4
+        elif wire_type == WIRE_FIXED64:
+            value, pos = data[pos:pos + 8], pos + 8
+        elif wire_type == WIRE_BYTES:
+            length, pos = _read_varint(data, pos)
+            value, pos = data[pos:pos + length], pos + length
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type}")
+        if pos > end:
+            raise ValueError("Truncated message")
+
+        field = PRICING_FIELDS.get(number)
+        if field is None:
+            continue
+        name, field_type = field
+        if field_type == "string":
+            message[name] = value.decode("utf-8")
+        elif field_type == "float":
+            message[name] = _float.unpack(value)[0]
+        elif field_type == "double":
+            message[name] = _double.unpack(value)[0]
+        elif field_type == "sint64":
+            message[name] = (value >> 1) ^ -(value & 1)
+        else:
+            # int32 enums, negative values are sign-extended to 64 bits
+            message[name] = value - (1 << 64) if value >= 1 << 63 else value
+    return message
+
+
+def encode_pricing_data(message: dict) -> bytes:
+    """Serialize a {field name: value} dict as a PricingData protobuf (used by the replay server)"""
+    out = bytearray()
+    for name, value in message.items():
+        if value is None or name not in FIELD_NUMBERS:
+            continue
+        number, field_type = FIELD_NUMBERS[name]
+        out += _write_varint(number << 3 | WIRE_TYPES[field_type])
+        if field_type == "string":
+            encoded = value.encode("utf-8")
+            out += _write_varint(len(encoded)) + encoded
+        elif field_type == "float":
+            out += _float.pack(value)
+        elif field_type == "double":
+            out += _double.pack(value)
+        elif field_type == "sint64":
+            out += _write_varint((value << 1) ^ (value >> 63))
+        else:
+            out += _write_varint(value)
+    return bytes(out)
+
+
+def decode_streamer_message(text: str) -> dict:
+    """Decode a base64 streamer frame into a PricingData dict"""
+    return decode_pricing_data(base64.b64decode(text))
+
+
+def encode_streamer_message(message: dict) -> str:
+    """Encode a PricingData dict as a base64 streamer frame"""
+    return base64.b64encode(encode_pricing_data(message)).decode("ascii")
@@ -34,3 +34,16 @@ class QouteFields:
     UNDERLYING_EXCHANGE_SYMBOL = "underlyingExchangeSymbol"
     UNDERLYING_SYMBOL = "underlyingSymbol"
     STOCK_STORY = "stockStory"
+
+
+# every quote field, the default of a quote request
+ALL_QUOTE_FIELDS = tuple(value for name, value in vars(QouteFields).items() if not name.startswith("_"))
+
+# the fields most callers need
+PRICE_FIELDS = (
+    QouteFields.SHORT_NAME,
+    QouteFields.REGULAR_MARKET_PRICE,
+    QouteFields.REGULAR_MARKET_CHANGE,
+    QouteFields.REGULAR_MARKET_CHANGE_PERCENT,
+    QouteFields.REGULAR_MARKET_TIME,
+)
@@ -0,0 +1,95 @@
+"""
+Compact typed records for Yahoo Finance quotes.
+
+A quote response carries ~30 keys per symbol (exchange metadata, formatted
+strings, ...). Most callers only need a handful of numbers, so the parser below
+keeps just the requested fields in a NamedTuple, unwrapping formatted
+{"raw": ..., "fmt": ...} values and coercing each field to its type.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple, Optional
+from yf_scraper.qoute_fields import QouteFields as qf
+
+
+# field -> python type, fields that are not listed are kept as they come
+QUOTE_FIELD_TYPES = {
+    qf.FIFTY_TWO_WEEK_HIGH: float,
+    qf.FIFTY_TWO_WEEK_LOW: float,
+    qf.LONG_NAME: str,
+    qf.SHORT_NAME: str,
+    qf.MARKET_CAP: int,
+    qf.OVERNIGHT_MARKET_TIME: int,
+    qf.OVERNIGHT_MARKET_PRICE: float,
+    qf.OVERNIGHT_MARKET_CHANGE: float,
+    qf.OVERNIGHT_MARKET_CHANGE_PERCENT: float,
+    qf.REGULAR_MARKET_TIME: int,
+    qf.REGULAR_MARKET_CHANGE: float,
+    qf.REGULAR_MARKET_CHANGE_PERCENT: float,
+    qf.REGULAR_MARKET_OPEN: float,
+    qf.REGULAR_MARKET_PRICE: float,
+    qf.REGULAR_MARKET_VOLUME: int,
+    qf.POST_MARKET_TIME: int,
+    qf.POST_MARKET_PRICE: float,
+    qf.POST_MARKET_CHANGE: float,
+    qf.POST_MARKET_CHANGE_PERCENT: float,
+    qf.PRE_MARKET_TIME: int,
+    qf.PRE_MARKET_PRICE: float,
+    qf.PRE_MARKET_CHANGE: float,
+    qf.PRE_MARKET_CHANGE_PERCENT: float,
+}
+
+
+@lru_cache(maxsize=64)
+def quote_record_type(fields: tuple[str, ...]) -> type:
+    """
+    Get the record type of a field projection (one type per distinct projection)
+
+    Args:
+        fields (tuple[str, ...]): Requested fields
+
+    Returns:
+        type: NamedTuple class with `symbol` followed by the fields
+    """
+    annotations = [("symbol", str)]
+    annotations += [(field, Optional[QUOTE_FIELD_TYPES.get(field, object)]) for field in fields if field != "symbol"]
+    return NamedTuple("QuoteRecord", annotations)
+
+
+def _coerce(value, field_type):
+    if isinstance(value, dict) and "raw" in value:
+        value = value["raw"]
+    if value is None or field_type is None or isinstance(value, field_type):
+        return value
+    try:
+        return field_type(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _quote_results(response) -> list:
+    if isinstance(response, list):
+        return response
+    for key in ("quoteResponse", "marketSummaryResponse"):
+        if key in response:
+            return response[key].get("result") or []
+    return []
+
+
+def parse_quote_records(response, fields) -> list:
+    """
+    Parse a quote response into compact records
+
+    Args:
+        response (dict | list): Quote or market summary response, or its list of results
+        fields (list[str]): Fields to keep, the others are dropped
+
+    Returns:
+        list[QuoteRecord]: One record per quote, missing fields are None
+    """
+    record_type = quote_record_type(tuple(dict.fromkeys(fields)))
+    columns = [(field, QUOTE_FIELD_TYPES.get(field)) for field in record_type._fields[1:]]
+    return [
+        record_type(item.get("symbol"), *[_coerce(item.get(field), field_type) for field, field_type in columns])
+        for item in _quote_results(response)
+    ]
@@ -0,0 +1,227 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+import aiohttp
+from utils import json_codec
+from utils.http_session import PooledHttpSession, get_http_session
+from utils.logger import logger
+from yf_scraper.headers import headers
+from yf_scraper.pricing_proto import decode_streamer_message
+
+
+STREAMER_URL = "wss://streamer.finance.yahoo.com/?version=2"
+
+
+@dataclass(slots=True)
+class QuoteTick:
+    """Latest streamed values of one symbol"""
+    symbol: str
+    price: float
+    change: float = 0.0
+    change_percent: float = 0.0
+    day_volume: int = 0
+    time: int = 0
+    market_hours: int = 0
+    received_at: float = 0.0
+
+    @property
+    def age(self) -> float:
+        """Seconds since the tick was received"""
+        return time.monotonic() - self.received_at
+
+
+class LiveQuoteTable:
+    """Latest tick per symbol, O(1) updates and lookups"""
+
+    def __init__(self):
+        self._ticks = {}
+        self.updates = 0
+
+    def update(self, message: dict) -> Optional[QuoteTick]:
+        """Apply a decoded PricingData message, returns the updated tick"""
+        symbol = message.get("id")
+        if not symbol:
+            return None
+        tick = self._ticks.get(symbol)
+        if tick is None:
+            tick = self._ticks[symbol] = QuoteTick(symbol, message.get("price", 0.0))
+        # a message only carries the fields that changed
+        if "price" in message:
+            tick.price = message["price"]
+        if "change" in message:
+            tick.change = message["change"]
+        if "change_percent" in message:
+            tick.change_percent = message["change_percent"]
+        if "day_volume" in message:
+            tick.day_volume = message["day_volume"]
+        if "time" in message:
+            tick.time = message["time"]
+        if "market_hours" in message:
+            tick.market_hours = message["market_hours"]
+        tick.received_at = time.monotonic()
+        self.updates += 1
+        return tick
+
+    def get(self, symbol: str) -> Optional[QuoteTick]:
+        return self._ticks.get(symbol)
+
+    def remove(self, symbol: str):
+        self._ticks.pop(symbol, None)
+
+    def snapshot(self) -> dict:
+        """Copy of the table {symbol: QuoteTick}"""
+        return dict(self._ticks)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._ticks
+
+    def __len__(self) -> int:
+        return len(self._ticks)
+
+
+class QuoteStreamer:
+    """
+    Yahoo Finance websocket streamer client.
+
+    Keeps a LiveQuoteTable up to date for the subscribed symbols. Symbols can be
+    subscribed and unsubscribed while it runs, and the subscription is sent again
+    after every reconnect.
+    """
+
+    def __init__(self, url: str = STREAMER_URL, http_session: PooledHttpSession = None,
+                 on_tick: Callable[[QuoteTick], None] = None, heartbeat: float = 30):
+        """
+        Initialize the streamer.
+
+        Args:
+            url (str): Websocket url (the local replay server in tests)
+            http_session (PooledHttpSession): Session used for the websocket (default: shared "yahoo-stream" session)
+            on_tick (callable): Called with every updated QuoteTick
+            heartbeat (float): Websocket ping interval in seconds
+        """
+        self.url = url
+        self.http_session = http_session or get_http_session("yahoo-stream", limit_per_host=2)
+        self.on_tick = on_tick
+        self.heartbeat = heartbeat
+        self.table = LiveQuoteTable()
+        self.symbols = set()
+        self._ws = None
+        self._task = None
+        self._connected = asyncio.Event()
+        self.stats = {"messages": 0, "decode_errors": 0, "connects": 0}
+
+    async def _send(self, action: str, symbols: list[str]):
+        if self._ws is not None and not self._ws.closed and symbols:
+            await self._ws.send_str(json_codec.dumps({action: sorted(symbols)}))
+
+    async def subscribe(self, symbols: list[str]):
+        """Start streaming symbols"""
+        new_symbols = set(symbols) - self.symbols
+        self.symbols |= new_symbols
+        await self._send("subscribe", new_symbols)
+
+    async def unsubscribe(self, symbols: list[str]):
+        """Stop streaming symbols and drop them from the table"""
+        removed = set(symbols) & self.symbols
+        self.symbols -= removed
+        for symbol in removed:
+            self.table.remove(symbol)
+        await self._send("unsubscribe", removed)
+
+    def handle_message(self, text: str) -> Optional[QuoteTick]:
+        """Decode one frame (base64 or {"type": "pricing", "message": base64}) into the table"""
+        self.stats["messages"] += 1
+        try:
+            if text.startswith("{"):
+                frame = json_codec.loads(text)
+                if frame.get("type") != "pricing":
+                    return None
+                text = frame["message"]
+            message = decode_streamer_message(text)
+        except Exception as e:
+            self.stats["decode_errors"] += 1
+            logger.debug(f"Could not decode streamer message: {e}")
+            return None
+
+        # ticks of symbols unsubscribed a moment ago may still arrive
+        if message.get("id") not in self.symbols:
+            return None
+        tick = self.table.update(message)
+        if tick is not None and self.on_tick:
+            self.on_tick(tick)
+        return tick
+
+    async def _run(self):
+        delay = 1
+        while True:
+            try:
+                session = await self.http_session.get_session()
+                async with session.ws_connect(self.url, headers=headers, heartbeat=self.heartbeat) as ws:
+                    self._ws = ws
+                    self.stats["connects"] += 1
+                    logger.info(f"📡 Quote streamer connected ({len(self.symbols)} symbols)")
+                    await self._send("subscribe", self.symbols)
+                    self._connected.set()
+                    delay = 1
+                    async for msg in ws:
+                        if msg.type == aiohttp.WSMsgType.TEXT:
+                            self.handle_message(msg.data)
+                        elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                            break
+                logger.warning("⚠️ Quote streamer disconnected")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Quote streamer error: {e}")
+            finally:
+                self._ws = None
+                self._connected.clear()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60)
+
+    def start(self):
+        """Start streaming in a background task"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def wait_connected(self, timeout: float = 10) -> bool:
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def stop(self):
+        """Stop streaming and close the websocket"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_price(self, symbol: str) -> Optional[QuoteTick]:
+        """Latest tick of a symbol from memory (no network), or None"""
+        return self.table.get(symbol)
+
+    def get_stats(self) -> dict:
+        return dict(self.stats, symbols=len(self.symbols), table=len(self.table), updates=self.table.updates)
+
+
+# Global quote streamer instance
+_quote_streamer = None
+
+
+def get_quote_streamer():
+    """
+    Get or create the global quote streamer (call start() to connect)
+
+    Returns:
+        QuoteStreamer: Global quote streamer instance
+    """
+    global _quote_streamer
+    if _quote_streamer is None:
+        _quote_streamer = QuoteStreamer()
+    return _quote_streamer
@@ -0,0 +1,155 @@
+"""
+Local replay of the Yahoo Finance streamer, built from the recorded responses.
+
+Every quote found in yf_scraper/responses becomes a replayed symbol. Its price
+takes a seeded random walk around the recorded price, and every subscribed
+symbol gets ticks encoded exactly like the real streamer (base64 PricingData).
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+from aiohttp import web
+from utils.logger import logger
+from utils.read_write import read_json_file
+from yf_scraper.pricing_proto import encode_streamer_message
+
+
+RESPONSES_DIR = os.path.join("yf_scraper", "responses")
+
+
+def _raw(value):
+    return value.get("raw") if isinstance(value, dict) else value
+
+
+def _find_quotes(data, quotes: dict):
+    if isinstance(data, dict):
+        if "symbol" in data and _raw(data.get("regularMarketPrice")) is not None:
+            quotes.setdefault(data["symbol"], {
+                "id": data["symbol"],
+                "price": float(_raw(data["regularMarketPrice"])),
+                "change": float(_raw(data.get("regularMarketChange")) or 0.0),
+                "change_percent": float(_raw(data.get("regularMarketChangePercent")) or 0.0),
+                "day_volume": int(_raw(data.get("regularMarketVolume")) or 0),
+                "short_name": data.get("shortName"),
+            })
+        for value in data.values():
+            _find_quotes(value, quotes)
+    elif isinstance(data, list):
+        for item in data:
+            _find_quotes(item, quotes)
+
+
+def load_fixture_quotes(responses_dir: str = RESPONSES_DIR) -> dict:
+    """
+    Collect the quotes of every recorded response
+
+    Returns:
+        dict: {symbol: PricingData dict}
+    """
+    quotes = {}
+    for file_name in sorted(os.listdir(responses_dir)):
+        if file_name.endswith(".json"):
+            _find_quotes(read_json_file(os.path.join(responses_dir, file_name)), quotes)
+    return quotes
+
+
+class StreamerReplayServer:
+    """Websocket server speaking the Yahoo streamer protocol, fed from fixtures"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, interval: float = 0.5, seed: int = 7,
+                 json_frames: bool = False, responses_dir: str = RESPONSES_DIR):
+        """
+        Initialize the replay server.
+
+        Args:
+            host (str): Listen address
+            port (int): Listen port (0 picks a free port)
+            interval (float): Seconds between tick rounds (0 = as fast as possible, for benchmarks)
+            seed (int): Random walk seed
+            json_frames (bool): Wrap frames as {"type": "pricing", "message": ...} like the v2 streamer
+            responses_dir (str): Directory of recorded responses
+        """
+        self.host = host
+        self.port = port
+        self.interval = interval
+        self.json_frames = json_frames
+        self.random = random.Random(seed)
+        self.quotes = load_fixture_quotes(responses_dir)
+        self.sent = 0
+        self._runner = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    def next_tick(self, symbol: str) -> str:
+        """Move the symbol price one random step and encode the tick"""
+        quote = self.quotes[symbol]
+        previous_close = quote["price"] - quote["change"]
+        step = quote["price"] * self.random.uniform(-0.0005, 0.0005)
+        quote["price"] = round(quote["price"] + step, 4)
+        quote["change"] = quote["price"] - previous_close
+        quote["change_percent"] = quote["change"] / previous_close * 100 if previous_close else 0.0
+        quote["day_volume"] += self.random.randint(0, 500)
+        frame = encode_streamer_message(dict(quote, time=int(time.time() * 1000), market_hours=1))
+        if self.json_frames:
+            frame = json.dumps({"type": "pricing", "message": frame})
+        return frame
+
+    async def _handle(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        subscribed = set()
+
+        async def replay():
+            while not ws.closed:
+                for symbol in list(subscribed):
+                    await ws.send_str(self.next_tick(symbol))
+                    self.sent += 1
+                await asyncio.sleep(self.interval)
+
+        replay_task = asyncio.create_task(replay())
+        try:
+            async for msg in ws:
+                if msg.type != web.WSMsgType.TEXT:
+                    continue
+                command = json.loads(msg.data)
+                subscribed |= {symbol for symbol in command.get("subscribe", []) if symbol in self.quotes}
+                subscribed -= set(command.get("unsubscribe", []))
+        finally:
+            replay_task.cancel()
+        return ws
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        logger.info(f"📡 Streamer replay on {self.url} with {len(self.quotes)} symbols")
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+
+if __name__ == "__main__":
+    async def main():
+        async with StreamerReplayServer(port=8765) as server:
+            print(f"Replaying {sorted(server.quotes)} on ws://{server.host}:{server.port}/, Ctrl+C to stop")
+            await asyncio.Event().wait()
+
+    asyncio.run(main())
@@ -1,54 +1,62 @@
 from yf_scraper.headers import headers
-import requests
-from yf_scraper.qoute_fields import QouteFields as qf
+from yf_scraper.qoute_fields import QouteFields as qf, ALL_QUOTE_FIELDS
+from utils.http_session import PooledHttpSession, get_http_session
+from utils.proxy_pool import get_proxy_pool
+from yf_scraper.yf_session import YahooSession, get_yf_session
+from yf_scraper.quote_records import parse_quote_records
+import asyncio
 import json
 from utils.timezones_convertor import convert_to_my_timezone
 
 
 
-class YfRequests:
-    def __init__(self):
-        self.url = None
-        self.params = None
-        self.method = None
-        self.headers = headers
+class AsyncYfRequests:
+    """
+    Async Yahoo Finance client.
 
+    All requests go through a shared keep-alive session, so several endpoints can be
+    fetched concurrently with asyncio.gather without blocking the event loop.
+    """
 
-    def make_request(self):
-        response = requests.request(self.method, self.url, headers=self.headers, params=self.params)
-        response.raise_for_status()
-        return response.json()
-    
-    def get_market_time(self):
-        self.url = "https://query1.finance.yahoo.com/v6/finance/markettime"
-        self.method = "GET"
-        self.params = {
+    def __init__(self, http_session: PooledHttpSession = None, yf_session: YahooSession = None):
+        self.headers = headers
+        # cookies are managed by the shared YahooSession, not by the aiohttp cookie jar
+        self.http_session = http_session or get_http_session(
+            "yahoo", limit_per_host=8, proxy_pool=get_proxy_pool(), use_cookie_jar=False
+        )
+        self.yf_session = yf_session or get_yf_session()
+
+    async def make_request(self, method: str, url: str, params: dict = None, with_crumb: bool = False):
+        return await self.yf_session.request_json(
+            self.http_session, method, url, params, headers=self.headers, with_crumb=with_crumb
+        )
+
+    async def get_market_time(self):
+        url = "https://query1.finance.yahoo.com/v6/finance/markettime"
+        params = {
             "formatted": "true",
             "key": "finance",
             "lang": "en-US",
             "region": "US"
         }
-        return self.make_request()
+        return await self.make_request("GET", url, params)
 
-    def get_trending_us(self):
-        self.url = "https://query1.finance.yahoo.com/v1/finance/trending/US"
-        self.method = "GET"
-        self.params = {
+    async def get_trending_us(self):
+        url = "https://query1.finance.yahoo.com/v1/finance/trending/US"
+        params = {
             "count": "25",
             "fields": "logoUrl,longName,shortName,regularMarketChange,regularMarketChangePercent,regularMarketPrice",
             "format": "true",
             "useQuotes": "true",
             "quoteType": "ALL",
             "lang": "en-US",
-            "region": "US",
-            "crumb": "X7OMi/Fe4nm"
+            "region": "US"
         }
-        return self.make_request()
-    def get_spark(self, symbols: list[str], interval: str = "1d", range: str = "1mo"):
+        return await self.make_request("GET", url, params, with_crumb=True)
+
+    async def get_spark(self, symbols: list[str], interval: str = "1d", range: str = "1mo"):
         url = "https://query1.finance.yahoo.com/v7/finance/spark"
-        self.url = url
-        self.method = "GET"
-        self.params = {
+        params = {
             "includePrePost": "false",
             "includeTimestamps": "false",
             "indicators": "close", 
@@ -58,48 +66,109 @@ class YfRequests:
             "lang": "en-US",
             "region": "US"
         }
-
-        return self.make_request()
-
-    def get_quote(self, symbols: list[str]):
-        self.url = "https://query1.finance.yahoo.com/v7/finance/quote"
-        self.method = "GET"
-
-        wanted_fields = [value for value in vars(qf).values() 
-                        if isinstance(value, str)]
-
-
-        self.params = {
-            "fields": ",".join(wanted_fields),
-            "formatted": "true",
-            "imgHeights": "50",
-            "imgLabels": "logoUrl",
-            "imgWidths": "50",
+        return await self.make_request("GET", url, params)
+
+    QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+
+    def build_quote_params(self, symbols: list[str], fields: list[str] = None, formatted: bool = True) -> dict:
+        """
+        Build the quote request params
+
+        Args:
+            symbols (list[str]): Symbols to quote
+            fields (list[str]): Fields to request (default: every QouteFields field)
+            formatted (bool): Ask for {"raw": ..., "fmt": ...} values, False returns plain numbers
+
+        Returns:
+            dict: Query params
+        """
+        fields = list(fields) if fields else list(ALL_QUOTE_FIELDS)
+        params = {
+            "fields": ",".join(fields),
+            "formatted": "true" if formatted else "false",
             "symbols": ",".join(symbols),
             "enablePrivateCompany": "true",
             "overnightPrice": "true",
-            "topPickThisMonth": "true",
             "lang": "en-US",
             "region": "US",
-            "crumb": "X7OMi/Fe4nm",
         }
-
-        return self.make_request()
-    
-    def get_market_summary(self):
-        self.url = "https://query1.finance.yahoo.com/v6/finance/quote/marketSummary"
-        self.method = "GET"
-
-        self.params = {
+        # logo images and the top pick flag are only needed with the fields that show them
+        if qf.LOGO_URL in fields:
+            params.update({"imgHeights": "50", "imgLabels": "logoUrl", "imgWidths": "50"})
+        if qf.STOCK_STORY in fields:
+            params["topPickThisMonth"] = "true"
+        return params
+
+    async def get_quote(self, symbols: list[str], fields: list[str] = None, formatted: bool = True,
+                        records: bool = False):
+        """
+        Get quotes
+
+        Args:
+            symbols (list[str]): Symbols to quote
+            fields (list[str]): Fields to request (default: every QouteFields field)
+            formatted (bool): Ask for formatted values, False returns plain numbers (smaller payload)
+            records (bool): Return compact QuoteRecords with only the requested fields instead of the JSON
+
+        Returns:
+            dict | list: The quote response, or a list of records when records=True
+        """
+        response = await self.make_request(
+            "GET", self.QUOTE_URL, self.build_quote_params(symbols, fields, formatted), with_crumb=True
+        )
+        if records:
+            return parse_quote_records(response, fields or ALL_QUOTE_FIELDS)
+        return response
+
+    async def get_market_summary(self):
+        url = "https://query1.finance.yahoo.com/v6/finance/quote/marketSummary"
+
+        params = {
             "fields": f"{qf.SHORT_NAME},{qf.REGULAR_MARKET_PRICE},{qf.REGULAR_MARKET_CHANGE},{qf.REGULAR_MARKET_CHANGE_PERCENT},{qf.PRE_MARKET_PRICE},{qf.PRE_MARKET_CHANGE},{qf.PRE_MARKET_CHANGE_PERCENT},{qf.POST_MARKET_PRICE},{qf.POST_MARKET_CHANGE},{qf.POST_MARKET_CHANGE_PERCENT}",
             "formatted": "true",
             "lang": "en-US",
             "region": "US",
-            "market": "US",
-            "crumb": "X7OMi/Fe4nm"
+            "market": "US"
         }
+        return await self.make_request("GET", url, params, with_crumb=True)
 
-        return self.make_request()
+    async def close(self):
+        await self.http_session.close()
+
+
+class YfRequests:
+    """
+    Synchronous wrapper around AsyncYfRequests for scripts.
+    Do not use it inside the bot's event loop - use AsyncYfRequests instead.
+    """
+
+    def __init__(self):
+        self.headers = headers
+
+    def _run(self, method_name: str, *args, **kwargs):
+        async def runner():
+            # private session, it is bound to the loop created by asyncio.run
+            client = AsyncYfRequests(PooledHttpSession("yahoo-sync", proxy_pool=get_proxy_pool(), use_cookie_jar=False))
+            try:
+                return await getattr(client, method_name)(*args, **kwargs)
+            finally:
+                await client.close()
+        return asyncio.run(runner())
+
+    def get_market_time(self):
+        return self._run("get_market_time")
+
+    def get_trending_us(self):
+        return self._run("get_trending_us")
+
+    def get_spark(self, symbols: list[str], interval: str = "1d", range: str = "1mo"):
+        return self._run("get_spark", symbols, interval=interval, range=range)
+
+    def get_quote(self, symbols: list[str], fields: list[str] = None, formatted: bool = True, records: bool = False):
+        return self._run("get_quote", symbols, fields=fields, formatted=formatted, records=records)
+
+    def get_market_summary(self):
+        return self._run("get_market_summary")
 
 
 if __name__ == "__main__":
@@ -113,8 +182,13 @@ if __name__ == "__main__":
     app_timezone = convert_to_my_timezone(time)
     print(app_timezone)
 
+    # fetch several endpoints concurrently over the same pooled session
+    async def fetch_concurrently():
+        ayfr = AsyncYfRequests()
+        try:
+            return await asyncio.gather(ayfr.get_market_summary(), ayfr.get_market_time(), ayfr.get_trending_us())
+        finally:
+            await ayfr.close()
 
-
-
-
-
+    summary, market_time, trending = asyncio.run(fetch_concurrently())
+    print(len(summary["marketSummaryResponse"]["result"]), len(trending["finance"]["result"][0]["quotes"]))
@@ -0,0 +1,224 @@
+import asyncio
+import time
+from utils.http_session import PooledHttpSession
+from utils.logger import logger
+from utils import json_codec
+from utils.read_write import read_json_file, write_json_file
+
+
+CRUMB_URL = "https://query1.finance.yahoo.com/v1/test/getcrumb"
+# sets a fresh A3 consent cookie when the saved cookies are missing or expired
+COOKIE_BOOTSTRAP_URL = "https://fc.yahoo.com"
+AUTH_FAILURE_STATUSES = (401, 403)
+# the crumb and cookies are tied to the exit IP, keep every Yahoo call on one proxy exit
+YAHOO_STICKY_KEY = "yahoo-session"
+
+
+def load_cookie_file(file_path: str = "cookies.json") -> dict:
+    """
+    Load a browser cookie export, skipping expired cookies
+
+    Args:
+        file_path (str): Path of the export (a list of {name, value, domain, expirationDate, ...})
+
+    Returns:
+        dict: {name: cookie} of the cookies that are still valid
+    """
+    exported = read_json_file(file_path) or []
+    now = time.time()
+    cookies = {}
+    for cookie in exported:
+        expires = cookie.get("expirationDate")
+        if expires and expires < now:
+            logger.debug(f"Skipping expired Yahoo cookie {cookie.get('name')}")
+            continue
+        cookies[cookie["name"]] = cookie
+    return cookies
+
+
+class YahooSession:
+    """
+    Owns the Yahoo cookies and crumb shared by every Yahoo call.
+
+    Cookies are loaded from the browser export (cookies.json) and kept up to date
+    from Set-Cookie responses. The crumb is fetched from /v1/test/getcrumb and
+    refreshed when it gets old or when Yahoo answers 401/403, so a cookie rotation
+    doesn't need a code change or redeploy. Behind a proxy pool every request uses
+    the same sticky exit, the IP the crumb and cookies were issued to.
+    """
+
+    def __init__(self, cookies_file: str = "cookies.json", crumb_max_age: float = 6 * 3600, save_cookies: bool = True):
+        """
+        Initialize the session manager.
+
+        Args:
+            cookies_file (str): Browser cookie export to load (and update)
+            crumb_max_age (float): Seconds after which the crumb is refreshed
+            save_cookies (bool): Write refreshed cookies back to cookies_file
+        """
+        self.cookies_file = cookies_file
+        self.crumb_max_age = crumb_max_age
+        self.save_cookies = save_cookies
+        self.cookies = load_cookie_file(cookies_file)
+        self.crumb = None
+        self.crumb_fetched_at = 0.0
+        # cookies changed since they were last written to cookies_file
+        self._cookies_dirty = False
+        self._lock = None
+        self._lock_loop = None
+        self.stats = {"crumb_refreshes": 0, "auth_failures": 0, "cookie_updates": 0}
+        logger.debug(f"Loaded {len(self.cookies)} Yahoo cookies from {cookies_file}")
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def cookie_header(self) -> str:
+        return "; ".join(f"{name}={cookie['value']}" for name, cookie in self.cookies.items())
+
+    def update_cookies(self, response):
+        """Keep the cookies a response sets (written to the file by save_cookies_file())"""
+        changed = [(name, morsel) for name, morsel in response.cookies.items()
+                   if self.cookies.get(name, {}).get("value") != morsel.value]
+        if not changed:
+            return
+        for name, morsel in changed:
+            max_age = morsel.get("max-age")
+            self.cookies[name] = dict(
+                self.cookies.get(name, {}),
+                name=name,
+                value=morsel.value,
+                domain=morsel.get("domain") or ".yahoo.com",
+                path=morsel.get("path") or "/",
+                expirationDate=time.time() + int(max_age) if max_age and max_age.isdigit() else None,
+            )
+        self.stats["cookie_updates"] += 1
+        self._cookies_dirty = self.save_cookies
+
+    async def save_cookies_file(self):
+        """Write the changed cookies back to cookies_file, once per request and off the event loop"""
+        if not self._cookies_dirty:
+            return
+        self._cookies_dirty = False
+        await asyncio.to_thread(write_json_file, self.cookies_file, list(self.cookies.values()))
+
+    def invalidate_crumb(self):
+        self.crumb = None
+
+    async def _fetch_crumb(self, http_session: PooledHttpSession, headers: dict) -> str:
+        async with http_session.request(
+            "GET", CRUMB_URL, headers=dict(headers, Cookie=self.cookie_header()), sticky_key=YAHOO_STICKY_KEY
+        ) as response:
+            self.update_cookies(response)
+            crumb = (await response.text()).strip()
+            if response.status in AUTH_FAILURE_STATUSES or not crumb or "<" in crumb:
+                return None
+            return crumb
+
+    async def _bootstrap_cookies(self, http_session: PooledHttpSession, headers: dict):
+        logger.info("🍪 Yahoo cookies rejected, requesting fresh ones")
+        try:
+            async with http_session.request(
+                "GET", COOKIE_BOOTSTRAP_URL, headers=dict(headers, Cookie=self.cookie_header()), allow_redirects=False,
+                sticky_key=YAHOO_STICKY_KEY
+            ) as response:
+                self.update_cookies(response)
+        except Exception as e:
+            logger.error(f"❌ Error requesting Yahoo cookies: {e}")
+
+    async def get_crumb(self, http_session: PooledHttpSession, headers: dict, force: bool = False) -> str:
+        """
+        Get the crumb, fetching a new one if it is missing, old or force is set
+
+        Concurrent callers share one refresh.
+        """
+        if not force and self.crumb and time.monotonic() - self.crumb_fetched_at < self.crumb_max_age:
+            return self.crumb
+
+        stale_crumb = self.crumb
+        async with self._get_lock():
+            # another caller refreshed it while we waited
+            if self.crumb and self.crumb != stale_crumb:
+                return self.crumb
+
+            crumb = await self._fetch_crumb(http_session, headers)
+            if crumb is None:
+                await self._bootstrap_cookies(http_session, headers)
+                crumb = await self._fetch_crumb(http_session, headers)
+            if crumb is None:
+                raise RuntimeError("Could not get a Yahoo crumb, cookies.json needs a fresh export")
+
+            self.crumb = crumb
+            self.crumb_fetched_at = time.monotonic()
+            self.stats["crumb_refreshes"] += 1
+            logger.info("🍪 Refreshed Yahoo crumb")
+            await self.save_cookies_file()
+            return crumb
+
+    async def request_json(self, http_session: PooledHttpSession, method: str, url: str, params: dict = None,
+                           headers: dict = None, with_crumb: bool = False, **kwargs):
+        """
+        Send a Yahoo request with the shared cookies (and crumb), retrying once on 401/403
+
+        Args:
+            http_session (PooledHttpSession): Session to send the request with
+            method (str): HTTP method
+            url (str): Request url
+            params (dict): Query parameters
+            headers (dict): Request headers (the Cookie header is added)
+            with_crumb (bool): Add the crumb query parameter
+            **kwargs: Other request arguments (data, ...)
+
+        Returns:
+            The parsed json response
+        """
+        headers = headers or {}
+        for attempt in range(2):
+            request_params = dict(params or {})
+            if with_crumb:
+                request_params["crumb"] = await self.get_crumb(http_session, headers, force=attempt > 0)
+
+            async with http_session.request(
+                method, url, headers=dict(headers, Cookie=self.cookie_header()), params=request_params,
+                sticky_key=YAHOO_STICKY_KEY, **kwargs
+            ) as response:
+                self.update_cookies(response)
+                if response.status in AUTH_FAILURE_STATUSES and attempt == 0:
+                    self.stats["auth_failures"] += 1
+                    logger.warning(f"⚠️ Yahoo answered {response.status}, refreshing crumb and cookies")
+                    self.invalidate_crumb()
+                    if not with_crumb:
+                        await self._bootstrap_cookies(http_session, headers)
+                    continue
+                response.raise_for_status()
+                body = await response.read()
+            await self.save_cookies_file()
+            return json_codec.loads(body) if body.strip() else None
+
+    def get_stats(self) -> dict:
+        return dict(
+            self.stats,
+            cookies=len(self.cookies),
+            has_crumb=self.crumb is not None,
+            crumb_age=round(time.monotonic() - self.crumb_fetched_at, 1) if self.crumb else None,
+        )
+
+
+# Global Yahoo session instance
+_yf_session = None
+
+
+def get_yf_session():
+    """
+    Get or create the global Yahoo session manager
+
+    Returns:
+        YahooSession: Global Yahoo session manager
+    """
+    global _yf_session
+    if _yf_session is None:
+        _yf_session = YahooSession()
+    return _yf_session